@@ -0,0 +1,113 @@
+"""
+Reports what importing each handler module costs, which Lambda pays on every
+cold start. Run with ``python -m sneks.backend.handlers.importtime``.
+"""
+
+import re
+import subprocess
+import sys
+from collections import namedtuple
+
+HANDLER_MODULES = [
+    "sneks.backend.handlers.notifier",
+    "sneks.backend.handlers.processor",
+    "sneks.backend.handlers.recorder",
+    "sneks.backend.handlers.validator",
+]
+# Only imported once they're used, since they're slow to import, and only
+# installed in the images of the handlers that use them
+HEAVY_MODULES = ["moviepy", "numpy", "pygame", "pytest", "torch"]
+# Most modules a handler may import, with room for about a fifth more than
+# the heaviest handler imports now. Most of them come from boto3.
+MODULE_BUDGET = 550
+# Most milliseconds importing a handler may take. Far more than it takes
+# locally, to only catch regressions like a heavy module coming back.
+TIME_BUDGET = 1500
+
+ImportTime = namedtuple("ImportTime", ["module", "own", "cumulative", "depth"])
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def main() -> None:
+    for module in HANDLER_MODULES:
+        times = measure(module)
+        print(f"{module}: {get_total(times) / 1000:.1f}ms, {len(times)} modules")
+        for problem in check(times):
+            print(f"  {problem}")
+        for time in sorted(times, key=lambda t: t.cumulative, reverse=True)[:10]:
+            print(f"  {time.cumulative / 1000:8.1f}ms  {time.module}")
+
+
+def measure(module: str) -> list[ImportTime]:
+    """
+    Imports the module in a new interpreter, so nothing is already imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse(result.stderr)
+
+
+def parse(output: str) -> list[ImportTime]:
+    """
+    Parses the ``-X importtime`` report, where times are in microseconds and
+    nested imports are indented, like::
+
+        import time: self [us] | cumulative | imported package
+        import time:       115 |        115 |   _io
+    """
+    times = []
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match is not None:
+            own, cumulative, indent, module = match.groups()
+            times.append(
+                ImportTime(
+                    module=module,
+                    own=int(own),
+                    cumulative=int(cumulative),
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+    return times
+
+
+def get_total(times: list[ImportTime]) -> int:
+    return sum(time.cumulative for time in times if time.depth == 0)
+
+
+def check(times: list[ImportTime]) -> list[str]:
+    """
+    :return: a description of each way the import went over budget
+    """
+    problems = []
+    heavy = get_heavy(times)
+    if heavy:
+        problems.append(f"heavy modules imported: {', '.join(heavy)}")
+    if len(times) > MODULE_BUDGET:
+        problems.append(f"{len(times)} modules imported, over {MODULE_BUDGET}")
+    if get_total(times) / 1000 > TIME_BUDGET:
+        problems.append(f"{get_total(times) / 1000:.1f}ms, over {TIME_BUDGET}ms")
+    return problems
+
+
+def get_heavy(times: list[ImportTime]) -> list[str]:
+    """
+    :return: the heavy modules that were imported
+    """
+    return sorted(
+        {
+            heavy
+            for time in times
+            for heavy in HEAVY_MODULES
+            if time.module == heavy or time.module.startswith(f"{heavy}.")
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
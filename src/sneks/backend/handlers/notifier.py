@@ -0,0 +1,6 @@
+from sneks.backend import notifier
+
+
+def send_notification(event: dict, context):
+    print(event)
+    notifier.send(event)
@@ -0,0 +1,119 @@
+import itertools
+from typing import Any
+
+from sneks.backend import processor
+
+
+def start_processing(event: dict, context):
+    print(event)
+    processor.start()
+
+
+def pre_process(event: dict, context) -> dict[Any, list[dict[str, str]]]:
+    print(event)
+    bucket = event["bucket"]
+    return processor.pre(bucket_name=bucket)
+
+
+def plan_process(event: dict, context) -> dict[Any, Any]:
+    print(event)
+    plan = processor.plan(
+        bucket_name=event["submission_bucket"],
+        target_games=event.get("target_games"),
+        recordings=event.get("recordings"),
+        adaptive=event.get("adaptive", False),
+        ratings_bucket_name=event.get("ratings_bucket"),
+    )
+    return dict(plan, result=[])
+
+
+def settle_process(event: dict, context) -> dict[Any, Any]:
+    print(event)
+    plan = processor.settle(
+        shard_bucket_name=event["shard_bucket"],
+        shard_prefix=event["shard_prefix"],
+        seed=event["seed"],
+        target_games=event["target_games"],
+        max_games=event["max_games"],
+    )
+    # Carries the results of every round along to post processing
+    return dict(plan, result=event["result"] + event["round"])
+
+
+def process(event, context) -> dict[Any, Any]:
+    print(event)
+    submission_bucket_name = event.get("submission_bucket")
+    shard_bucket_name = event.get("shard_bucket")
+    videos, scores, runs = processor.run(
+        submission_bucket_name=submission_bucket_name,
+        runs=event.get("runs", 1),
+        seed=event.get("seed"),
+        seeds=event.get("seeds"),
+        submissions=event.get("submissions"),
+        max_runs=event.get("max_runs"),
+        results_bucket_name=event.get("results_bucket"),
+    )
+    result = dict(
+        videos=videos,
+        scores=scores,
+        runs=[dict(seed=run.seed, scores=run.scores) for run in runs],
+        proceed=True,
+    )
+    if shard_bucket_name is not None:
+        # Keep the scores out of the state machine payload
+        result.update(
+            scores=[],
+            runs=[],
+            shard=processor.save_runs(
+                bucket_name=shard_bucket_name,
+                prefix=event["shard_prefix"],
+                runs=runs,
+            ),
+        )
+    return result
+
+
+def post_process(event: dict, context):
+    print(event)
+    distribution_id = event["distribution_id"]
+    static_site_bucket_name = event["static_site_bucket"]
+    result = event["result"]
+    proceed = all(run.get("proceed") for run in result)
+    if not proceed:
+        print("nothing to post process")
+        return
+    processor.post(
+        videos=list(itertools.chain.from_iterable(run.get("videos") for run in result)),
+        scores=list(itertools.chain.from_iterable(run.get("scores") for run in result)),
+        distribution_id=distribution_id,
+        static_site_bucket_name=static_site_bucket_name,
+        shard_bucket_name=event.get("shard_bucket"),
+        shard_prefix=event.get("shard_prefix"),
+        ratings_bucket_name=event.get("ratings_bucket"),
+        submission_bucket_name=event.get("submission_bucket"),
+    )
+
+
+def post_process_save(event: dict, context):
+    print(event)
+    video_bucket_name = event["video_bucket"]
+    static_site_bucket_name = event["static_site_bucket"]
+    result = event["result"]
+    proceed: bool = all(run.get("proceed") for run in result)
+    videos: list[str] = list(
+        itertools.chain.from_iterable(run.get("videos") for run in result)
+    )
+    scores: list[dict] = list(
+        itertools.chain.from_iterable(run.get("scores") for run in result)
+    )
+    if proceed:
+        processor.post_save(
+            video_bucket_name=video_bucket_name,
+            static_site_bucket_name=static_site_bucket_name,
+            videos=list(
+                itertools.chain.from_iterable(
+                    run.get("videos") for run in result if not run.get("published")
+                )
+            ),
+        )
+    return dict(videos=videos, scores=scores, proceed=proceed)
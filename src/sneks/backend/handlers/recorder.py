@@ -0,0 +1,22 @@
+import random
+from typing import Any
+
+from sneks.backend import processor
+
+
+def record(event, context) -> dict[Any, Any]:
+    print(event)
+    # Seed random to prevent uuid4 collisions due to lambda optimizations?
+    random.seed(context.aws_request_id)
+    submission_bucket_name = event.get("submission_bucket")
+    video_bucket_name = event.get("video_bucket")
+    static_site_bucket_name = event.get("static_site_bucket")
+    videos, scores = processor.record(
+        submission_bucket_name=submission_bucket_name,
+        video_bucket_name=video_bucket_name,
+        static_site_bucket_name=static_site_bucket_name,
+    )
+    # Published videos already live in the static site bucket
+    published = static_site_bucket_name is not None
+    result = dict(videos=videos, scores=scores, proceed=True, published=published)
+    return result
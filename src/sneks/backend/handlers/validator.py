@@ -0,0 +1,21 @@
+from sneks.backend import validator
+
+
+def validate(event: dict, context):
+    print(event)
+    bucket = event["bucket"]
+    prefix = event["prefix"]
+    validator.run(bucket_name=bucket, prefix=prefix)
+    return event
+
+
+def post_validate(event: dict, context) -> bool:
+    print(event)
+    bucket = event["bucket"]
+    prefix = event["prefix"]
+    success: bool = "error" not in event
+    return validator.post(bucket_name=bucket, prefix=prefix, success=success)
+
+
+def post_validate_reduce(event: dict, context) -> bool:
+    return any(event)
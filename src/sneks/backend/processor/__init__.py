@@ -1,23 +1,21 @@
+import itertools
 import json
 import os
 import pathlib
 import typing
+from collections.abc import Iterable
 
 import boto3
-import botocore.exceptions
 
-from sneks.backend.processor import runner
-from sneks.backend.processor.runner import Score
+from sneks.backend import storage
+from sneks.backend.processor import planner, ratings, results, runner, shards
+from sneks.backend.processor.scores import RunScores, Score
+from sneks.backend.processor.statistics import ScoreStatistics
+from sneks.backend.storage import move, publish
 
 if typing.TYPE_CHECKING:
-    from mypy_boto3_s3 import S3ServiceResource
-    from mypy_boto3_s3.service_resource import Bucket, BucketObjectsCollection
     from mypy_boto3_stepfunctions import SFNClient
 else:
-    S3Client = object
-    S3ServiceResource = object
-    Bucket = object
-    BucketObjectsCollection = object
     SFNClient = object
 
 
@@ -30,18 +28,23 @@ def start() -> None:
 
 
 def pre(bucket_name: str) -> dict[str, list[dict[str, str]]]:
-    s3: S3ServiceResource = boto3.resource("s3")
-    bucket: Bucket = s3.Bucket(bucket_name)
-    objects: BucketObjectsCollection = bucket.objects.filter(Prefix="private/")
-    users = set()
-    for obj in objects:
-        key = obj.key
-        new_key = key.replace("private", "processing", 1)
-        # Move the new files to a processing area
-        print(f"moving {key} to {new_key}")
-        bucket.Object(new_key).copy(CopySource=dict(Bucket=bucket.name, Key=key))
-        obj.delete()
-        users.add(pathlib.PurePosixPath(new_key).parts[1])
+    objects = storage.list_objects(bucket_name=bucket_name, prefix="private/")
+    # Move the new files to a processing area
+    result = move.move(
+        bucket_name=bucket_name,
+        keys=[obj["Key"] for obj in objects],
+        rename=lambda key: key.replace("private", "processing", 1),
+    )
+    for key, new_key in result.moved.items():
+        print(f"moved {key} to {new_key}")
+    for key, error in result.failed.items():
+        # Left in place to be picked up by the next execution
+        print(f"failed to move {key}: {error}")
+    # A partly moved submission waits to be staged whole by the next execution
+    failed_users = {pathlib.PurePosixPath(key).parts[1] for key in result.failed}
+    users = {
+        pathlib.PurePosixPath(new_key).parts[1] for new_key in result.moved.values()
+    } - failed_users
     return dict(
         staged=[
             {"prefix": f"processing/{user}/", "bucket": bucket_name} for user in users
@@ -49,51 +52,181 @@ def pre(bucket_name: str) -> dict[str, list[dict[str, str]]]:
     )
 
 
-def run(submission_bucket_name: str) -> tuple[list[dict], list[Score]]:
+def plan(
+    bucket_name: str,
+    target_games: int | None = None,
+    recordings: int | None = None,
+    adaptive: bool = False,
+    ratings_bucket_name: str | None = None,
+) -> dict:
+    names = {
+        runner.get_submission_name(obj["Key"])
+        for obj in runner.get_latest_objects(bucket_name=bucket_name)
+    }
+    recordings = planner.DEFAULT_RECORDINGS if recordings is None else recordings
+    seed = results.get_seed(names)
+    if ratings_bucket_name is not None:
+        stored = ratings.load(bucket_name=ratings_bucket_name)
+        groups = ratings.get_groups(names=names, ratings=stored)
+        unrated = sum(name not in stored for name in names)
+        # Only worth rating incrementally while most of the field is established
+        if stored and unrated <= len(names) // 2:
+            print(f"rating {unrated} new submissions in {len(groups)} groups")
+            return planner.get_group_plan(
+                groups=groups, recordings=recordings, seed=seed
+            )
+    return planner.get_plan(
+        submission_count=len(names),
+        target_games=(
+            planner.DEFAULT_TARGET_GAMES if target_games is None else target_games
+        ),
+        recordings=recordings,
+        seed=seed,
+        adaptive=adaptive,
+    )
+
+
+def settle(
+    shard_bucket_name: str,
+    shard_prefix: str,
+    seed: int,
+    target_games: int,
+    max_games: int,
+) -> dict:
+    """
+    Decides from the runs of every round so far whether the ranking has
+    settled, by separating each submission from the next or by staying the same
+    through the latest round. When it hasn't, another round of games is planned
+    for the whole field, as long as the plan's ``max_games`` allows.
+
+    :param seed: the first seed of the latest round, which later rounds follow
+    :return: the plan of the next round, without items once it's settled
+    """
+    aggregation = ScoreStatistics()
+    latest: list[RunScores] = []
+    played = 0
+    next_seed = seed
+    for run in shards.read_runs(bucket_name=shard_bucket_name, prefix=shard_prefix):
+        played += 1
+        if run.seed is not None and run.seed >= seed:
+            latest.append(run)
+            next_seed = max(next_seed, run.seed + 1)
+        else:
+            aggregation.add_all(run.scores)
+    aggregation.update_ranking()
+    for run in latest:
+        aggregation.add_all(run.scores)
+    aggregation.update_ranking()
+
+    remaining = max_games - played
+    if remaining <= 0 or aggregation.is_settled(stable_updates=1):
+        print(f"settled after {played} runs")
+        plan: dict = dict(items=[], max_concurrency=0)
+    else:
+        print(f"unsettled after {played} runs, planning more")
+        plan = planner.get_plan(
+            submission_count=len(aggregation.totals),
+            target_games=min(target_games, remaining),
+            recordings=0,
+            seed=next_seed,
+        )
+    return dict(plan, seed=next_seed, target_games=target_games, max_games=max_games)
+
+
+def run(
+    submission_bucket_name: str,
+    runs: int = 1,
+    seed: int | None = None,
+    seeds: list[int] | None = None,
+    submissions: list[str] | None = None,
+    max_runs: int | None = None,
+    results_bucket_name: str | None = None,
+) -> tuple[list[dict], list[Score], list[RunScores]]:
     return runner.run(
         submission_bucket_name=submission_bucket_name,
+        runs=runs,
+        seed=seed,
+        seeds=seeds,
+        submissions=submissions,
+        max_runs=max_runs,
+        results_bucket_name=results_bucket_name,
     )
 
 
 def record(
-    submission_bucket_name: str, video_bucket_name: str
+    submission_bucket_name: str,
+    video_bucket_name: str,
+    static_site_bucket_name: str | None = None,
 ) -> tuple[list[str], list[Score]]:
     return runner.record(
         submission_bucket_name=submission_bucket_name,
         video_bucket_name=video_bucket_name,
+        static_site_bucket_name=static_site_bucket_name,
     )
 
 
+def save_runs(bucket_name: str, prefix: str, runs: list[RunScores]) -> str:
+    return shards.write(bucket_name=bucket_name, prefix=prefix, runs=runs)
+
+
 def post(
     videos: list[str],
     scores: list[dict],
     distribution_id: str,
     static_site_bucket_name: str,
+    shard_bucket_name: str | None = None,
+    shard_prefix: str | None = None,
+    ratings_bucket_name: str | None = None,
+    submission_bucket_name: str | None = None,
 ) -> None:
-    built_scores: list[Score] = [Score(**score) for score in scores]
+    built_scores: Iterable[Score] = (Score(**score) for score in scores)
+    published_ratings: dict[str, float] | None = None
+    if ratings_bucket_name is not None and shard_bucket_name and shard_prefix:
+        # The leaderboard comes from the ratings, which cover the whole field
+        # even when only some of it played this cycle
+        stored = ratings.load(bucket_name=ratings_bucket_name)
+        if submission_bucket_name is not None:
+            ratings.retain(
+                stored,
+                names=(
+                    runner.get_submission_name(obj["Key"])
+                    for obj in runner.get_latest_objects(
+                        bucket_name=submission_bucket_name
+                    )
+                ),
+            )
+        ratings.update_all(
+            stored,
+            (
+                run.scores
+                for run in shards.read_runs(
+                    bucket_name=shard_bucket_name, prefix=shard_prefix
+                )
+            ),
+        )
+        ratings.save(stored, bucket_name=ratings_bucket_name)
+        leaderboard = ratings.get_scores(stored)
+        published_ratings = {name: rating.rating for name, rating in stored.items()}
+    else:
+        if shard_bucket_name is not None and shard_prefix is not None:
+            built_scores = itertools.chain(
+                built_scores,
+                shards.read_scores(bucket_name=shard_bucket_name, prefix=shard_prefix),
+            )
+        leaderboard = runner.aggregate_scores(built_scores)
     runner.save_manifest(
         video_names=videos,
-        scores=runner.aggregate_scores(built_scores),
+        scores=leaderboard,
         distribution_id=distribution_id,
         static_site_bucket_name=static_site_bucket_name,
+        ratings=published_ratings,
     )
 
 
 def post_save(video_bucket_name: str, static_site_bucket_name: str, videos: list[str]):
-    s3: S3ServiceResource = boto3.resource("s3")
-    bucket: Bucket = s3.Bucket(static_site_bucket_name)
-    for video in videos:
-        key = f"games/{video}"
-        # check if object exists
-        try:
-            bucket.Object(key).load()
-        except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                pass
-            else:
-                raise
-        else:
-            raise Exception(f"trying to overwrite existing file: {video}")
-
-        # TODO: validate mp4
-        bucket.copy(CopySource={"Bucket": video_bucket_name, "Key": key}, Key=key)
+    # TODO: validate mp4
+    publish.copy(
+        source_bucket_name=video_bucket_name,
+        bucket_name=static_site_bucket_name,
+        keys=[f"games/{video}" for video in videos],
+    )
@@ -0,0 +1,81 @@
+import json
+import os
+import time
+
+from sneks.engine.engine.telemetry import Histogram, Telemetry
+
+NAMESPACE = "Sneks"
+# CloudWatch accepts at most this many distinct values for a metric in one log
+MAX_VALUES = 100
+
+
+def emit(telemetry: Telemetry, seed: int | None) -> None:
+    """
+    Prints the telemetry of a game as a log line in CloudWatch embedded metric
+    format, which CloudWatch turns into metrics when it's logged from Lambda.
+    """
+    print(json.dumps(get_log(telemetry, seed), separators=(",", ":")))
+
+
+def get_log(telemetry: Telemetry, seed: int | None, timestamp: int | None = None):
+    if timestamp is None:
+        timestamp = int(time.time() * 1000)
+    metrics = [
+        ("StepLatency", "Microseconds"),
+        ("DecisionLatency", "Microseconds"),
+        ("Steps", "Count"),
+        ("ActiveSnakes", "Count"),
+        ("EndedSnakes", "Count"),
+    ]
+    return {
+        "_aws": {
+            "Timestamp": timestamp,
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": NAMESPACE,
+                    "Dimensions": [["Function"]],
+                    "Metrics": [{"Name": name, "Unit": unit} for name, unit in metrics],
+                }
+            ],
+        },
+        "Function": os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "local"),
+        "StepLatency": get_values(telemetry.steps),
+        "DecisionLatency": get_values(telemetry.decisions),
+        "Steps": telemetry.steps.count,
+        "ActiveSnakes": telemetry.active[-1] if telemetry.active else 0,
+        "EndedSnakes": telemetry.ended[-1] if telemetry.ended else 0,
+        # Properties are kept with the log line for queries, but aren't metrics
+        "seed": seed,
+        "decisionPercentiles": get_percentiles(telemetry.decisions),
+        "stepPercentiles": get_percentiles(telemetry.steps),
+        "activePerStep": telemetry.active,
+        "endedPerStep": telemetry.ended,
+    }
+
+
+def get_values(histogram: Histogram) -> dict[str, list[float]]:
+    """
+    Converts the buckets to microsecond values and their counts, merging
+    neighboring buckets when there are more than CloudWatch accepts.
+    """
+    buckets = histogram.get_buckets()
+    size = -(-len(buckets) // MAX_VALUES)
+    values: list[float] = []
+    counts: list[float] = []
+    for i in range(0, len(buckets), size):
+        group = buckets[i : i + size]
+        count = sum(c for _, c in group)
+        values.append(sum(v * c for v, c in group) / count / 1000)
+        counts.append(count)
+    return {"Values": values, "Counts": counts}
+
+
+def get_percentiles(histogram: Histogram) -> dict[str, float]:
+    """
+    :return: microseconds at the usual percentiles
+    """
+    percentiles = {
+        f"p{p}": histogram.get_percentile(p) / 1000 for p in (50, 90, 99, 99.9)
+    }
+    percentiles["max"] = histogram.maximum / 1000
+    return percentiles
@@ -0,0 +1,111 @@
+import math
+import random
+
+DEFAULT_TARGET_GAMES = 20
+DEFAULT_RECORDINGS = 20
+MAX_CONCURRENCY = 40
+# Approximate number of snakes, summed over all of its games, that a single
+# processor invocation can simulate comfortably within its timeout
+SNAKES_PER_INVOCATION = 100
+# Games played by each group when rating new submissions
+DEFAULT_GAMES_PER_GROUP = 10
+# Most games an adaptive plan plays, as a multiple of its target
+ADAPTIVE_BUDGET = 3
+
+
+def get_plan(
+    submission_count: int,
+    target_games: int = DEFAULT_TARGET_GAMES,
+    recordings: int = DEFAULT_RECORDINGS,
+    seed: int | None = None,
+    snakes_per_submission: int = 1,
+    adaptive: bool = False,
+) -> dict:
+    """
+    Splits the target number of games into work items for the processing map.
+    Small fields are batched into fewer invocations to avoid paying for cold
+    starts, while large fields are spread out up to the concurrency limit.
+
+    Each item carries the number of games to run, the first seed of its seed
+    range, an optional subset of submissions, and whether to record a game.
+    When adaptive, items play their share of the target and keep going while
+    their own games are close, up to ``ADAPTIVE_BUDGET`` times their share or
+    what an invocation fits. The plan's ``max_games`` leaves room for further
+    rounds, which are planned until the merged ranking settles.
+    """
+    snakes = max(submission_count * snakes_per_submission, 1)
+    games_per_invocation = max(SNAKES_PER_INVOCATION // snakes, 1)
+    invocations = min(math.ceil(target_games / games_per_invocation), MAX_CONCURRENCY)
+    recordings = min(recordings, MAX_CONCURRENCY)
+
+    if seed is None:
+        seed = random.randrange(2**31)
+
+    # Spread the games evenly, giving the remainder to the first invocations
+    base, remainder = divmod(target_games, invocations) if invocations else (0, 0)
+    items = []
+    first_seed = seed
+    for i in range(max(invocations, recordings)):
+        runs = base + (1 if i < remainder else 0) if i < invocations else 0
+        max_runs = runs
+        if adaptive and runs:
+            max_runs = max(runs, min(runs * ADAPTIVE_BUDGET, games_per_invocation))
+        items.append(
+            dict(
+                runs=runs,
+                max_runs=max_runs,
+                seed=seed,
+                submissions=None,
+                record=i < recordings,
+            )
+        )
+        seed += max_runs
+
+    return dict(
+        items=items,
+        max_concurrency=len(items),
+        seed=first_seed,
+        target_games=target_games,
+        max_games=target_games * ADAPTIVE_BUDGET if adaptive else target_games,
+    )
+
+
+def get_group_plan(
+    groups: list[list[str]],
+    games_per_group: int = DEFAULT_GAMES_PER_GROUP,
+    recordings: int = DEFAULT_RECORDINGS,
+    seed: int | None = None,
+) -> dict:
+    """
+    Plans games for subsets of the submissions, one item per group. Groups that
+    don't fit within the concurrency limit are left for a following cycle.
+    """
+    groups = groups[:MAX_CONCURRENCY]
+    recordings = min(recordings, MAX_CONCURRENCY)
+
+    if seed is None:
+        seed = random.randrange(2**31)
+
+    items = []
+    first_seed = seed
+    for i in range(max(len(groups), recordings)):
+        runs = games_per_group if i < len(groups) else 0
+        items.append(
+            dict(
+                runs=runs,
+                max_runs=runs,
+                seed=seed,
+                submissions=groups[i] if i < len(groups) else None,
+                record=i < recordings,
+            )
+        )
+        seed += runs
+
+    games = len(groups) * games_per_group
+    return dict(
+        items=items,
+        max_concurrency=len(items),
+        seed=first_seed,
+        target_games=games,
+        max_games=games,
+    )
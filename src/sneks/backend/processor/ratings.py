@@ -0,0 +1,193 @@
+import json
+import pathlib
+from collections import namedtuple
+from collections.abc import Iterable
+
+from botocore.exceptions import ClientError
+
+from sneks.backend import storage
+from sneks.backend.processor.scores import Score
+
+RATINGS_KEY = "games/ratings.json"
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+# Rating difference at which the higher rated submission is expected to beat
+# the lower one ten times as often
+SCALE = 400.0
+# Size of the games played to rate new submissions
+GROUP_SIZE = 8
+
+# Elo rating and the number of games it's based on, along with the running
+# means of the raw scores those games produced for the leaderboard. Normalized
+# scores depend on who else was in each game, so they aren't kept.
+Rating = namedtuple("Rating", ["rating", "games", "age", "ended"])
+
+
+def load(bucket_name: str | None = None, key: str = RATINGS_KEY) -> dict[str, Rating]:
+    """
+    Loads the rating store, either from the bucket or from a local path when no
+    bucket is given. A missing store is empty.
+    """
+    try:
+        if bucket_name is None:
+            body = pathlib.Path(key).read_bytes()
+        else:
+            response = storage.get_s3_client().get_object(Bucket=bucket_name, Key=key)
+            body = response["Body"].read()
+    except FileNotFoundError:
+        return {}
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return {}
+        raise
+    # Stores saved before normalized means were dropped have extra fields
+    return {
+        name: Rating._make(row[: len(Rating._fields)])
+        for name, row in json.loads(body.decode("utf-8"))["ratings"].items()
+    }
+
+
+def save(
+    ratings: dict[str, Rating], bucket_name: str | None = None, key: str = RATINGS_KEY
+) -> None:
+    body = json.dumps(
+        {"ratings": {name: list(rating) for name, rating in ratings.items()}},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if bucket_name is None:
+        path = pathlib.Path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+    else:
+        storage.get_s3_client().put_object(Bucket=bucket_name, Key=key, Body=body)
+
+
+def update(ratings: dict[str, Rating], scores: list[Score]) -> None:
+    """
+    Updates the ratings in place from the scores of a single run. Every pair of
+    participants is treated as a match decided by their total normalized score,
+    with the adjustment split across the other participants of the run.
+    """
+    if not scores:
+        return
+    for score in scores:
+        if score.name not in ratings:
+            supersede(ratings, score.name)
+    current = {
+        score.name: ratings.get(score.name, new_rating()).rating for score in scores
+    }
+    totals = {score.name: score.age1 + score.ended1 for score in scores}
+    k = K_FACTOR / max(len(scores) - 1, 1)
+
+    for score in scores:
+        delta = 0.0
+        for other in scores:
+            if other.name == score.name:
+                continue
+            expected = 1 / (
+                1 + 10 ** ((current[other.name] - current[score.name]) / SCALE)
+            )
+            if totals[score.name] > totals[other.name]:
+                actual = 1.0
+            elif totals[score.name] < totals[other.name]:
+                actual = 0.0
+            else:
+                actual = 0.5
+            delta += actual - expected
+
+        previous = ratings.get(score.name, new_rating())
+        games = previous.games + 1
+        ratings[score.name] = Rating(
+            current[score.name] + k * delta,
+            games,
+            *(
+                mean + (value - mean) / games
+                for mean, value in zip(previous[2:], (score.age, score.ended))
+            ),
+        )
+
+
+def update_all(ratings: dict[str, Rating], runs: Iterable[list[Score]]) -> None:
+    for scores in runs:
+        update(ratings, scores)
+
+
+def supersede(ratings: dict[str, Rating], name: str) -> None:
+    # Names are <user_id>/<timestamp>, so a new name for a user replaces the
+    # rating of their previous submission
+    user = name.split("/")[0]
+    for previous in [n for n in ratings if n.split("/")[0] == user]:
+        del ratings[previous]
+
+
+def retain(ratings: dict[str, Rating], names: Iterable[str]) -> None:
+    """
+    Drops the ratings of submissions that no longer exist, in place.
+    """
+    names = set(names)
+    for name in [name for name in ratings if name not in names]:
+        del ratings[name]
+
+
+def new_rating() -> Rating:
+    return Rating(DEFAULT_RATING, 0, 0.0, 0.0)
+
+
+def get_scores(
+    ratings: dict[str, Rating], names: Iterable[str] | None = None
+) -> list[Score]:
+    """
+    The mean scores of the rated submissions, for the leaderboard. The means
+    are normalized across the submissions listed, like the scores of a game
+    are across its snakes, so they compare with each other.
+    """
+    if names is None:
+        names = ratings
+    rated = [name for name in names if name in ratings and ratings[name].games > 0]
+    if not rated:
+        return []
+    min_age = min(ratings[name].age for name in rated)
+    max_age = max(min_age + 1, max(ratings[name].age for name in rated))
+    min_ended = min(ratings[name].ended for name in rated)
+    max_ended = max(min_ended + 1, max(ratings[name].ended for name in rated))
+    return [
+        Score(
+            name,
+            ratings[name].age,
+            ratings[name].ended,
+            (ratings[name].age - min_age) / (max_age - min_age),
+            (ratings[name].ended - min_ended) / (max_ended - min_ended),
+        )
+        for name in rated
+    ]
+
+
+def get_groups(
+    names: Iterable[str], ratings: dict[str, Rating], group_size: int = GROUP_SIZE
+) -> list[list[str]]:
+    """
+    Groups the unrated submissions with established opponents spread evenly
+    across the rating range, so a few games place them on the ladder.
+
+    :return: the submission names of each group, empty when nothing needs rating
+    """
+    names = sorted(names)
+    unrated = [name for name in names if name not in ratings]
+    established = sorted(
+        (name for name in names if name in ratings),
+        key=lambda name: ratings[name].rating,
+    )
+    if not unrated:
+        return []
+
+    # Fill at least half of each group with established opponents
+    per_group = max(group_size // 2, 1) if established else group_size
+    groups = []
+    for i in range(0, len(unrated), per_group):
+        group = unrated[i : i + per_group]
+        opponents = min(group_size - len(group), len(established))
+        group += [
+            established[j * len(established) // opponents] for j in range(opponents)
+        ]
+        groups.append(group)
+    return groups
@@ -0,0 +1,156 @@
+import dataclasses
+import functools
+import hashlib
+import json
+import pathlib
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from sneks.backend import storage
+from sneks.backend.processor.scores import RunScores, Score
+from sneks.engine.config.instantiation import config
+
+results_root = "/tmp/results"
+RESULTS_PREFIX = "results/"
+MAX_WORKERS = 16
+
+
+def get_fingerprint(registrar_prefix: str) -> str:
+    """
+    Identifies everything that decides the outcome of a seeded run: the content
+    of the participating submissions, the engine source and the game settings.
+    """
+    digest = hashlib.sha256()
+    root = pathlib.Path(registrar_prefix)
+    for path in sorted(p for p in root.glob("**/*") if p.is_file()):
+        digest.update(str(path.relative_to(root)).encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    digest.update(json.dumps(get_settings(), sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_settings() -> dict:
+    return dict(
+        engine=get_engine_digest(),
+        game=dataclasses.asdict(config.game),
+        turn_limit=config.turn_limit,
+        registrar_submission_sneks=config.registrar_submission_sneks,
+    )
+
+
+@functools.cache
+def get_engine_digest() -> str:
+    """
+    Hashes the source of the engine, since the package version isn't bumped
+    for every change that affects how games play out.
+    """
+    digest = hashlib.sha256()
+    root = pathlib.Path(__file__).parents[2] / "engine"
+    for path in sorted(root.glob("**/*.py")):
+        digest.update(str(path.relative_to(root)).encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def get_seed(names: Iterable[str]) -> int:
+    """
+    Derives the first seed of a plan from the submissions and the settings, so
+    planning the same field again plays the same seeds and finds them cached.
+    """
+    digest = hashlib.sha256(
+        json.dumps([sorted(names), get_settings()], sort_keys=True).encode("utf-8")
+    )
+    return to_seed(digest.hexdigest())
+
+
+def to_seed(digest: str) -> int:
+    return int(digest[:8], 16) % 2**31
+
+
+def get_key(fingerprint: str, seed: int) -> str:
+    return f"{RESULTS_PREFIX}{fingerprint}/{seed}.json"
+
+
+def load(
+    fingerprint: str, seeds: Iterable[int], bucket_name: str | None = None
+) -> dict[int, RunScores]:
+    """
+    Loads the cached runs for the seeds, from the bucket or from the local cache
+    when no bucket is given. Seeds without a cached run are left out.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        runs = executor.map(
+            lambda seed: read(get_key(fingerprint, seed), bucket_name), seeds
+        )
+        return {run.seed: run for run in runs if run is not None}
+
+
+def save(
+    fingerprint: str, runs: Iterable[RunScores], bucket_name: str | None = None
+) -> None:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(
+            executor.map(
+                lambda run: write(get_key(fingerprint, run.seed), run, bucket_name),
+                [run for run in runs if run.seed is not None],
+            )
+        )
+
+
+def read(key: str, bucket_name: str | None = None) -> RunScores | None:
+    try:
+        if bucket_name is None:
+            body = (pathlib.Path(results_root) / key).read_bytes()
+        else:
+            response = storage.get_s3_client().get_object(Bucket=bucket_name, Key=key)
+            body = response["Body"].read()
+    except FileNotFoundError:
+        return None
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return None
+        raise
+    run = json.loads(body.decode("utf-8"))
+    return RunScores(
+        seed=run["seed"], scores=[Score._make(row) for row in run["scores"]]
+    )
+
+
+def write(key: str, run: RunScores, bucket_name: str | None = None) -> None:
+    body = json.dumps(
+        {"seed": run.seed, "scores": [list(score) for score in run.scores]},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if bucket_name is None:
+        path = pathlib.Path(results_root) / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_bytes(body)
+        partial.replace(path)
+    else:
+        storage.get_s3_client().put_object(Bucket=bucket_name, Key=key, Body=body)
+
+
+def cached(
+    play: Callable[[list[int]], list[RunScores]],
+    fingerprint: str,
+    bucket_name: str | None = None,
+) -> Callable[[list[int]], list[RunScores]]:
+    """
+    Wraps a function that plays the given seeds so only the seeds without a
+    cached run get played, and newly played runs are added to the cache.
+    """
+
+    def play_cached(seeds: list[int]) -> list[RunScores]:
+        runs = load(fingerprint, seeds, bucket_name=bucket_name)
+        missing = [seed for seed in seeds if seed not in runs]
+        print(f"{len(seeds) - len(missing)} of {len(seeds)} runs cached")
+        if missing:
+            played = play(missing)
+            save(fingerprint, played, bucket_name=bucket_name)
+            runs.update((run.seed, run) for run in played)
+        return [runs[seed] for seed in seeds]
+
+    return play_cached
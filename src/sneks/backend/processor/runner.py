@@ -1,47 +1,92 @@
 import datetime
 import hashlib
+import itertools
 import json
 import operator
-import os
 import pathlib
 import shutil
 import struct
 import typing
-from collections import namedtuple
+from collections.abc import Callable, Iterable
 
 import boto3
 
+from sneks.backend import storage
+from sneks.backend.processor import metrics, results
+from sneks.backend.processor.scores import RunScores, Score
+from sneks.backend.processor.statistics import ScoreStatistics
+from sneks.backend.storage import cache, publish
 from sneks.engine.config.instantiation import config
 from sneks.engine.engine import runner
+from sneks.engine.engine.mover import NormalizedScore
 
 if typing.TYPE_CHECKING:
     from mypy_boto3_s3 import S3ServiceResource
-    from mypy_boto3_s3.service_resource import Bucket, BucketObjectsCollection
+    from mypy_boto3_s3.service_resource import Bucket
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
 else:
     S3ServiceResource = object
     Bucket = object
-    BucketObjectsCollection = object
+    ObjectTypeDef = dict
 
 
-Score = namedtuple("Score", ["name", "age", "ended", "age1", "ended1"])
-
 working_dir_root = "/tmp"
 registrar_prefix = f"{working_dir_root}/submitted"
 record_prefix = f"{working_dir_root}/output"
 
-
-def run(submission_bucket_name: str) -> tuple[list[dict], list[Score]]:
+# Games played between checks of whether the ranking has settled
+DEFAULT_BATCH_SIZE = 4
+
+
+def run(
+    submission_bucket_name: str,
+    runs: int = 1,
+    seed: int | None = None,
+    seeds: list[int] | None = None,
+    submissions: list[str] | None = None,
+    max_runs: int | None = None,
+    results_bucket_name: str | None = None,
+) -> tuple[list[dict], list[Score], list[RunScores]]:
+    """
+    Plays ``runs`` games, or one for each of the given seeds. When ``max_runs``
+    is larger, ``runs`` is treated as a minimum and games keep being played
+    until the ranking settles or the budget of ``max_runs`` is used up.
+
+    Runs already played with the same submissions, settings and seed are taken
+    from the results cache, which is kept in the results bucket when given.
+    """
     config.registrar_prefix = registrar_prefix
     shutil.rmtree(registrar_prefix, ignore_errors=True)
 
-    get_snake_submissions(bucket_name=submission_bucket_name)
+    get_snake_submissions(bucket_name=submission_bucket_name, names=submissions)
+    fingerprint = results.get_fingerprint(registrar_prefix)
+    if seeds is None:
+        if seed is None:
+            # Repeating an invocation with the same inputs finds its runs cached
+            seed = results.to_seed(fingerprint)
+        seeds = get_seeds(runs=max(runs, max_runs or 0), seed=seed)
+    play = results.cached(
+        play=run_scoring, fingerprint=fingerprint, bucket_name=results_bucket_name
+    )
     videos: list[dict] = []
-    scores: list[Score] = run_scoring()
-    return videos, scores
+    if max_runs is not None and max_runs > runs:
+        run_scores, _ = run_until_settled(seeds=seeds, min_runs=runs, play=play)
+    else:
+        run_scores = play(seeds)
+    scores: list[Score] = aggregate_scores(
+        itertools.chain.from_iterable(run.scores for run in run_scores)
+    )
+    return videos, scores, run_scores
+
+
+def get_seeds(runs: int, seed: int) -> list[int]:
+    return list(range(seed, seed + runs))
 
 
 def record(
-    submission_bucket_name: str, video_bucket_name: str
+    submission_bucket_name: str,
+    video_bucket_name: str,
+    static_site_bucket_name: str | None = None,
 ) -> tuple[list[str], list[Score]]:
     config.registrar_prefix = registrar_prefix
     shutil.rmtree(registrar_prefix, ignore_errors=True)
@@ -49,37 +94,50 @@ def record(
 
     get_snake_submissions(bucket_name=submission_bucket_name)
     run_recordings()
-    videos: list[str] = encode_videos(video_bucket_name)
+    videos: list[str] = encode_videos(
+        video_bucket_name=video_bucket_name,
+        static_site_bucket_name=static_site_bucket_name,
+    )
     scores: list[Score] = []
     return videos, scores
 
 
-def get_snake_submissions(bucket_name: str):
-    # s3 list objects prefix
-    s3: S3ServiceResource = boto3.resource("s3")
-    bucket: Bucket = s3.Bucket(bucket_name)
-    objects: BucketObjectsCollection = bucket.objects.filter(Prefix="submitted/")
+def get_snake_submissions(bucket_name: str, names: list[str] | None = None):
+    objects = get_latest_objects(bucket_name=bucket_name)
+    if names is not None:
+        objects = [obj for obj in objects if get_submission_name(obj["Key"]) in names]
+
+    cache.fetch(
+        bucket_name=bucket_name,
+        objects=objects,
+        destination_root=working_dir_root,
+    )
+
+
+def get_latest_objects(bucket_name: str) -> list[ObjectTypeDef]:
+    objects = storage.list_objects(bucket_name=bucket_name, prefix="submitted/")
 
     # sort by user_id, timestamp, desc
-    keys = [obj.key for obj in objects]
-    keys.sort(reverse=True)
-    paths = [pathlib.PurePosixPath(key) for key in keys]
+    objects.sort(key=lambda obj: obj["Key"], reverse=True)
+    paths = [pathlib.PurePosixPath(obj["Key"]) for obj in objects]
 
     # get latest (user_id, timestamp) tuple for each user
     user_latest: dict[str, str] = {}
     for path in paths:
         user_latest.setdefault(path.parts[1], path.parts[2])
 
-    # remove non-latest paths
-    filtered_paths = [
-        path for path in paths if path.parts[2] == user_latest.get(path.parts[1])
+    # remove non-latest objects
+    return [
+        obj
+        for obj, path in zip(objects, paths)
+        if path.parts[2] == user_latest.get(path.parts[1])
     ]
 
-    for filtered_path in filtered_paths:
-        filename = f"{working_dir_root}/{filtered_path}"
-        if not os.path.exists(os.path.dirname(filename)):
-            os.makedirs(os.path.dirname(filename))
-        bucket.download_file(str(filtered_path), filename)
+
+def get_submission_name(key: str) -> str:
+    # Matches the name the registrar gives the submission once downloaded,
+    # which is its path relative to the registrar prefix: <user_id>/<timestamp>
+    return str(pathlib.PurePosixPath(*pathlib.PurePosixPath(key).parts[1:3]))
 
 
 def run_recordings() -> None:
@@ -93,13 +151,44 @@ def run_recordings() -> None:
     runner.main()
 
 
-def run_scoring() -> list[Score]:
-    config.runs = 1
+def run_scoring(seeds: list[int]) -> list[RunScores]:
     if config.graphics is not None:
         config.graphics.display = False
-    normalized_scores = runner.main()
-    assert normalized_scores is not None
-    scores = [
+    runs = runner.run_games(seeds)
+    for run in runs:
+        if run.telemetry is not None:
+            metrics.emit(run.telemetry, seed=run.seed)
+    return [RunScores(seed=run.seed, scores=to_scores(run.scores)) for run in runs]
+
+
+def run_until_settled(
+    seeds: list[int],
+    min_runs: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    play: Callable[[list[int]], list[RunScores]] = run_scoring,
+) -> tuple[list[RunScores], ScoreStatistics]:
+    """
+    Plays batches of games until at least ``min_runs`` have been played and the
+    ranking is settled, or until every seed has been used. Only the games of
+    this invocation are considered here, while whether the ranking merged from
+    every invocation has settled is decided once they finish.
+    """
+    aggregation = ScoreStatistics()
+    run_scores: list[RunScores] = []
+    for i in range(0, len(seeds), batch_size):
+        batch = play(seeds[i : i + batch_size])
+        for run in batch:
+            aggregation.add_all(run.scores)
+        run_scores += batch
+        aggregation.update_ranking()
+        if len(run_scores) >= min_runs and aggregation.is_settled():
+            break
+    print(f"settled after {len(run_scores)} of {len(seeds)} runs")
+    return run_scores, aggregation
+
+
+def to_scores(normalized_scores: list[NormalizedScore]) -> list[Score]:
+    return [
         Score(
             name=s.raw.name,
             age=s.raw.age,
@@ -110,10 +199,8 @@ def run_scoring() -> list[Score]:
         for s in normalized_scores
     ]
 
-    return aggregate_scores(scores)
-
 
-def aggregate_scores(scores: list[Score]) -> list[Score]:
+def aggregate_scores(scores: Iterable[Score]) -> list[Score]:
     # Aggregate both raw values and normalized
     aggregation: dict[str, Score] = dict()
     counts: dict[str, int] = dict()
@@ -140,19 +227,27 @@ def aggregate_scores(scores: list[Score]) -> list[Score]:
     return list(aggregation.values())
 
 
-def encode_videos(video_bucket_name) -> list[str]:
-    s3: S3ServiceResource = boto3.resource("s3")
-    bucket: Bucket = s3.Bucket(video_bucket_name)
+def encode_videos(
+    video_bucket_name: str, static_site_bucket_name: str | None = None
+) -> list[str]:
+    """
+    Uploads the recorded videos. When a static site bucket is given, they're
+    published directly to their final location instead of the video bucket.
+    """
     prefix = pathlib.Path(f"{record_prefix}/movies/")
     videos = list(prefix.glob("*.mp4"))
-    results = []
+    files: dict[str, str] = {}
+    encoded = []
     for video in videos:
         print(video)
         name = f"{datetime.datetime.utcnow().timestamp()}_{video.relative_to(prefix)}"
-        results.append(name)
-        with open(video, "rb") as f:
-            bucket.upload_fileobj(f, f"games/{name}")
-    return results
+        encoded.append(name)
+        files[f"games/{name}"] = str(video)
+    if static_site_bucket_name is not None:
+        publish.upload(bucket_name=static_site_bucket_name, files=files)
+    else:
+        publish.upload(bucket_name=video_bucket_name, files=files, overwrite=True)
+    return encoded
 
 
 def save_manifest(
@@ -160,7 +255,12 @@ def save_manifest(
     scores: list[Score],
     distribution_id: str,
     static_site_bucket_name: str,
+    ratings: dict[str, float] | None = None,
 ) -> None:
+    """
+    Publishes the leaderboard, ordered by rating when the submissions are rated
+    and otherwise by their mean normalized scores.
+    """
     assert config.graphics is not None
     names = sorted([score.name for score in scores])
     color_index_delta = max(len(config.graphics.colors.snake) // len(names), 1)
@@ -173,13 +273,21 @@ def save_manifest(
         for name, color in zip(names, colors)
     }
 
+    if ratings is not None:
+        entries = [
+            dict(score._asdict(), rating=ratings[score.name]) for score in scores
+        ]
+        entries.sort(key=lambda entry: entry["rating"], reverse=True)
+    else:
+        entries = [
+            score._asdict()
+            for score in sorted(scores, key=lambda s: s.age1 + s.ended1, reverse=True)
+        ]
+
     timestamp = datetime.datetime.utcnow().isoformat(timespec="seconds")
     structure = {
         "videos": [f"https://www.sneks.dev/games/{video}" for video in video_names],
-        "scores": [
-            score._asdict()
-            for score in sorted(scores, key=lambda s: s.age1 + s.ended1, reverse=True)
-        ],
+        "scores": entries,
         "colors": color_map,
         "timestamp": timestamp,
     }
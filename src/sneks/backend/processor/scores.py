@@ -0,0 +1,4 @@
+from collections import namedtuple
+
+Score = namedtuple("Score", ["name", "age", "ended", "age1", "ended1"])
+RunScores = namedtuple("RunScores", ["seed", "scores"])
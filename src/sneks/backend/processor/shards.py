@@ -0,0 +1,66 @@
+import collections
+import itertools
+import json
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from sneks.backend import storage
+from sneks.backend.processor.scores import RunScores, Score
+
+MAX_WORKERS = 8
+
+
+def write(bucket_name: str, prefix: str, runs: Iterable[RunScores]) -> str:
+    """
+    Writes the scores of each run as a shard, so results don't have to travel
+    through the state machine payload.
+
+    :return: the key of the shard
+    """
+    key = f"{prefix}{uuid.uuid4()}.json"
+    shard = {
+        "runs": [
+            {"seed": run.seed, "scores": [list(score) for score in run.scores]}
+            for run in runs
+        ]
+    }
+    storage.get_s3_client().put_object(
+        Bucket=bucket_name,
+        Key=key,
+        Body=json.dumps(shard, separators=(",", ":")).encode("utf-8"),
+    )
+    return key
+
+
+def read_runs(bucket_name: str, prefix: str) -> Iterator[RunScores]:
+    """
+    Streams the runs from every shard under the prefix. Shards are fetched in
+    parallel, but only a bounded number are held in memory at once.
+    """
+    keys = iter([obj["Key"] for obj in storage.list_objects(bucket_name, prefix)])
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending = collections.deque(
+            executor.submit(read, bucket_name, key)
+            for key in itertools.islice(keys, MAX_WORKERS)
+        )
+        while pending:
+            shard = pending.popleft().result()
+            for key in itertools.islice(keys, 1):
+                pending.append(executor.submit(read, bucket_name, key))
+            for run in shard["runs"]:
+                yield RunScores(
+                    seed=run.get("seed"),
+                    scores=[Score._make(row) for row in run["scores"]],
+                )
+
+
+def read_scores(bucket_name: str, prefix: str) -> Iterator[Score]:
+    return itertools.chain.from_iterable(
+        run.scores for run in read_runs(bucket_name, prefix)
+    )
+
+
+def read(bucket_name: str, key: str) -> dict:
+    response = storage.get_s3_client().get_object(Bucket=bucket_name, Key=key)
+    return json.loads(response["Body"].read().decode("utf-8"))
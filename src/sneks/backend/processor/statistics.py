@@ -0,0 +1,105 @@
+import math
+from collections.abc import Iterable
+
+from sneks.backend.processor.scores import Score
+
+# Two sided 95% confidence
+DEFAULT_Z = 1.96
+
+
+class Welford:
+    """
+    Running mean and variance using Welford's online algorithm
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else math.inf
+
+    @property
+    def standard_error(self) -> float:
+        return math.sqrt(self.variance / self.count) if self.count > 1 else math.inf
+
+
+class ScoreStatistics:
+    """
+    Streaming aggregation of scores by name. Means match ``aggregate_scores``,
+    and the spread of the total normalized score is tracked to decide when the
+    leaderboard ordering is settled.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, tuple[Welford, ...]] = {}
+        self.totals: dict[str, Welford] = {}
+        self.previous_ranking: list[str] = []
+        self.stable_updates = 0
+
+    def add(self, score: Score) -> None:
+        if score.name not in self.fields:
+            self.fields[score.name] = tuple(Welford() for _ in score[1:])
+            self.totals[score.name] = Welford()
+        for field, value in zip(self.fields[score.name], score[1:]):
+            field.add(value)
+        self.totals[score.name].add(score.age1 + score.ended1)
+
+    def add_all(self, scores: Iterable[Score]) -> None:
+        for score in scores:
+            self.add(score)
+
+    def scores(self) -> list[Score]:
+        return [
+            Score(name, *(field.mean for field in fields))
+            for name, fields in self.fields.items()
+        ]
+
+    def ranking(self) -> list[str]:
+        return sorted(
+            self.totals, key=lambda name: self.totals[name].mean, reverse=True
+        )
+
+    def update_ranking(self) -> int:
+        """
+        Records the current ranking, to be called after each batch of runs.
+
+        :return: the number of consecutive updates the ranking has been unchanged
+        """
+        ranking = self.ranking()
+        if ranking == self.previous_ranking:
+            self.stable_updates += 1
+        else:
+            self.stable_updates = 0
+        self.previous_ranking = ranking
+        return self.stable_updates
+
+    def is_separated(self, z: float = DEFAULT_Z) -> bool:
+        """
+        Whether each name's mean total is significantly different from the next
+        in the ranking.
+        """
+        ranking = self.ranking()
+        for higher, lower in zip(ranking, ranking[1:]):
+            a, b = self.totals[higher], self.totals[lower]
+            error = math.hypot(a.standard_error, b.standard_error)
+            if not a.mean - b.mean > z * error:
+                return False
+        return True
+
+    def is_settled(self, z: float = DEFAULT_Z, stable_updates: int = 3) -> bool:
+        """
+        Whether the ordering is either statistically separated or has stopped
+        changing. The latter ends scheduling for genuine ties.
+        """
+        return self.is_separated(z) or self.stable_updates >= stable_updates
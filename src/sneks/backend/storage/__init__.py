@@ -0,0 +1,38 @@
+import functools
+import typing
+
+import boto3
+import botocore.config
+
+if typing.TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+else:
+    S3Client = object
+    ObjectTypeDef = dict
+
+# Shared by every thread pool in the backend, so keep it at least as large as
+# the biggest pool to avoid connections being discarded and re-established
+MAX_POOL_CONNECTIONS = 32
+
+
+@functools.cache
+def get_s3_client() -> S3Client:
+    # Clients are thread safe and expensive to create, so one is kept per
+    # process and reused across warm lambda invocations
+    return boto3.client(
+        "s3",
+        config=botocore.config.Config(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            retries={"mode": "standard"},
+        ),
+    )
+
+
+def list_objects(bucket_name: str, prefix: str) -> list[ObjectTypeDef]:
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    return [
+        obj
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    ]
@@ -0,0 +1,113 @@
+import os
+import shutil
+import time
+import typing
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sneks.backend.storage import get_s3_client
+
+if typing.TYPE_CHECKING:
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+else:
+    ObjectTypeDef = dict
+
+# Lives outside of the working directories so it survives warm invocations
+cache_root = "/tmp/cache"
+
+MAX_WORKERS = 16
+# Lambda has 512MB of /tmp by default, which the cache shares with the runs
+MAX_CACHE_BYTES = 128 * 1024 * 1024
+PARTIAL_SUFFIX = ".partial"
+
+# When each entry was last used in this process, in nanoseconds. Kept apart
+# from the files since the working files are hard links to the same inodes,
+# and the registrar only reloads submissions when their files change.
+_last_used: dict[str, int] = {}
+
+
+def fetch(
+    bucket_name: str,
+    objects: list[ObjectTypeDef],
+    destination_root: str,
+    cache_prefix: str | None = None,
+) -> None:
+    """
+    Materializes each object at ``destination_root/<key>``. Object contents are
+    stored in a cache keyed by ETag, so only objects that changed since a
+    previous invocation are downloaded.
+    """
+    if cache_prefix is None:
+        cache_prefix = cache_root
+    os.makedirs(cache_prefix, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                fetch_object,
+                bucket_name=bucket_name,
+                obj=obj,
+                destination_root=destination_root,
+                cache_prefix=cache_prefix,
+            )
+            for obj in objects
+        ]
+        for future in futures:
+            future.result()
+    prune(keep={get_cache_name(obj) for obj in objects}, cache_prefix=cache_prefix)
+
+
+def fetch_object(
+    bucket_name: str, obj: ObjectTypeDef, destination_root: str, cache_prefix: str
+) -> None:
+    cached = os.path.join(cache_prefix, get_cache_name(obj))
+    if not os.path.exists(cached):
+        # Download to a unique name first so a partial file is never cached
+        partial = f"{cached}.{uuid.uuid4().hex}{PARTIAL_SUFFIX}"
+        get_s3_client().download_file(bucket_name, obj["Key"], partial)
+        os.replace(partial, cached)
+    _last_used[cached] = time.time_ns()
+
+    filename = os.path.join(destination_root, obj["Key"])
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    if os.path.exists(filename):
+        os.remove(filename)
+    try:
+        os.link(cached, filename)
+    except OSError:
+        shutil.copyfile(cached, filename)
+
+
+def prune(
+    keep: set[str], cache_prefix: str = cache_root, max_bytes: int = MAX_CACHE_BYTES
+) -> None:
+    """
+    Drops the least recently used entries until the cache fits in
+    ``max_bytes``, to bound /tmp usage. A fetch can be limited to some of the
+    submissions, so entries it didn't use are only dropped for space, and the
+    ones in ``keep`` never are.
+    """
+    entries = [
+        entry
+        for entry in os.scandir(cache_prefix)
+        if not entry.name.endswith(PARTIAL_SUFFIX)
+    ]
+    size = sum(entry.stat().st_size for entry in entries)
+    for entry in sorted(entries, key=get_last_used):
+        if size <= max_bytes:
+            break
+        if entry.name not in keep:
+            size -= entry.stat().st_size
+            os.remove(entry.path)
+            _last_used.pop(entry.path, None)
+
+
+def get_last_used(entry: os.DirEntry) -> int:
+    """
+    Entries that weren't used since the process started, like after a cold
+    start, fall back to when they were downloaded.
+    """
+    return _last_used.get(entry.path, entry.stat().st_mtime_ns)
+
+
+def get_cache_name(obj: ObjectTypeDef) -> str:
+    return obj["ETag"].strip('"')
@@ -0,0 +1,83 @@
+import time
+from collections import namedtuple
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.exceptions
+
+from sneks.backend.storage import get_s3_client
+
+MoveResult = namedtuple("MoveResult", ["moved", "failed"])
+
+MAX_WORKERS = 16
+# Limit imposed by the DeleteObjects API
+DELETE_BATCH_SIZE = 1000
+# Throttling and server errors on individual requests are retried by the client,
+# but per-key errors reported by DeleteObjects have to be retried here
+DELETE_ATTEMPTS = 3
+DELETE_BACKOFF_SECONDS = 0.2
+
+
+def move(bucket_name: str, keys: list[str], rename: Callable[[str], str]) -> MoveResult:
+    """
+    Moves each key to ``rename(key)`` within the bucket using server-side copies
+    run in parallel, followed by batched deletes of the successfully copied keys.
+
+    :return: ``moved`` maps each moved key to its new key, and ``failed`` maps keys
+        that could not be moved to the reason. A key that fails to delete after
+        being copied is reported as failed even though its copy exists.
+    """
+    moved: dict[str, str] = {}
+    failed: dict[str, str] = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            key: executor.submit(copy, bucket_name, key, rename(key)) for key in keys
+        }
+        for key, future in futures.items():
+            try:
+                moved[key] = future.result()
+            except botocore.exceptions.ClientError as e:
+                failed[key] = str(e)
+
+    copied = list(moved)
+    for i in range(0, len(copied), DELETE_BATCH_SIZE):
+        errors = delete(bucket_name, copied[i : i + DELETE_BATCH_SIZE])
+        for key, error in errors.items():
+            del moved[key]
+            failed[key] = error
+
+    return MoveResult(moved=moved, failed=failed)
+
+
+def copy(bucket_name: str, key: str, new_key: str) -> str:
+    get_s3_client().copy_object(
+        Bucket=bucket_name,
+        Key=new_key,
+        CopySource={"Bucket": bucket_name, "Key": key},
+    )
+    return new_key
+
+
+def delete(bucket_name: str, keys: list[str]) -> dict[str, str]:
+    errors: dict[str, str] = {}
+    remaining = keys
+    for attempt in range(DELETE_ATTEMPTS):
+        if attempt:
+            time.sleep(DELETE_BACKOFF_SECONDS * 2**attempt)
+        try:
+            response = get_s3_client().delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in remaining], "Quiet": True},
+            )
+        except botocore.exceptions.ClientError as e:
+            errors = {key: str(e) for key in remaining}
+            continue
+        errors = {
+            error["Key"]: f"{error.get('Code')}: {error.get('Message')}"
+            for error in response.get("Errors", [])
+        }
+        if not errors:
+            break
+        remaining = list(errors)
+    return errors
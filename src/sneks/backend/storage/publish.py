@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.exceptions
+from boto3.s3.transfer import TransferConfig
+
+from sneks.backend.storage import MAX_POOL_CONNECTIONS, get_s3_client
+
+MAX_WORKERS = 4
+MEGABYTE = 1024**2
+
+# Each transfer fans out into parts on its own threads, so the workers times the
+# concurrency of each transfer is kept within the client's connection pool
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MEGABYTE,
+    multipart_chunksize=8 * MEGABYTE,
+    max_concurrency=MAX_POOL_CONNECTIONS // MAX_WORKERS,
+)
+
+
+def upload(bucket_name: str, files: dict[str, str], overwrite: bool = False) -> None:
+    """
+    Uploads files in parallel, each using multipart concurrency when large enough.
+
+    :param files: mapping of destination key to local filename
+    :param overwrite: when ``False``, raises before uploading over an existing key
+    """
+    _run_all(
+        lambda key: _upload(bucket_name, key, files[key], overwrite),
+        keys=list(files),
+    )
+
+
+def copy(
+    source_bucket_name: str,
+    bucket_name: str,
+    keys: list[str],
+    overwrite: bool = False,
+) -> None:
+    """
+    Copies keys between buckets in parallel, keeping the same key names.
+
+    :param overwrite: when ``False``, raises before copying over an existing key
+    """
+    _run_all(
+        lambda key: _copy(source_bucket_name, bucket_name, key, overwrite),
+        keys=keys,
+    )
+
+
+def exists(bucket_name: str, key: str) -> bool:
+    try:
+        get_s3_client().head_object(Bucket=bucket_name, Key=key)
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] == "404":
+            return False
+        raise
+    return True
+
+
+def _upload(bucket_name: str, key: str, filename: str, overwrite: bool) -> None:
+    if not overwrite and exists(bucket_name, key):
+        raise Exception(f"trying to overwrite existing file: {key}")
+    get_s3_client().upload_file(filename, bucket_name, key, Config=TRANSFER_CONFIG)
+
+
+def _copy(source_bucket_name: str, bucket_name: str, key: str, overwrite: bool) -> None:
+    if not overwrite and exists(bucket_name, key):
+        raise Exception(f"trying to overwrite existing file: {key}")
+    get_s3_client().copy(
+        {"Bucket": source_bucket_name, "Key": key},
+        bucket_name,
+        key,
+        Config=TRANSFER_CONFIG,
+    )
+
+
+def _run_all(function: Callable[[str], None], keys: list[str]) -> None:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(function, key) for key in keys]
+        for future in futures:
+            future.result()
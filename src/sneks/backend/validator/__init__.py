@@ -4,7 +4,8 @@ from datetime import datetime
 
 import boto3
 
-from sneks.engine.validator import main as sneks_validator
+from sneks.backend import storage
+from sneks.backend.storage import move
 
 if typing.TYPE_CHECKING:
     from mypy_boto3_s3 import S3ServiceResource
@@ -16,6 +17,9 @@ else:
 
 
 def run(bucket_name: str, prefix: str) -> None:
+    # Imports pytest, which the post validation step doesn't need
+    from sneks.engine.validator import main as sneks_validator
+
     s3: S3ServiceResource = boto3.resource("s3")
     bucket: Bucket = s3.Bucket(bucket_name)
     objects: BucketObjectsCollection = bucket.objects.filter(Prefix=prefix)
@@ -36,14 +40,15 @@ def post(bucket_name: str, prefix: str, success: bool) -> bool:
     )
     if success:
         new_prefix = new_prefix.replace("invalid", "submitted", 1)
-    s3: S3ServiceResource = boto3.resource("s3")
-    bucket: Bucket = s3.Bucket(bucket_name)
-    objects: BucketObjectsCollection = bucket.objects.filter(Prefix=prefix)
-    for obj in objects:
-        key = obj.key
-        new_key = key.replace(prefix, new_prefix, 1)
-        print(f"moving {key} to {new_key}")
-        bucket.Object(new_key).copy(CopySource=dict(Bucket=bucket.name, Key=key))
-        obj.delete()
+    objects = storage.list_objects(bucket_name=bucket_name, prefix=prefix)
+    result = move.move(
+        bucket_name=bucket_name,
+        keys=[obj["Key"] for obj in objects],
+        rename=lambda key: key.replace(prefix, new_prefix, 1),
+    )
+    for key, new_key in result.moved.items():
+        print(f"moved {key} to {new_key}")
+    if result.failed:
+        raise Exception(f"failed to move {result.failed}")
 
     return success
@@ -0,0 +1,409 @@
+"""
+Runs the processing workflow locally against a moto server, invoking the same
+handlers as the state machine in ``sneks.infrastructure.processor`` in the
+same order and with the same payloads. Map states run their items across a
+process pool. Each stage's time and payload sizes are reported, which makes a
+whole processing cycle something that can be benchmarked::
+
+    python -m sneks.backend.workflow --sneks 12
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import pathlib
+import tempfile
+import time
+import uuid
+from collections import namedtuple
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from sneks.backend import storage
+from sneks.backend.handlers import processor, recorder, validator
+from sneks.backend.processor import runner
+from sneks.backend.storage import cache
+from sneks.engine import util
+
+Buckets = namedtuple("Buckets", ["submission", "video", "static_site"])
+Context = namedtuple("Context", ["aws_request_id"])
+Invocation = namedtuple(
+    "Invocation", ["name", "seconds", "input_bytes", "output_bytes"]
+)
+Stage = namedtuple(
+    "Stage", ["name", "seconds", "invocations", "input_bytes", "output_bytes"]
+)
+
+# Largest payload Step Functions passes between states
+MAX_PAYLOAD_BYTES = 256 * 1024
+DISTRIBUTION_ID = "local"
+
+# The result of a branch with nothing to do, like the state machine's Pass states
+SKIPPED_RESULT = dict(videos=[], scores=[], proceed=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs the processing workflow locally and times each stage."
+    )
+    parser.add_argument("--sneks", type=int, default=8, help="reference sneks")
+    parser.add_argument("--submissions", help="directory of submissions to add")
+    parser.add_argument("--target-games", type=int)
+    parser.add_argument("--record", action="store_true", help="record videos")
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--output", help="path to write the stages to as JSON")
+    options = parser.parse_args()
+
+    with server():
+        buckets = create_buckets()
+        if options.submissions is not None:
+            upload_submissions(buckets.submission, pathlib.Path(options.submissions))
+        upload_reference_sneks(buckets.submission, count=options.sneks)
+        stages = run(
+            buckets,
+            record=options.record,
+            target_games=options.target_games,
+            processes=options.processes,
+        )
+
+    print(format_table(stages))
+    if options.output is not None:
+        with open(options.output, "w") as file:
+            json.dump([stage._asdict() for stage in stages], file, indent=2)
+
+
+@contextlib.contextmanager
+def server() -> Iterator[str]:
+    """
+    Starts a moto server and points boto3 at it, so worker processes share the
+    same buckets.
+    """
+    from moto.server import ThreadedMotoServer
+
+    moto_server = ThreadedMotoServer(port=0, verbose=False)
+    moto_server.start()
+    host, port = moto_server.get_host_and_port()
+    endpoint = f"http://{host}:{port}"
+    environment = dict(
+        AWS_ENDPOINT_URL=endpoint,
+        AWS_ACCESS_KEY_ID="testing",
+        AWS_SECRET_ACCESS_KEY="testing",
+        AWS_DEFAULT_REGION="us-east-1",
+    )
+    previous = {name: os.environ.get(name) for name in environment}
+    os.environ.update(environment)
+    storage.get_s3_client.cache_clear()
+    try:
+        yield endpoint
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        storage.get_s3_client.cache_clear()
+        moto_server.stop()
+
+
+def create_buckets() -> Buckets:
+    buckets = Buckets(submission="submission", video="video", static_site="site")
+    for name in buckets:
+        storage.get_s3_client().create_bucket(Bucket=name)
+    return buckets
+
+
+def upload_submissions(bucket_name: str, directory: pathlib.Path) -> None:
+    """
+    Uploads each ``<name>/submission.py`` in the directory like the website
+    does, as a new upload from user ``<name>``.
+    """
+    for path in sorted(directory.glob("*/submission.py")):
+        storage.get_s3_client().upload_file(
+            str(path), bucket_name, f"private/{path.parent.name}/submission.py"
+        )
+
+
+def upload_reference_sneks(bucket_name: str, count: int) -> None:
+    from sneks.engine.benchmark.reference import REFERENCE_SNEKS
+
+    sneks = list(REFERENCE_SNEKS.values())
+    for i in range(count):
+        snek = sneks[i % len(sneks)]
+        storage.get_s3_client().put_object(
+            Bucket=bucket_name,
+            Key=f"private/reference{i}/submission.py",
+            Body=f"from {snek.__module__} import {snek.__name__} as CustomSnek\n",
+        )
+
+
+def run(
+    buckets: Buckets,
+    record: bool = False,
+    target_games: int | None = None,
+    processes: int | None = None,
+) -> list[Stage]:
+    """
+    Runs the workflow from pre-processing on, skipping the wait for uploads to
+    finish and the CloudFront invalidation at the end.
+
+    :param record: whether to record videos, which needs the record extras
+    :param target_games: games to plan for, instead of the planner's default
+    :return: the stages that ran, in order
+    """
+    execution_name = str(uuid.uuid4())
+    shard_prefix = f"scores/{execution_name}/"
+    invocations: list[Invocation] = []
+
+    pre = invoke(
+        "PreProcessTask",
+        processor.pre_process,
+        dict(bucket=buckets.submission),
+        invocations,
+    )
+    if not pre.get("staged"):
+        print("No new submissions")
+        return summarize(invocations)
+
+    validated = run_map("ValidateMap", validate, pre["staged"], invocations, processes)
+    proceed = invoke(
+        "PostValidateReduce", validator.post_validate_reduce, validated, invocations
+    )
+    if proceed is False:
+        print("No new submissions validated")
+        return summarize(invocations)
+
+    plan_event: dict[str, Any] = dict(
+        submission_bucket=buckets.submission,
+        ratings_bucket=buckets.static_site,
+        adaptive=True,
+    )
+    if target_games is not None:
+        plan_event.update(target_games=target_games)
+    if not record:
+        plan_event.update(recordings=0)
+    plan = invoke("PlanProcessTask", processor.plan_process, plan_event, invocations)
+
+    # Like the state machine, rounds are played until the ranking settles
+    while plan["items"]:
+        items = [(item, buckets, shard_prefix) for item in plan["items"]]
+        concurrency = processes
+        if plan.get("max_concurrency"):
+            concurrency = min(processes or os.cpu_count() or 1, plan["max_concurrency"])
+        played = run_map("MapProcess", process, items, invocations, concurrency)
+        plan = invoke(
+            "SettleTask",
+            processor.settle_process,
+            dict(
+                shard_bucket=buckets.video,
+                shard_prefix=shard_prefix,
+                seed=plan["seed"],
+                target_games=plan["target_games"],
+                max_games=plan["max_games"],
+                result=plan["result"],
+                round=played,
+            ),
+            invocations,
+        )
+
+    invoke(
+        "PostProcess",
+        processor.post_process,
+        dict(
+            distribution_id=DISTRIBUTION_ID,
+            static_site_bucket=buckets.static_site,
+            shard_bucket=buckets.video,
+            shard_prefix=shard_prefix,
+            ratings_bucket=buckets.static_site,
+            submission_bucket=buckets.submission,
+            result=plan["result"],
+        ),
+        invocations,
+    )
+    return summarize(invocations)
+
+
+def invoke(
+    name: str,
+    handler: Callable[[Any, Context], Any],
+    event: Any,
+    invocations: list[Invocation],
+) -> Any:
+    """
+    Calls the handler like Lambda would, passing the event and result through
+    JSON so they take the same shape as in the state machine. Payloads over the
+    Step Functions limit are reported, since they'd fail the execution.
+    """
+    payload = json.dumps(event)
+    output = ""
+    start = time.perf_counter()
+    try:
+        output = json.dumps(handler(json.loads(payload), Context(str(uuid.uuid4()))))
+    finally:
+        invocation = Invocation(
+            name=name,
+            seconds=time.perf_counter() - start,
+            input_bytes=len(payload.encode("utf-8")),
+            output_bytes=len(output.encode("utf-8")),
+        )
+        invocations.append(invocation)
+    for direction, size in [
+        ("was passed", invocation.input_bytes),
+        ("returned", invocation.output_bytes),
+    ]:
+        if size > MAX_PAYLOAD_BYTES:
+            print(f"{name} {direction} {size} bytes, over the Step Functions limit")
+    return json.loads(output)
+
+
+def run_map(
+    name: str,
+    function: Callable[[Any], tuple[Any, list[Invocation]]],
+    items: list,
+    invocations: list[Invocation],
+    processes: int | None = None,
+) -> list:
+    """
+    Runs the iterator of a Map state for each item across worker processes.
+    """
+    position = len(invocations)
+    start = time.perf_counter()
+    results = []
+    if items:
+        with (
+            tempfile.TemporaryDirectory() as root,
+            ProcessPoolExecutor(
+                max_workers=min(processes or os.cpu_count() or 1, len(items)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=initialize_worker,
+                initargs=(root,),
+            ) as executor,
+        ):
+            for result, branch in executor.map(function, items):
+                results.append(result)
+                invocations += branch
+    # Listed before the invocations within it
+    invocations.insert(
+        position,
+        Invocation(
+            name=name,
+            seconds=time.perf_counter() - start,
+            input_bytes=len(json.dumps(items).encode("utf-8")),
+            output_bytes=len(json.dumps(results).encode("utf-8")),
+        ),
+    )
+    return results
+
+
+def initialize_worker(root: str) -> None:
+    # Every lambda has its own /tmp, so each worker gets its own directories
+    # to keep concurrent invocations from overwriting each other's files
+    directory = f"{root}/{os.getpid()}"
+    runner.working_dir_root = directory
+    runner.registrar_prefix = f"{directory}/submitted"
+    runner.record_prefix = f"{directory}/output"
+    cache.cache_root = f"{directory}/cache"
+    storage.get_s3_client.cache_clear()
+
+
+def validate(item: dict) -> tuple[bool, list[Invocation]]:
+    invocations: list[Invocation] = []
+    try:
+        event = invoke("ValidateTask", validator.validate, item, invocations)
+    except Exception as e:
+        # Like the catch in the state machine, which continues to post validation
+        event = dict(item, error=dict(Error=type(e).__name__, Cause=str(e)))
+    success = invoke("PostValidate", validator.post_validate, event, invocations)
+    return success, invocations
+
+
+def process(arguments: tuple[dict, Buckets, str]) -> tuple[dict, list[Invocation]]:
+    item, buckets, shard_prefix = arguments
+    invocations: list[Invocation] = []
+    branches = []
+    if item["runs"] > 0:
+        branches.append(
+            invoke(
+                "ProcessTask",
+                processor.process,
+                dict(
+                    submission_bucket=buckets.submission,
+                    shard_bucket=buckets.video,
+                    shard_prefix=shard_prefix,
+                    results_bucket=buckets.submission,
+                    runs=item["runs"],
+                    max_runs=item["max_runs"],
+                    seed=item["seed"],
+                    submissions=item["submissions"],
+                ),
+                invocations,
+            )
+        )
+    else:
+        branches.append(SKIPPED_RESULT)
+    if item["record"]:
+        branches.append(
+            invoke(
+                "RecordTask",
+                recorder.record,
+                dict(
+                    submission_bucket=buckets.submission,
+                    video_bucket=buckets.video,
+                    static_site_bucket=buckets.static_site,
+                ),
+                invocations,
+            )
+        )
+    else:
+        branches.append(SKIPPED_RESULT)
+    result = invoke(
+        "PostProcessSaveTask",
+        processor.post_process_save,
+        dict(
+            video_bucket=buckets.video,
+            static_site_bucket=buckets.static_site,
+            result=branches,
+        ),
+        invocations,
+    )
+    return result, invocations
+
+
+def summarize(invocations: list[Invocation]) -> list[Stage]:
+    """
+    Totals the invocations of each stage, in the order the stages first ran.
+    Map stages are timed from start to end, while other stages add up the
+    time of each of their invocations.
+    """
+    stages: dict[str, Stage] = {}
+    for invocation in invocations:
+        stage = stages.get(invocation.name, Stage(invocation.name, 0.0, 0, 0, 0))
+        stages[invocation.name] = Stage(
+            name=stage.name,
+            seconds=stage.seconds + invocation.seconds,
+            invocations=stage.invocations + 1,
+            input_bytes=stage.input_bytes + invocation.input_bytes,
+            output_bytes=stage.output_bytes + invocation.output_bytes,
+        )
+    return list(stages.values())
+
+
+def format_table(stages: list[Stage]) -> str:
+    header = ["stage", "seconds", "invocations", "input bytes", "output bytes"]
+    rows = [
+        [
+            stage.name,
+            f"{stage.seconds:.2f}",
+            str(stage.invocations),
+            str(stage.input_bytes),
+            str(stage.output_bytes),
+        ]
+        for stage in stages
+    ]
+    return util.format_table(header, rows, labelled=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+import argparse
+import contextlib
+import dataclasses
+import functools
+import itertools
+import json
+import pathlib
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from sneks.engine import util
+from sneks.engine.benchmark.reference import REFERENCE_SNEKS
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.direction import Direction
+from sneks.engine.engine import sweep
+from sneks.engine.engine.state import State
+
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_TURN_LIMIT = 200
+# Steps per second only compare on the machine that measured them, so the
+# baseline is saved locally with --save-baseline rather than committed
+BASELINE = "benchmark-baseline.json"
+
+
+@dataclass(frozen=True)
+class Case:
+    snakes: int
+    rows: int
+    columns: int
+    vision_range: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.snakes}x{self.rows}x{self.columns}v{self.vision_range}"
+
+
+@dataclass
+class Measurement:
+    case: Case
+    steps: int
+    steps_per_second: float
+    #: Mean microseconds per call of each phase
+    phases: Dict[str, float] = field(default_factory=dict)
+    #: Peak bytes allocated while playing the game
+    peak_memory: int = 0
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measures how the engine scales with the number of sneks, "
+        "the board size and the vision range."
+    )
+    parser.add_argument("--quick", action="store_true", help="run a small grid")
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument(
+        "--baseline", default=BASELINE, help="results to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save the results as the baseline instead of comparing against it",
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--turn-limit", type=int, default=DEFAULT_TURN_LIMIT)
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(args)
+
+    config.graphics.display = False
+    measurements = run(
+        get_cases(quick=options.quick),
+        turn_limit=options.turn_limit,
+        seed=options.seed,
+    )
+    print(format_table(measurements))
+    save(measurements, options.output)
+
+    if options.save_baseline:
+        save(measurements, options.baseline)
+        print(f"saved baseline to {options.baseline}")
+        return 0
+    if not pathlib.Path(options.baseline).exists():
+        print(
+            f"no baseline at {options.baseline} to compare against,"
+            " save one with --save-baseline"
+        )
+        return 0
+    regressions = compare(measurements, load(options.baseline), options.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+def get_cases(quick: bool = False) -> List[Case]:
+    if quick:
+        return [Case(3, 30, 45, 10), Case(12, 30, 45, 10), Case(12, 60, 90, 20)]
+    return [
+        Case(snakes, rows, columns, vision_range)
+        for snakes, (rows, columns), vision_range in itertools.product(
+            [3, 30, 99], [(30, 45), (60, 90), (120, 180)], [10, 20]
+        )
+    ]
+
+
+def run(cases: Sequence[Case], turn_limit: int, seed: int) -> List[Measurement]:
+    with tempfile.TemporaryDirectory() as prefix:
+        for name, snek in REFERENCE_SNEKS.items():
+            path = pathlib.Path(prefix) / name / "submission.py"
+            path.parent.mkdir()
+            path.write_text(
+                f"from {snek.__module__} import {snek.__name__} as CustomSnek\n"
+            )
+        registrar_prefix = config.registrar_prefix
+        config.registrar_prefix = prefix
+        try:
+            return [measure(case, turn_limit, seed) for case in cases]
+        finally:
+            config.registrar_prefix = registrar_prefix
+
+
+def measure(case: Case, turn_limit: int, seed: int) -> Measurement:
+    variant = dict(
+        rows=case.rows,
+        columns=case.columns,
+        vision_range=case.vision_range,
+        turn_limit=turn_limit,
+        registrar_submission_sneks=max(case.snakes // len(REFERENCE_SNEKS), 1),
+    )
+    with sweep.applied(variant):
+        random.seed(seed)
+        state = State()
+        phases: Dict[str, List[float]] = {}
+
+        with timed(phases, "reset"):
+            state.reset()
+        steps = 0
+        while state.should_continue(config.turn_limit):
+            with timed(phases, "step"):
+                state.step()
+            steps += 1
+            if steps == turn_limit // 2:
+                measure_midgame(state, phases)
+        with timed(phases, "report"):
+            state.report()
+
+        # Measured separately, since tracing slows everything down
+        random.seed(seed)
+        tracemalloc.start()
+        try:
+            traced = State()
+            traced.reset()
+            while traced.should_continue(config.turn_limit):
+                traced.step()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    step_time = sum(phases["step"])
+    return Measurement(
+        case=case,
+        steps=steps,
+        steps_per_second=steps / step_time if step_time else 0.0,
+        phases={
+            name: 1e6 * sum(times) / len(times)
+            for name, times in phases.items()
+            if times
+        },
+        peak_memory=peak,
+    )
+
+
+def measure_midgame(state: State, phases: Dict[str, List[float]]) -> None:
+    for _ in range(5):
+        with timed(phases, "set_board"):
+            state.set_board()
+    for snake in state.active_snakes:
+        for direction in Direction:
+            with timed(phases, "look"):
+                snake.snek.look(direction)
+
+    painter = get_painter()
+    if painter is not None:
+        for snake in state.active_snakes:
+            with timed(phases, "draw_snake"):
+                painter.draw_snake(snake.head, snake.body, True, snake.color)
+
+
+@functools.cache
+def get_painter():
+    headless = config.graphics.headless
+    try:
+        from sneks.engine.gui.graphics import Painter
+
+        config.graphics.headless = True
+        painter = Painter()
+        painter.initialize()
+        return painter
+    except Exception:
+        # pygame isn't installed, or there's no video driver
+        return None
+    finally:
+        config.graphics.headless = headless
+
+
+@contextlib.contextmanager
+def timed(phases: Dict[str, List[float]], name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    phases.setdefault(name, []).append(time.perf_counter() - start)
+
+
+def compare(
+    measurements: Sequence[Measurement],
+    baseline: Sequence[Measurement],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    :return: a description of each case that got slower, or used more memory,
+        than the baseline by more than the tolerance
+    """
+    previous = {m.case.key: m for m in baseline}
+    regressions = []
+    for measurement in measurements:
+        before = previous.get(measurement.case.key)
+        if before is None:
+            continue
+        if measurement.steps_per_second < before.steps_per_second * (1 - tolerance):
+            regressions.append(
+                f"{measurement.case.key}: {measurement.steps_per_second:.1f} steps/s,"
+                f" was {before.steps_per_second:.1f}"
+            )
+        if measurement.peak_memory > before.peak_memory * (1 + tolerance):
+            regressions.append(
+                f"{measurement.case.key}: {measurement.peak_memory} bytes peak,"
+                f" was {before.peak_memory}"
+            )
+    return regressions
+
+
+def format_table(measurements: Sequence[Measurement]) -> str:
+    phases = sorted({name for m in measurements for name in m.phases})
+    header = ["case", "steps", "steps/s", "peak KiB"] + [f"{p} us" for p in phases]
+    rows = [
+        [
+            m.case.key,
+            str(m.steps),
+            f"{m.steps_per_second:.1f}",
+            f"{m.peak_memory / 1024:.0f}",
+        ]
+        + [f"{m.phases[p]:.1f}" if p in m.phases else "" for p in phases]
+        for m in measurements
+    ]
+    return util.format_table(header, rows)
+
+
+def save(measurements: Sequence[Measurement], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump([dataclasses.asdict(m) for m in measurements], file, indent=2)
+
+
+def load(path: str) -> List[Measurement]:
+    with open(path) as file:
+        return [
+            Measurement(**{**m, "case": Case(**m["case"])}) for m in json.load(file)
+        ]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Sneks with typical behaviors, for measuring the engine with a realistic mix of
+submission costs.
+"""
+
+import random
+
+from sneks.engine.core.cell import Cell
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+class Avoider(Snek):
+    """
+    Picks a random direction that isn't immediately occupied.
+    """
+
+    def get_next_direction(self) -> Direction:
+        directions = [
+            direction
+            for direction in Direction
+            if self.get_head().get_neighbor(direction) not in self.get_occupied()
+        ]
+        return random.choice(directions or list(Direction))
+
+
+class Looker(Snek):
+    """
+    Heads in the direction with the most open space in a straight line.
+    """
+
+    def get_next_direction(self) -> Direction:
+        return max(Direction, key=self.look)
+
+
+class Seeker(Snek):
+    """
+    Travels towards a random destination, picking a new one once it's reached.
+    """
+
+    destination = Cell(0, 0)
+
+    def get_next_direction(self) -> Direction:
+        head = self.get_head()
+        if head.get_distance(self.destination) < 2:
+            self.destination = Cell(random.randint(-20, 20), random.randint(-20, 20))
+        direction = self.get_direction_to_destination(
+            self.destination,
+            [
+                direction
+                for direction in Direction
+                if head.get_neighbor(direction) not in self.get_occupied()
+            ]
+            or list(Direction),
+        )
+        # Cells are relative to the head, so the destination shifts as it moves
+        step = head.get_neighbor(direction)
+        self.destination = Cell(
+            self.destination.x - step.x, self.destination.y - step.y
+        )
+        return direction
+
+
+REFERENCE_SNEKS = {"avoider": Avoider, "looker": Looker, "seeker": Seeker}
@@ -1,10 +1,21 @@
 import math
 from dataclasses import dataclass
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from sneks.engine.config.instantiation import config
 from sneks.engine.core.direction import Direction
 
+# Enough to keep every neighbor of every cell on large boards cached
+NEIGHBOR_CACHE_SIZE = 2**18
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
 
 @dataclass(frozen=True)
 class Cell:
@@ -51,7 +62,7 @@ class Cell:
     def __hash__(self):
         return self._hash
 
-    @cache
+    @lru_cache(maxsize=NEIGHBOR_CACHE_SIZE)
     def get_relative_neighbor(self, x_offset: int, y_offset: int) -> "Cell":
         """
         Returns the cell with coordinates offset by the specified parameters.
@@ -70,6 +81,43 @@ class Cell:
             int(math.fmod((self.y + y_offset), config.game.rows)),
         )
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        """
+        Empties the caches of cells and their neighbors, which need to be
+        cleared when the board size changes, and frees their memory otherwise.
+        """
+        cls.__new__.cache_clear()  # type: ignore
+        cls.get_relative_neighbor.cache_clear()  # type: ignore
+        _get_distance_table.cache_clear()
+
+    @classmethod
+    def limit_caches(cls) -> bool:
+        """
+        Clears the caches when more cells are interned than
+        ``get_cell_limit()``. Cells are interned so a game can compare them by
+        identity, so this is only safe between games.
+
+        :return: whether the caches were cleared
+        """
+        if cls.__new__.cache_info().currsize > get_cell_limit():  # type: ignore
+            cls.clear_caches()
+            return True
+        return False
+
+    @classmethod
+    def get_cache_info(cls) -> Dict[str, CacheInfo]:
+        """
+        :return: the size and hit rate of each cache kept for cells
+        """
+        return {
+            "cells": CacheInfo(*cls.__new__.cache_info()),  # type: ignore
+            "neighbors": CacheInfo(
+                *cls.get_relative_neighbor.cache_info()  # type: ignore
+            ),
+            "distance_tables": CacheInfo(*_get_distance_table.cache_info()),
+        }
+
     def get_neighbor(self, direction: Direction) -> "Cell":
         """
         Gets a Cell's neighbor in the specified direction.
@@ -119,22 +167,45 @@ class Cell:
         :param other: cell to get distance to
         :return: distance between the two cells
         """
+        columns, rows = config.game.columns, config.game.rows
+        return _get_distance_table(columns, rows)[
+            ((self.y - other.y) % rows) * columns + (self.x - other.x) % columns
+        ]
 
-        # Get raw distance
-        x_distance = abs(self.x - other.x)
-        y_distance = abs(self.y - other.y)
+    def get_distances(self, others: Iterable["Cell"]) -> List[float]:
+        """
+        Gets the distances between this cell and each of the others, which is
+        faster than calling ``get_distance()`` for each of them.
 
-        # Determine if it's closer to go the other way
-        x_distance = (
-            x_distance
-            if x_distance < config.game.columns / 2
-            else config.game.columns - x_distance
-        )
-        y_distance = (
-            y_distance
-            if y_distance < config.game.rows / 2
-            else config.game.rows - y_distance
-        )
+        >>> Cell(0, 0).get_distances([Cell(1, 0), Cell(3, 4)])
+        [1.0, 5.0]
 
-        # Compute the distance
-        return math.sqrt(x_distance**2 + y_distance**2)
+        :param others: cells to get distances to
+        :return: distances to the cells, in the same order
+        """
+        columns, rows = config.game.columns, config.game.rows
+        table = _get_distance_table(columns, rows)
+        x, y = self.x, self.y
+        return [
+            table[((y - other.y) % rows) * columns + (x - other.x) % columns]
+            for other in others
+        ]
+
+
+def get_cell_limit() -> int:
+    """
+    The most cells the engine creates on the current board. Neighbors keep the
+    sign of their coordinates, so each can range across two boards.
+    """
+    return 4 * config.game.columns * config.game.rows
+
+
+@cache
+def _get_distance_table(columns: int, rows: int) -> Tuple[float, ...]:
+    # Distances for every wrapped offset, indexed by dy * columns + dx, going
+    # whichever way around the board is closer
+    return tuple(
+        math.sqrt(min(dx, columns - dx) ** 2 + min(dy, rows - dy) ** 2)
+        for dy in range(rows)
+        for dx in range(columns)
+    )
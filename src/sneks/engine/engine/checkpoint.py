@@ -0,0 +1,115 @@
+import os
+import pathlib
+import pickle
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from sneks.engine.config.definition import Config
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import registrar
+from sneks.engine.engine.mover import NormalizedScore
+from sneks.engine.engine.state import State
+
+CHECKPOINT_PATH = "checkpoint.pkl"
+
+
+@dataclass
+class Checkpoint:
+    runs: int
+    scores: List[NormalizedScore]
+    state: Optional[State]
+    random_state: Any
+    config: Config
+
+
+def main() -> Optional[List[NormalizedScore]]:
+    return resume()
+
+
+def resume(path: str = CHECKPOINT_PATH, **kwargs) -> Optional[List[NormalizedScore]]:
+    """
+    Continues the campaign saved at the path, taking the same arguments as
+    ``run``.
+    """
+    return run(path=path, resume=True, **kwargs)
+
+
+def run(
+    path: str = CHECKPOINT_PATH,
+    resume: bool = False,
+    interval_steps: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> Optional[List[NormalizedScore]]:
+    """
+    Plays ``config.runs`` games without graphics like ``runner.main``, saving a
+    checkpoint after every completed run so the campaign can be resumed. The
+    games played are the same whether or not the campaign was interrupted.
+
+    :param path: where to save the checkpoint
+    :param resume: whether to continue from the checkpoint at the path
+    :param interval_steps: also save the game in progress every this many steps
+    :param time_limit: seconds after which to save the game in progress and stop
+    :return: the scores of every run, or None when stopped by the time limit
+    """
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    checkpoint = load(path) if resume else None
+    if checkpoint is not None:
+        restore_config(checkpoint.config)
+        random.setstate(checkpoint.random_state)
+        runs, scores, state = checkpoint.runs, checkpoint.scores, checkpoint.state
+        print(f"resuming from run {runs}")
+    else:
+        runs, scores, state = 0, [], None
+
+    # Submissions must be loaded before a saved game, which references them
+    registrar.get_submission_classes()
+    if state is None:
+        state = State()
+        state.reset()
+
+    while runs < config.runs:
+        if state.should_continue(config.turn_limit):
+            state.step()
+            if deadline is not None and time.monotonic() > deadline:
+                save(path, Checkpoint(runs, scores, state, random.getstate(), config))
+                print(f"stopped at step {state.steps} of run {runs}")
+                return None
+            if interval_steps and state.steps % interval_steps == 0:
+                save(path, Checkpoint(runs, scores, state, random.getstate(), config))
+        else:
+            scores += state.report()
+            runs += 1
+            # Saved before the next game is set up, which draws from the
+            # random state, so resuming sets it up the same way
+            save(path, Checkpoint(runs, scores, None, random.getstate(), config))
+            state.reset()
+    return scores
+
+
+def save(path: str, checkpoint: Checkpoint) -> None:
+    partial = pathlib.Path(f"{path}.partial")
+    with open(partial, "wb") as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(partial, path)
+
+
+def load(path: str) -> Optional[Checkpoint]:
+    if not os.path.exists(path):
+        return None
+    # The saved game holds instances of the submitted sneks
+    registrar.get_submission_classes()
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def restore_config(saved: Config) -> None:
+    config.game = saved.game
+    config.runs = saved.runs
+    config.turn_limit = saved.turn_limit
+    config.registrar_submission_sneks = saved.registrar_submission_sneks
+
+
+if __name__ == "__main__":
+    main()
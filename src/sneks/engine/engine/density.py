@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import Dict, Iterable, List
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+
+
+class OccupancyTable:
+    """
+    Summed-area table of the occupied cells, shared by every snek for a step and
+    built the first time any snek asks for it. Afterwards the number of occupied
+    cells in any rectangle takes four lookups.
+    """
+
+    def __init__(self, occupied_at: Dict[Cell, int], steps: int):
+        # Only cells occupied before the step are visible, as more get added
+        # to the shared occupancy during the following steps
+        self.occupied_at = occupied_at
+        self.steps = steps
+        self.columns = config.game.columns
+        self.rows = config.game.rows
+
+    @cached_property
+    def sums(self) -> List[List[int]]:
+        """
+        ``sums[y][x]`` is the number of occupied cells with coordinates below x
+        and y on the board.
+        """
+        grid = [[0] * self.columns for _ in range(self.rows)]
+        for cell, step in self.occupied_at.items():
+            if step < self.steps:
+                grid[cell.y % self.rows][cell.x % self.columns] = 1
+        sums = [[0] * (self.columns + 1)]
+        for row in grid:
+            previous = sums[-1]
+            current = [0]
+            total = 0
+            for x, value in enumerate(row):
+                total += value
+                current.append(previous[x + 1] + total)
+            sums.append(current)
+        return sums
+
+    def get_prefix(self, x: int, y: int) -> int:
+        # The number of occupied cells below x and y when the board is repeated
+        # in every direction, which handles wrapping around the edges
+        qx, rx = divmod(x, self.columns)
+        qy, ry = divmod(y, self.rows)
+        sums = self.sums
+        return (
+            qx * qy * sums[self.rows][self.columns]
+            + qx * sums[ry][self.columns]
+            + qy * sums[self.rows][rx]
+            + sums[ry][rx]
+        )
+
+    def count(self, x0: int, y0: int, x1: int, y1: int) -> int:
+        """
+        Counts the occupied cells with x0 <= x <= x1 and y0 <= y <= y1, in board
+        coordinates that may go past the edges. The rectangle should be no
+        larger than the board.
+        """
+        if x1 < x0 or y1 < y0:
+            return 0
+        return (
+            self.get_prefix(x1 + 1, y1 + 1)
+            - self.get_prefix(x0, y1 + 1)
+            - self.get_prefix(x1 + 1, y0)
+            + self.get_prefix(x0, y0)
+        )
+
+
+class OccupancyView:
+    """
+    A snek's view of the shared occupancy table, in its frame of reference where
+    its head is at ``Cell(0, 0)``, limited to what it can see.
+    """
+
+    def __init__(self, table: OccupancyTable, head: Cell):
+        self.table = table
+        self.head = head
+
+    def count(self, corner: Cell, opposite: Cell) -> int:
+        # Matches the vision given to sneks, which spans -range to range - 1
+        low = -config.game.vision_range
+        high = config.game.vision_range - 1
+        x0, x1 = sorted((corner.x, opposite.x))
+        y0, y1 = sorted((corner.y, opposite.y))
+        x0, y0 = max(x0, low), max(y0, low)
+        x1 = min(x1, high, x0 + self.table.columns - 1)
+        y1 = min(y1, high, y0 + self.table.rows - 1)
+        return self.table.count(
+            self.head.x + x0, self.head.y + y0, self.head.x + x1, self.head.y + y1
+        )
+
+
+def get_standalone_view(occupied: Iterable[Cell]) -> OccupancyView:
+    """
+    Outside of a game, the table is built from the occupied cells the snek
+    sees, since that's all that's known.
+    """
+    return OccupancyView(OccupancyTable(dict.fromkeys(occupied, 0), 1), Cell(0, 0))
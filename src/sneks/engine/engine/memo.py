@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Dict, FrozenSet
+
+from sneks.engine.core.cell import Cell
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+MAX_SIZE = 4096
+
+
+class DecisionCache:
+    """
+    Least recently used cache of the directions a snek class chose for each
+    view of the board it was given.
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        self.max_size = max_size
+        self.entries: OrderedDict[FrozenSet[Cell], Direction] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_next_direction(self, snek: Snek) -> Direction:
+        key = snek.occupied
+        direction = self.entries.get(key)
+        if direction is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return direction
+        self.misses += 1
+        direction = snek.get_next_direction()
+        self.entries[key] = direction
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return direction
+
+
+# Shared by every snek of a class, since they all decide the same way
+_caches: Dict[type, DecisionCache] = {}
+
+
+def get_next_direction(snek: Snek) -> Direction:
+    """
+    Gets the snek's next direction, skipping the call when the snek has already
+    decided for the same view. Only used for sneks that set ``memoize``.
+    """
+    cache = _caches.get(type(snek))
+    if cache is None:
+        cache = _caches[type(snek)] = DecisionCache()
+    return cache.get_next_direction(snek)
+
+
+def get_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        f"{snek_class.__module__}.{snek_class.__qualname__}": dict(
+            hits=cache.hits, misses=cache.misses, size=len(cache.entries)
+        )
+        for snek_class, cache in _caches.items()
+    }
+
+
+def clear() -> None:
+    _caches.clear()
@@ -0,0 +1,163 @@
+"""
+Tracks memory between games, to find what keeps growing in long-lived
+processes. Set ``SNEKS_MEMORY`` to turn it on for the runner, which then
+samples memory at every ``State.reset`` and prints a report at the end.
+"""
+
+import itertools
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from sneks.engine import util
+from sneks.engine.core.cell import Cell, get_cell_limit
+from sneks.engine.engine.mover import Mover
+
+ENVIRONMENT_VARIABLE = "SNEKS_MEMORY"
+
+# Fraction memory can grow by from one game to the next before it's reported
+DEFAULT_THRESHOLD = 0.1
+# Games played before growth is reported, while caches fill up
+WARMUP_RUNS = 2
+# Allocation sites listed with each alert
+TOP_GROWTH = 5
+
+
+@dataclass(frozen=True)
+class Sample:
+    run: int
+    #: Bytes allocated at the end of the game
+    traced: int
+    #: Most bytes allocated at once during the game
+    peak: int
+    #: Entries in each of the Cell caches
+    cells: int
+    neighbors: int
+    #: Most cells that should be interned on the board
+    cell_limit: int
+    #: Mean bytes used by the bodies of the snakes, per cell of body
+    body_bytes: float
+
+
+@dataclass
+class Tracker:
+    threshold: float = DEFAULT_THRESHOLD
+    samples: List[Sample] = field(default_factory=list)
+    alerts: List[str] = field(default_factory=list)
+    snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+
+    def record(self, movers: Sequence[Mover]) -> Sample:
+        """
+        Samples memory at the end of a game, alerting when it grew by more than
+        the threshold since the previous one.
+        """
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        info = Cell.get_cache_info()
+        sample = Sample(
+            run=len(self.samples),
+            traced=traced,
+            peak=peak,
+            cells=info["cells"].currsize,
+            neighbors=info["neighbors"].currsize,
+            cell_limit=get_cell_limit(),
+            body_bytes=get_body_bytes(movers),
+        )
+        if sample.cells > sample.cell_limit:
+            self.report(
+                f"{sample.cells} cells interned after run {sample.run},"
+                f" over the limit of {sample.cell_limit}"
+            )
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        if self.samples and sample.run >= WARMUP_RUNS:
+            previous = self.samples[-1]
+            if traced > previous.traced * (1 + self.threshold):
+                self.alert(sample, previous, snapshot)
+        self.samples.append(sample)
+        self.snapshot = snapshot
+        return sample
+
+    def alert(
+        self, sample: Sample, previous: Sample, snapshot: tracemalloc.Snapshot
+    ) -> None:
+        lines = [
+            f"memory grew from {previous.traced} to {sample.traced} bytes"
+            f" after run {sample.run}"
+        ]
+        if self.snapshot is not None:
+            differences = snapshot.compare_to(self.snapshot, "lineno")
+            lines += [f"  {d}" for d in differences[:TOP_GROWTH]]
+        self.report("\n".join(lines))
+
+    def report(self, alert: str) -> None:
+        self.alerts.append(alert)
+        print(alert)
+
+    def format_table(self) -> str:
+        header = ["run", "traced KiB", "peak KiB", "cells", "neighbors", "body B/cell"]
+        rows = [
+            [
+                str(s.run),
+                f"{s.traced / 1024:.0f}",
+                f"{s.peak / 1024:.0f}",
+                str(s.cells),
+                str(s.neighbors),
+                f"{s.body_bytes:.1f}",
+            ]
+            for s in self.samples
+        ]
+        return util.format_table(header, rows)
+
+
+def get_body_bytes(movers: Sequence[Mover]) -> float:
+    """
+    The cells themselves are shared through the Cell cache, so only the
+    containers holding them count towards a body.
+    """
+    size = sum(sys.getsizeof(m.body) + sys.getsizeof(m.cells) for m in movers)
+    length = sum(len(m.body) for m in movers)
+    return size / length if length else 0.0
+
+
+_tracker: Optional[Tracker] = None
+
+
+def enable(threshold: float = DEFAULT_THRESHOLD) -> Tracker:
+    global _tracker
+    _tracker = Tracker(threshold=threshold)
+    _tracker.start()
+    return _tracker
+
+
+def disable() -> None:
+    global _tracker
+    if _tracker is not None:
+        _tracker.stop()
+    _tracker = None
+
+
+def get() -> Optional[Tracker]:
+    return _tracker
+
+
+def record(active: Sequence[Mover], ended: Sequence[Mover]) -> None:
+    """
+    Samples memory when tracking is enabled and a game was played.
+    """
+    if _tracker is not None and (active or ended):
+        _tracker.record(list(itertools.chain(active, ended)))
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):
+    enable()
@@ -1,8 +1,9 @@
+import time
 from dataclasses import dataclass
 from typing import Tuple
 
 from sneks.engine.core.cell import Cell
-from sneks.engine.engine import cells
+from sneks.engine.engine import cells, memo, profiler
 from sneks.engine.interface.snek import Snek
 
 
@@ -47,12 +48,24 @@ class Mover:
         self.age = 0
         self.color = color
         self.ended = 0
+        # Nanoseconds the last decision took
+        self.decision_time = 0
+        # Decisions are profiled separately for each kind of snek
+        self.decision_phase = (
+            f"decide {type(snek).__module__}.{type(snek).__qualname__}"
+        )
 
     def get_head(self) -> Cell:
         return self.head
 
     def move(self):
-        next_direction = self.snek.get_next_direction()
+        start = time.perf_counter_ns()
+        with profiler.phase(self.decision_phase):
+            if self.snek.memoize:
+                next_direction = memo.get_next_direction(self.snek)
+            else:
+                next_direction = self.snek.get_next_direction()
+        self.decision_time = time.perf_counter_ns() - start
         next_head = cells.get_absolute_neighbor(self.get_head(), next_direction)
         self.cells.add(next_head)
         self.body.append(next_head)
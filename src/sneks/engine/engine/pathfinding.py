@@ -0,0 +1,103 @@
+import heapq
+from typing import Dict, FrozenSet, List, Tuple
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+
+
+class Window:
+    """
+    The occupied cells a snek sees, laid out as a flat array covering its
+    vision. Sneks see offsets from ``-vision_range`` up to ``vision_range - 1``,
+    so that's all the grid covers, rather than treating unseen cells as free.
+    """
+
+    def __init__(self, occupied: FrozenSet[Cell]):
+        self.occupied = occupied
+        self.range = config.game.vision_range
+        self.size = 2 * self.range
+        self.grid = bytearray(self.size * self.size)
+        for cell in occupied:
+            x, y = self.normalize(cell)
+            if self.in_range(x, y):
+                self.grid[self.get_index(x, y)] = 1
+
+    def normalize(self, cell: Cell) -> Tuple[int, int]:
+        # Relative cells can be offset by whole boards, so take the offset
+        # closest to the head
+        columns, rows = config.game.columns, config.game.rows
+        return (
+            (cell.x + columns // 2) % columns - columns // 2,
+            (cell.y + rows // 2) % rows - rows // 2,
+        )
+
+    def in_range(self, x: int, y: int) -> bool:
+        return -self.range <= x < self.range and -self.range <= y < self.range
+
+    def get_index(self, x: int, y: int) -> int:
+        return (y + self.range) * self.size + x + self.range
+
+    def get_cell(self, index: int) -> Cell:
+        return Cell(index % self.size - self.range, index // self.size - self.range)
+
+
+class Pathfinder(Window):
+    """
+    Finds shortest paths from the head within a snek's vision, around occupied
+    cells. Paths are cached by destination, so a snek can ask about many
+    destinations in a step without redoing the work.
+    """
+
+    def __init__(self, occupied: FrozenSet[Cell]):
+        super().__init__(occupied)
+        self.paths: Dict[Tuple[int, int], List[Cell]] = {}
+
+    def get_path(self, destination: Cell) -> List[Cell]:
+        """
+        :return: the cells from the one after the head up to the destination,
+            or an empty list when it can't be reached within vision
+        """
+        target = self.normalize(destination)
+        if target not in self.paths:
+            self.paths[target] = self.search(*target)
+        return self.paths[target]
+
+    def search(self, x: int, y: int) -> List[Cell]:
+        if (x, y) == (0, 0) or not self.in_range(x, y):
+            return []
+        if self.grid[self.get_index(x, y)]:
+            return []
+
+        # A* with the Manhattan distance, which never overestimates on a grid
+        start = self.get_index(0, 0)
+        goal = self.get_index(x, y)
+        parents = {start: start}
+        costs = {start: 0}
+        frontier = [(abs(x) + abs(y), 0, 0, 0)]
+        while frontier:
+            _, cost, cx, cy = heapq.heappop(frontier)
+            index = self.get_index(cx, cy)
+            if index == goal:
+                break
+            if cost > costs[index]:
+                continue
+            for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+                if not self.in_range(nx, ny):
+                    continue
+                neighbor = self.get_index(nx, ny)
+                if self.grid[neighbor] or cost + 1 >= costs.get(neighbor, cost + 2):
+                    continue
+                costs[neighbor] = cost + 1
+                parents[neighbor] = index
+                estimate = cost + 1 + abs(x - nx) + abs(y - ny)
+                heapq.heappush(frontier, (estimate, cost + 1, nx, ny))
+        else:
+            return []
+
+        path = []
+        index = goal
+        while index != start:
+            path.append(self.get_cell(index))
+            index = parents[index]
+        path.reverse()
+        return path
@@ -0,0 +1,119 @@
+"""
+Times the phases of a game, to see where the engine spends its time and how
+much of it goes to the submissions themselves. Set ``SNEKS_PROFILE`` to the
+path of a JSON file to profile the runner and write the results there.
+
+While disabled, each phase only costs entering a shared ``nullcontext``.
+"""
+
+import contextlib
+import dataclasses
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+from sneks.engine import util
+
+ENVIRONMENT_VARIABLE = "SNEKS_PROFILE"
+
+_disabled = contextlib.nullcontext()
+
+
+@dataclass
+class Phase:
+    calls: int = 0
+    #: Seconds spent in the phase, including the phases nested within it
+    total: float = 0.0
+    #: Seconds spent in the phase itself
+    own: float = 0.0
+
+
+class Profiler:
+    def __init__(self):
+        # Nested phases are named by their path, like ``step/set_board``
+        self.phases: Dict[str, Phase] = {}
+        self.stack: List[str] = []
+        # Seconds spent in nested phases, for each phase on the stack
+        self.nested: List[float] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        path = f"{self.stack[-1]}/{name}" if self.stack else name
+        self.stack.append(path)
+        self.nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stack.pop()
+            nested = self.nested.pop()
+            if self.nested:
+                self.nested[-1] += elapsed
+            phase = self.phases.setdefault(path, Phase())
+            phase.calls += 1
+            phase.total += elapsed
+            phase.own += elapsed - nested
+
+    def format_table(self) -> str:
+        own = sum(phase.own for phase in self.phases.values()) or 1.0
+        header = ["phase", "calls", "total s", "own s", "own %", "mean us"]
+        rows = [
+            [
+                path,
+                str(phase.calls),
+                f"{phase.total:.3f}",
+                f"{phase.own:.3f}",
+                f"{100 * phase.own / own:.1f}",
+                f"{1e6 * phase.total / phase.calls:.1f}",
+            ]
+            for path, phase in sorted(
+                self.phases.items(), key=lambda item: item[1].total, reverse=True
+            )
+        ]
+        return util.format_table(header, rows, labelled=True)
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {name: dataclasses.asdict(p) for name, p in self.phases.items()},
+                file,
+                indent=2,
+            )
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable() -> Profiler:
+    """
+    Starts profiling from scratch.
+    """
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable() -> None:
+    global _profiler
+    _profiler = None
+
+
+def get() -> Optional[Profiler]:
+    return _profiler
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Times the enclosed block as the named phase, nested within any phase
+    that's already being timed.
+    """
+    if _profiler is None:
+        return _disabled
+    return _profiler.phase(name)
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):
+    enable()
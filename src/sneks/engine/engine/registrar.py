@@ -2,6 +2,7 @@ import importlib
 import importlib.util
 import pathlib
 import sys
+from collections.abc import Collection
 from dataclasses import dataclass
 from importlib.machinery import ModuleSpec
 from types import ModuleType
@@ -16,10 +17,12 @@ class Submission:
     snek: Snek
 
 
-def get_submissions() -> list[Submission]:
+def get_submissions(names: Collection[str] | None = None) -> list[Submission]:
     sneks: list[Submission] = []
     snek_classes = get_submission_classes()
     for name, snek in snek_classes.items():
+        if names is not None and name not in names:
+            continue
         if config.registrar_submission_sneks > 1:
             for i in range(config.registrar_submission_sneks):
                 sneks.append(Submission(f"{name}{i}", snek()))  # type: ignore
@@ -28,11 +31,36 @@ def get_submissions() -> list[Submission]:
     return sneks
 
 
+# Loaded classes keyed by the prefix and the state of the submission files,
+# so modules are only executed again when a submission changes
+_submission_classes: dict[tuple, dict[str, Snek]] = {}
+
+
 def get_submission_classes() -> dict[str, Snek]:
-    results = {}
-    submissions = set(
-        p.parent for p in pathlib.Path(config.registrar_prefix).glob("**/submission.py")
+    files = sorted(pathlib.Path(config.registrar_prefix).glob("**/submission.py"))
+    key = (
+        config.registrar_prefix,
+        tuple((str(f), f.stat().st_mtime_ns, f.stat().st_size) for f in files),
     )
+    if key not in _submission_classes:
+        _submission_classes.clear()
+        _submission_classes[key] = load_submission_classes(files)
+    return _submission_classes[key]
+
+
+def preload() -> list[str]:
+    """
+    Loads the submissions before forking workers, so every worker inherits
+    them instead of importing them again.
+
+    :return: the names of the submissions, sorted
+    """
+    return sorted(get_submission_classes())
+
+
+def load_submission_classes(files: list[pathlib.Path]) -> dict[str, Snek]:
+    results = {}
+    submissions = set(p.parent for p in files)
     for submission in submissions:
         name, snek = get_custom_snek(submission)
         if name is not None and snek is not None:
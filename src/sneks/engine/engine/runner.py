@@ -1,8 +1,22 @@
-from typing import List, Optional
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Collection, List, Optional, Sequence
 
 from sneks.engine.config.instantiation import config
+from sneks.engine.engine import memory, profiler, registrar, workers
 from sneks.engine.engine.mover import NormalizedScore
 from sneks.engine.engine.state import State
+from sneks.engine.engine.telemetry import Telemetry
+
+
+@dataclass(frozen=True)
+class Run:
+    seed: Optional[int]
+    scores: List[NormalizedScore]
+    steps: int
+    telemetry: Optional[Telemetry] = None
 
 
 def demo() -> None:
@@ -18,26 +32,52 @@ def demo() -> None:
     main()
 
 
-def main() -> Optional[List[NormalizedScore]]:
-    # import cProfile
-    # import pstats
-    #
-    # pr = cProfile.Profile()
-    # pr.enable()
+# Receives the scores of each completed run
+Sink = Callable[[List[NormalizedScore]], None]
+
+# Set to a directory to stream the scores of headless runs to a ScoreStore
+# there, which needs numpy, instead of keeping them in memory
+STORE_VARIABLE = "SNEKS_STORE"
+
+
+def main(sink: Optional[Sink] = None) -> Optional[List[NormalizedScore]]:
+    store = None
+    path = os.environ.get(STORE_VARIABLE)
+    if sink is None and path and not config.graphics.display:
+        from sneks.engine.engine.store import ScoreStore
+
+        sink = store = ScoreStore(path)
+
+    result = main2(sink=sink)
+
+    if store is not None:
+        # Covers every run in the store, including those of earlier campaigns
+        for aggregate in store.aggregate():
+            print(f"{aggregate.total():.4f} {aggregate}")
 
-    result = main2()
+    profile = profiler.get()
+    if profile is not None:
+        print(profile.format_table())
+        path = os.environ.get(profiler.ENVIRONMENT_VARIABLE)
+        if path:
+            profile.save(path)
 
-    # pr.disable()
-    # stats = pstats.Stats(pr)
-    # stats.sort_stats("tottime").print_stats(20)
+    tracker = memory.get()
+    if tracker is not None:
+        print(tracker.format_table())
 
     return result
 
 
-def main2() -> Optional[List[NormalizedScore]]:
+def main2(sink: Optional[Sink] = None) -> Optional[List[NormalizedScore]]:
+    """
+    Plays ``config.runs`` games. Without graphics, the scores of every run are
+    returned, unless a sink is given to stream them to instead.
+    """
     runs = 0
     state = State()
-    state.reset()
+    with profiler.phase("reset"):
+        state.reset()
     if config.graphics.display:
         from sneks.engine.gui.graphics import Painter
         from sneks.engine.gui.recorder import Recorder
@@ -48,41 +88,103 @@ def main2() -> Optional[List[NormalizedScore]]:
         painter = Painter(recorder=recorder)
         painter.initialize()
         while runs < config.runs:
-            painter.clear()
-            painter.draw_boarders()
-            for snake in state.active_snakes:
-                painter.draw_snake(snake.head, snake.body, True, snake.color)
-            for snake in state.ended_snakes:
-                painter.draw_snake(snake.head, snake.body, False, snake.color)
-            for snake in state.ended_snakes:
-                painter.draw_ended_head(snake.head)
-            painter.draw()
+            with profiler.phase("painting"):
+                painter.clear()
+                painter.draw_boarders()
+                for snake in state.active_snakes:
+                    painter.draw_snake(snake.head, snake.body, True, snake.color)
+                for snake in state.ended_snakes:
+                    painter.draw_snake(snake.head, snake.body, False, snake.color)
+                for snake in state.ended_snakes:
+                    painter.draw_ended_head(snake.head)
+                painter.draw()
             if state.should_continue(config.turn_limit):
-                state.step()
+                with profiler.phase("step"):
+                    state.step()
             else:
                 print(f"Run complete: {runs}")
                 if recorder is not None:
-                    recorder.animate_game()
-                    recorder.reset()
-                normalized = state.report()
+                    with profiler.phase("recording"):
+                        recorder.animate_game()
+                        recorder.reset()
+                with profiler.phase("report"):
+                    normalized = state.report()
                 for s in normalized:
                     print(f"{s.total():.4f} {s}")
                 painter.end_delay()
                 runs += 1
-                state.reset()
+                with profiler.phase("reset"):
+                    state.reset()
         return None
     else:
         scores = []
+        telemetry = Telemetry()
         while runs < config.runs:
             if state.should_continue(config.turn_limit):
-                state.step()
+                with profiler.phase("step"):
+                    step(state, telemetry)
             else:
-                scores += state.report()
-                state.reset()
+                with profiler.phase("report"):
+                    normalized = state.report()
+                if sink is not None:
+                    sink(normalized)
+                else:
+                    scores += normalized
+                with profiler.phase("reset"):
+                    state.reset()
                 runs += 1
                 if runs % (config.runs / 20) == 0:
-                    print("{}% complete".format(100 * runs / config.runs))
-        return scores
+                    steps = telemetry.steps
+                    print(
+                        "{}% complete, step p50 {:.0f}us p99 {:.0f}us "
+                        "max {:.0f}us".format(
+                            100 * runs / config.runs,
+                            steps.get_percentile(50) / 1000,
+                            steps.get_percentile(99) / 1000,
+                            steps.maximum / 1000,
+                        )
+                    )
+                    telemetry = Telemetry()
+        return scores if sink is None else None
+
+
+def run(seed: Optional[int] = None, names: Optional[Collection[str]] = None) -> Run:
+    """
+    Plays a single game without graphics, seeding the random state first so
+    a game can be reproduced from its seed.
+
+    :param names: the submissions to play, or all of them
+    """
+    if seed is not None:
+        random.seed(seed)
+    state = State()
+    state.reset(names)
+    telemetry = Telemetry()
+    while state.should_continue(config.turn_limit):
+        step(state, telemetry)
+    return Run(seed=seed, scores=state.report(), steps=state.steps, telemetry=telemetry)
+
+
+def step(state: State, telemetry: Telemetry) -> None:
+    movers = list(state.active_snakes)
+    start = time.perf_counter_ns()
+    state.step()
+    telemetry.record(
+        duration=time.perf_counter_ns() - start,
+        movers=movers,
+        active=len(state.active_snakes),
+        ended=len(state.ended_snakes),
+    )
+
+
+def run_games(
+    seeds: Sequence[Optional[int]], processes: Optional[int] = None
+) -> List[Run]:
+    """
+    Plays a game for each seed, spread across worker processes.
+    """
+    registrar.preload()
+    return workers.run(run, seeds, processes=processes)
 
 
 if __name__ == "__main__":
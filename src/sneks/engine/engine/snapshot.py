@@ -0,0 +1,194 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from sneks.engine.core.cell import Cell
+from sneks.engine.core.direction import Direction
+from sneks.engine.engine import cells
+
+if TYPE_CHECKING:
+    # Movers hold sneks, which fork branches of their own
+    from sneks.engine.engine.mover import Mover
+
+# Cells occupied, along with the step they became occupied at, and the step
+# before which entries are visible. Entries are only ever added, so a layer
+# is shared by everything that saw it up to that step.
+Layer = Tuple[Dict[Cell, int], int]
+
+# Name of the snek in a branch forked from its own view
+SELF = "self"
+
+
+@dataclass(frozen=True)
+class MoverSnapshot:
+    mover: "Mover"
+    length: int
+    head: Cell
+    age: int
+    ended: int
+    active: bool
+
+    @property
+    def name(self) -> str:
+        return self.mover.name
+
+    def get_body(self) -> List[Cell]:
+        # Bodies only grow, so the prefix is the body at the time of the snapshot
+        return self.mover.body[: self.length]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    A position in a game, sharing the bodies and occupancy of the game instead
+    of copying them, so taking one costs O(snakes). The game can carry on after
+    the snapshot without changing it.
+    """
+
+    steps: int
+    movers: Tuple[MoverSnapshot, ...]
+    layers: Tuple[Layer, ...]
+
+    @classmethod
+    def of(cls, state) -> "Snapshot":
+        return cls(
+            steps=state.steps,
+            movers=tuple(
+                MoverSnapshot(
+                    mover=mover,
+                    length=len(mover.body),
+                    head=mover.head,
+                    age=mover.age,
+                    ended=mover.ended,
+                    active=active,
+                )
+                for active, movers in (
+                    (True, state.active_snakes),
+                    (False, state.ended_snakes),
+                )
+                for mover in movers
+            ),
+            layers=((state.occupied_at, state.steps),),
+        )
+
+    def is_occupied(self, cell: Cell) -> bool:
+        return is_occupied(self.layers, cell)
+
+    def fork(self) -> "Branch":
+        """
+        Starts a branch from this position, to be stepped with chosen directions.
+        """
+        return Branch(
+            steps=self.steps,
+            heads={m.name: m.head for m in self.movers if m.active},
+            ages={m.name: m.age for m in self.movers},
+            layers=self.layers,
+        )
+
+
+class Branch:
+    """
+    A hypothetical continuation of a game. Only the cells occupied since the
+    branch started are stored by it, so forking it again costs O(snakes).
+    """
+
+    def __init__(
+        self,
+        steps: int,
+        heads: Dict[str, Cell],
+        ages: Dict[str, int],
+        layers: Tuple[Layer, ...],
+        get_neighbor: Callable[[Cell, Direction], Cell] = cells.get_absolute_neighbor,
+    ):
+        """
+        :param get_neighbor: gets the cell a head moves to, which wraps around
+            the board unless the branch is in a snek's frame of reference
+        """
+        self.steps = steps
+        self.heads = heads
+        self.ages = ages
+        self.ended: List[str] = []
+        self.layers = layers
+        self.occupied_at: Dict[Cell, int] = {}
+        self.get_neighbor = get_neighbor
+
+    @classmethod
+    def of_view(cls, occupied: FrozenSet[Cell]) -> "Branch":
+        """
+        Starts a branch from what a snek sees, in its frame of reference where
+        its head is at ``Cell(0, 0)``. Other sneks' heads can't be told apart
+        from their bodies, so only the snek itself moves, named ``SELF``, and
+        cells beyond its vision are taken to be free.
+        """
+        return cls(
+            steps=0,
+            heads={SELF: Cell(0, 0)},
+            ages={SELF: 0},
+            layers=((dict.fromkeys(occupied, -1), 0),),
+            get_neighbor=Cell.get_neighbor,
+        )
+
+    def is_occupied(self, cell: Cell) -> bool:
+        return cell in self.occupied_at or is_occupied(self.layers, cell)
+
+    def fork(self) -> "Branch":
+        branch = Branch(
+            steps=self.steps,
+            heads=dict(self.heads),
+            ages=dict(self.ages),
+            layers=self.layers + ((self.occupied_at, self.steps),),
+            get_neighbor=self.get_neighbor,
+        )
+        branch.ended = list(self.ended)
+        return branch
+
+    def step(self, directions: Mapping[str, Direction]) -> List[str]:
+        """
+        Moves every active snek in its given direction, following the same rules
+        as ``State.step``.
+
+        :param directions: the direction for each active snek, by name
+        :return: the names of the sneks that ended this step
+        """
+        for head in self.heads.values():
+            if not self.is_occupied(head):
+                self.occupied_at[head] = self.steps
+
+        self.heads = {
+            name: self.get_neighbor(head, directions[name])
+            for name, head in self.heads.items()
+        }
+        occupations = Counter(self.heads.values())
+        ended = [
+            name
+            for name, head in self.heads.items()
+            if self.is_occupied(head) or occupations[head] > 1
+        ]
+        for name in ended:
+            del self.heads[name]
+        self.ended += ended
+
+        for name in self.heads:
+            self.ages[name] += 1
+        self.steps += 1
+        return ended
+
+    def get_active(self) -> List[str]:
+        return list(self.heads)
+
+
+def is_occupied(layers: Tuple[Layer, ...], cell: Cell) -> bool:
+    for occupied_at, steps in layers:
+        step: Optional[int] = occupied_at.get(cell)
+        if step is not None and step < steps:
+            return True
+    return False
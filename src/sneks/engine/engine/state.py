@@ -2,12 +2,15 @@ import itertools
 import random
 from collections import Counter
 from operator import methodcaller
-from typing import FrozenSet, List, Set
+from typing import Collection, Dict, FrozenSet, List, Optional, Set
 
 from sneks.engine.config.instantiation import config
 from sneks.engine.core.cell import Cell
-from sneks.engine.engine import cells, registrar
+from sneks.engine.engine import cells, memory, profiler, registrar
+from sneks.engine.engine.density import OccupancyTable, OccupancyView
 from sneks.engine.engine.mover import Mover, NormalizedScore, Score
+from sneks.engine.engine.snapshot import Snapshot
+from sneks.engine.engine.territory import Territory, TerritoryView
 
 
 class State:
@@ -22,13 +25,19 @@ class State:
         self.ended_snakes: List[Mover] = []
         self.steps: int = 0
         self.occupied: set[Cell] = set()
+        # The step each occupied cell was added at, which lets snapshots share it
+        self.occupied_at: Dict[Cell, int] = {}
 
-    def reset(self):
+    def reset(self, names: Optional[Collection[str]] = None):
+        memory.record(self.active_snakes, self.ended_snakes)
+        # Between games is the only time cells can safely be interned anew
+        Cell.limit_caches()
         self.steps = 0
         self.active_snakes = []
         self.ended_snakes = []
         self.occupied = set()
-        sneks = registrar.get_submissions()
+        self.occupied_at = {}
+        sneks = registrar.get_submissions(names)
         sneks.sort(key=lambda s: s.name)
         color_index = 0
         color_index_delta = max(len(config.graphics.colors.snake) // len(sneks), 1)
@@ -100,8 +109,11 @@ class State:
             return frozenset().union(*(s.cells for s in snakes))
 
     def set_board(self):
-        for current_snake in self.active_snakes:
+        territory = Territory(heads=[s.get_head() for s in self.active_snakes])
+        table = OccupancyTable(occupied_at=self.occupied_at, steps=self.steps)
+        for owner, current_snake in enumerate(self.active_snakes):
             head = current_snake.get_head()
+            current_snake.snek.density = OccupancyView(table, head)
 
             # build a grid around the head based on the vision range
             grid = {
@@ -123,6 +135,9 @@ class State:
                 cells.get_relative_to(cell, head)
                 for cell in grid.intersection(self.occupied)
             )
+            current_snake.snek.territory = TerritoryView(
+                territory, owner, current_snake.snek.occupied
+            )
 
     def should_continue(self, turn_limit):
         return self.steps < turn_limit and self.active_snakes
@@ -131,29 +146,42 @@ class State:
         self.active_snakes.remove(snake)
         self.ended_snakes.append(snake)
 
-    def step(self):
-        # add previous head to occupied
-        self.occupied |= {s.get_head() for s in self.active_snakes}
-
-        # move the heads
-        for snake in self.active_snakes:
-            snake.move()
-
-        occupations = Counter(s.get_head() for s in self.active_snakes)
+    def snapshot(self) -> Snapshot:
+        """
+        Captures the current position without copying the board, to fork
+        hypothetical continuations from.
+        """
+        return Snapshot.of(self)
 
-        to_end = []
-        # determine ended snakes
-        for snake in self.active_snakes:
-            if snake.get_head() in self.occupied:
-                to_end.append(snake)
-            elif occupations[snake.get_head()] > 1:
-                to_end.append(snake)
-
-        for snake in to_end:
-            self.end_snake(snake)
+    def step(self):
+        with profiler.phase("heads"):
+            # add previous head to occupied
+            heads = {s.get_head() for s in self.active_snakes}
+            for head in heads.difference(self.occupied):
+                self.occupied_at[head] = self.steps
+            self.occupied |= heads
+
+            # move the heads
+            for snake in self.active_snakes:
+                snake.move()
+
+        with profiler.phase("collisions"):
+            occupations = Counter(s.get_head() for s in self.active_snakes)
+
+            to_end = []
+            # determine ended snakes
+            for snake in self.active_snakes:
+                if snake.get_head() in self.occupied:
+                    to_end.append(snake)
+                elif occupations[snake.get_head()] > 1:
+                    to_end.append(snake)
+
+            for snake in to_end:
+                self.end_snake(snake)
 
         for snake in self.active_snakes:
             snake.age += 1
 
-        self.set_board()
         self.steps += 1
+        with profiler.phase("set_board"):
+            self.set_board()
@@ -0,0 +1,135 @@
+import json
+import os
+import pathlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+from sneks.engine.engine.mover import NormalizedScore
+
+# Each column is a flat file of fixed width little endian values
+COLUMNS = {
+    "run": "<i8",
+    "name": "<i4",
+    "age": "<i8",
+    "ended": "<i8",
+    "age_normalized": "<f8",
+    "ended_normalized": "<f8",
+}
+NAMES_FILE = "names.json"
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    name: str
+    runs: int
+    age: float
+    ended: float
+    age_normalized: float
+    ended_normalized: float
+
+    def total(self) -> float:
+        return self.age_normalized + self.ended_normalized
+
+
+class ScoreStore:
+    """
+    Appends the scores of each run to columns on disk, so long campaigns don't
+    keep every score in memory. Names are stored once, in a dictionary, and
+    referenced by index. Reading goes through memory maps.
+
+    Requires numpy, from the ``extra`` dependencies.
+    """
+
+    def __init__(self, path: str):
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for the score store")
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        names_path = self.path / NAMES_FILE
+        self.names: List[str] = (
+            json.loads(names_path.read_text()) if names_path.exists() else []
+        )
+        self.indices: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        runs = self.column("run")
+        self.runs = int(runs.max()) + 1 if len(runs) else 0
+
+    def __len__(self) -> int:
+        return len(self.column("run"))
+
+    def append(self, scores: List[NormalizedScore]) -> None:
+        """
+        Appends the scores of a single run, which is given the next run id.
+        """
+        new_names = [s.raw.name for s in scores if s.raw.name not in self.indices]
+        if new_names:
+            for name in new_names:
+                self.indices[name] = len(self.names)
+                self.names.append(name)
+            # The dictionary is written before the rows that refer to it
+            partial = self.path / f"{NAMES_FILE}.partial"
+            partial.write_text(json.dumps(self.names))
+            os.replace(partial, self.path / NAMES_FILE)
+
+        values = dict(
+            run=[self.runs] * len(scores),
+            name=[self.indices[s.raw.name] for s in scores],
+            age=[s.raw.age for s in scores],
+            ended=[s.raw.ended for s in scores],
+            age_normalized=[s.age for s in scores],
+            ended_normalized=[s.ended for s in scores],
+        )
+        for column, dtype in COLUMNS.items():
+            with open(self.path / f"{column}.bin", "ab") as file:
+                np.asarray(values[column], dtype=dtype).tofile(file)
+        self.runs += 1
+
+    def __call__(self, scores: List[NormalizedScore]) -> None:
+        self.append(scores)
+
+    def column(self, column: str) -> "np.ndarray":
+        """
+        Maps a column read only, without loading it into memory.
+        """
+        dtype = np.dtype(COLUMNS[column])
+        path = self.path / f"{column}.bin"
+        size = path.stat().st_size if path.exists() else 0
+        if size < dtype.itemsize:
+            return np.empty(0, dtype=dtype)
+        # Ignore any partially written trailing value
+        return np.memmap(path, dtype=dtype, mode="r", shape=(size // dtype.itemsize,))
+
+    def aggregate(self) -> List[Aggregate]:
+        """
+        Averages every column by name.
+
+        :return: the aggregates, best normalized total first
+        """
+        rows = min(len(self.column(column)) for column in COLUMNS)
+        names = self.column("name")[:rows]
+        counts = np.bincount(names, minlength=len(self.names))
+        means = {
+            column: np.bincount(
+                names, weights=self.column(column)[:rows], minlength=len(self.names)
+            )
+            / np.maximum(counts, 1)
+            for column in ("age", "ended", "age_normalized", "ended_normalized")
+        }
+        aggregates = [
+            Aggregate(
+                name=name,
+                runs=int(counts[i]),
+                age=float(means["age"][i]),
+                ended=float(means["ended"][i]),
+                age_normalized=float(means["age_normalized"][i]),
+                ended_normalized=float(means["ended_normalized"][i]),
+            )
+            for i, name in enumerate(self.names)
+            if counts[i]
+        ]
+        aggregates.sort(key=lambda a: a.total(), reverse=True)
+        return aggregates
@@ -0,0 +1,170 @@
+import contextlib
+import csv
+import dataclasses
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+from sneks.engine.engine import memo, registrar, runner, workers
+
+# The settings a variant can change, from ``Game`` or ``Config`` itself
+GAME_PARAMETERS = ("rows", "columns", "vision_range")
+CONFIG_PARAMETERS = ("turn_limit", "registrar_submission_sneks")
+
+Variant = Dict[str, int]
+
+
+@dataclass(frozen=True)
+class Result:
+    variant: int
+    rows: int
+    columns: int
+    vision_range: int
+    turn_limit: int
+    registrar_submission_sneks: int
+    seed: int
+    steps: int
+    name: str
+    age: int
+    ended: int
+    age_normalized: float
+    ended_normalized: float
+
+
+def main() -> None:
+    config.graphics.display = False
+    variants = get_grid(
+        rows=[30, 60],
+        columns=[45, 90],
+        vision_range=[10, 20],
+        turn_limit=[config.turn_limit],
+    )
+    results = run_sweep(variants, seeds=range(config.runs))
+    write(results, "sweep.csv")
+    print(f"wrote {len(results)} results for {len(variants)} variants to sweep.csv")
+
+
+def get_grid(**values: Sequence[int]) -> List[Variant]:
+    """
+    Builds a variant for every combination of the given values, like:
+
+    >>> get_grid(rows=[30, 60], turn_limit=[1000])
+    [{'rows': 30, 'turn_limit': 1000}, {'rows': 60, 'turn_limit': 1000}]
+    """
+    check(values)
+    return [
+        dict(zip(values, combination))
+        for combination in itertools.product(*values.values())
+    ]
+
+
+def get_sample(
+    count: int, seed: Optional[int] = None, **values: Sequence[int]
+) -> List[Variant]:
+    """
+    Draws ``count`` variants, picking each setting at random from its values.
+    """
+    check(values)
+    rng = random.Random(seed)
+    return [
+        {name: rng.choice(options) for name, options in values.items()}
+        for _ in range(count)
+    ]
+
+
+def check(values: Dict[str, Sequence[int]]) -> None:
+    unknown = set(values).difference(GAME_PARAMETERS + CONFIG_PARAMETERS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters: {sorted(unknown)}")
+
+
+def run_sweep(
+    variants: Sequence[Variant],
+    seeds: Sequence[int],
+    processes: Optional[int] = None,
+) -> List[Result]:
+    """
+    Plays every seed for every variant across worker processes. Each item
+    carries its variant, which is applied to the config within a forked
+    worker, even for a single process, so the parent's config is left as is.
+    """
+    registrar.preload()
+    items = [(i, variant, seed) for i, variant in enumerate(variants) for seed in seeds]
+    return list(
+        itertools.chain.from_iterable(workers.run(play, items, processes, fork=True))
+    )
+
+
+def play(item: Tuple[int, Variant, int]) -> List[Result]:
+    index, variant, seed = item
+    with applied(variant):
+        run = runner.run(seed=seed)
+        return [
+            Result(
+                variant=index,
+                rows=config.game.rows,
+                columns=config.game.columns,
+                vision_range=config.game.vision_range,
+                turn_limit=config.turn_limit,
+                registrar_submission_sneks=config.registrar_submission_sneks,
+                seed=seed,
+                steps=run.steps,
+                name=score.raw.name,
+                age=score.raw.age,
+                ended=score.raw.ended,
+                age_normalized=score.age,
+                ended_normalized=score.ended,
+            )
+            for score in run.scores
+        ]
+
+
+@contextlib.contextmanager
+def applied(variant: Variant) -> Iterator[None]:
+    """
+    Applies the variant to the config, restoring the previous settings after.
+    Cells cache their hash and neighbors using the board size, so those caches
+    are cleared whenever it changes.
+    """
+    game = config.game
+    previous = {name: getattr(config, name) for name in CONFIG_PARAMETERS}
+    config.game = dataclasses.replace(
+        game, **{k: v for k, v in variant.items() if k in GAME_PARAMETERS}
+    )
+    for name, value in variant.items():
+        if name in CONFIG_PARAMETERS:
+            setattr(config, name, value)
+    resized = (config.game.rows, config.game.columns) != (game.rows, game.columns)
+    if resized:
+        clear_cell_caches()
+    try:
+        yield
+    finally:
+        config.game = game
+        for name, value in previous.items():
+            setattr(config, name, value)
+        if resized:
+            clear_cell_caches()
+
+
+def clear_cell_caches() -> None:
+    Cell.clear_caches()
+    # Views are keyed by cells, which compare differently on another board
+    memo.clear()
+
+
+def write(results: Sequence[Result], path: str) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(
+            file, fieldnames=[field.name for field in dataclasses.fields(Result)]
+        )
+        writer.writeheader()
+        for result in results:
+            writer.writerow(dataclasses.asdict(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+from sneks.engine.engine.mover import Mover
+
+# Buckets per doubling, which keeps each bucket within 9% of its values
+SUB_BUCKETS = 8
+
+
+@dataclass
+class Histogram:
+    """
+    Counts of nanosecond durations in logarithmic buckets, so the memory used
+    doesn't grow with the number of values while the relative error stays
+    bounded across the whole range.
+    """
+
+    counts: Dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+    maximum: int = 0
+
+    @staticmethod
+    def get_bucket(value: int) -> int:
+        return int(math.log2(value) * SUB_BUCKETS) if value > 1 else 0
+
+    @staticmethod
+    def get_upper_bound(bucket: int) -> int:
+        return math.ceil(2 ** ((bucket + 1) / SUB_BUCKETS))
+
+    def record(self, value: int) -> None:
+        bucket = self.get_bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: "Histogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def get_percentile(self, percentile: float) -> int:
+        """
+        :param percentile: between 0 and 100
+        :return: an upper bound on the value at the percentile, or 0 when empty
+        """
+        rank = math.ceil(self.count * percentile / 100)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.get_upper_bound(bucket), self.maximum)
+        return self.maximum
+
+    def get_buckets(self) -> List[Tuple[int, int]]:
+        """
+        :return: the upper bound and count of each non-empty bucket, in order
+        """
+        return [
+            (min(self.get_upper_bound(bucket), self.maximum), self.counts[bucket])
+            for bucket in sorted(self.counts)
+        ]
+
+
+@dataclass
+class Telemetry:
+    """
+    What happened during each step of a game and how long it took.
+    """
+
+    steps: Histogram = field(default_factory=Histogram)
+    decisions: Histogram = field(default_factory=Histogram)
+    #: Active and ended snakes after each step
+    active: List[int] = field(default_factory=list)
+    ended: List[int] = field(default_factory=list)
+
+    def record(
+        self, duration: int, movers: Sequence[Mover], active: int, ended: int
+    ) -> None:
+        """
+        :param duration: nanoseconds the step took
+        :param movers: the snakes that moved during the step
+        :param active: the number of active snakes after the step
+        :param ended: the number of ended snakes after the step
+        """
+        self.steps.record(duration)
+        for mover in movers:
+            self.decisions.record(mover.decision_time)
+        self.active.append(active)
+        self.ended.append(ended)
@@ -0,0 +1,142 @@
+from collections import deque
+from functools import cache, cached_property
+from typing import FrozenSet, List, Tuple
+
+from sneks.engine.core.cell import Cell
+from sneks.engine.engine import cells
+from sneks.engine.engine.pathfinding import Window
+
+# Owners of cells that aren't reachable, or that several heads reach first
+UNOWNED = -1
+CONTESTED = -2
+# The snek itself, with the other heads it sees numbered after it
+OWN = 0
+
+
+@cache
+def get_neighbors(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    The indices of the neighbors of each index on a flattened square window,
+    which doesn't wrap around its edges since nothing is seen past them.
+    """
+    return tuple(
+        tuple(
+            ny * size + nx
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+            if 0 <= nx < size and 0 <= ny < size
+        )
+        for y in range(size)
+        for x in range(size)
+    )
+
+
+class Territory:
+    """
+    The heads of the active sneks for a step, shared by the views of every snek.
+    """
+
+    def __init__(self, heads: List[Cell]):
+        self.heads = heads
+
+
+class TerritoryView:
+    """
+    A snek's view of the territory, in its frame of reference where its head is
+    at ``Cell(0, 0)``, limited to what it can see. Searches stay within its
+    vision, going around the occupied cells it sees and racing only the heads
+    within it, and each runs the first time the snek asks for it.
+    """
+
+    def __init__(self, territory: Territory, owner: int, occupied: FrozenSet[Cell]):
+        self.territory = territory
+        self.owner = owner
+        self.occupied = occupied
+
+    @cached_property
+    def window(self) -> Window:
+        return Window(self.occupied)
+
+    @cached_property
+    def sources(self) -> List[int]:
+        """
+        The indices of the snek's own head, followed by the other heads it sees.
+        """
+        head = self.territory.heads[self.owner]
+        sources = [self.window.get_index(0, 0)]
+        for owner, other in enumerate(self.territory.heads):
+            x, y = self.window.normalize(cells.get_relative_to(other, head))
+            if owner != self.owner and self.window.in_range(x, y):
+                sources.append(self.window.get_index(x, y))
+        return sources
+
+    @cached_property
+    def owners(self) -> List[int]:
+        """
+        The head that reaches each cell first, searching from every head at
+        once and around occupied cells.
+        """
+        grid = self.window.grid
+        owners = [UNOWNED] * len(grid)
+        distances = [0 if occupied else -1 for occupied in grid]
+        queue: deque[int] = deque()
+        for owner, index in enumerate(self.sources):
+            owners[index] = owner
+            distances[index] = 0
+            queue.append(index)
+
+        neighbors = get_neighbors(self.window.size)
+        while queue:
+            index = queue.popleft()
+            owner = owners[index]
+            distance = distances[index] + 1
+            for neighbor in neighbors[index]:
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distance
+                    owners[neighbor] = owner
+                    queue.append(neighbor)
+                elif distances[neighbor] == distance and owners[neighbor] != owner:
+                    owners[neighbor] = CONTESTED
+        return owners
+
+    @cached_property
+    def obstacle_distances(self) -> List[int]:
+        """
+        The number of moves from each cell to the nearest occupied cell,
+        searching from every occupied cell at once. Cells that can't reach one
+        are given more moves than any path within vision takes.
+        """
+        grid = self.window.grid
+        limit = len(grid)
+        distances = [limit] * len(grid)
+        queue = deque(index for index, occupied in enumerate(grid) if occupied)
+        for index in queue:
+            distances[index] = 0
+
+        neighbors = get_neighbors(self.window.size)
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for neighbor in neighbors[index]:
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return distances
+
+    def get_size(self) -> int:
+        # The head is owned too, but isn't free
+        return self.owners.count(OWN) - 1
+
+    def get_obstacle_distance(self, cell: Cell) -> int:
+        x, y = self.window.normalize(cell)
+        if not self.window.in_range(x, y):
+            # Nothing is known about cells beyond vision
+            return 0
+        return self.obstacle_distances[self.window.get_index(x, y)]
+
+
+def get_standalone_view(occupied: FrozenSet[Cell]) -> TerritoryView:
+    """
+    Outside of a game, no other heads are known, so the snek has every cell it
+    reaches to itself.
+    """
+    return TerritoryView(Territory(heads=[Cell(0, 0)]), 0, occupied)
@@ -0,0 +1,183 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import registrar, runner, workers
+
+RANDOM = "random"
+SWISS = "swiss"
+ROUND_ROBIN = "round-robin"
+GROUPINGS = (RANDOM, SWISS, ROUND_ROBIN)
+
+
+@dataclass(frozen=True)
+class Match:
+    seed: int
+    names: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Standing:
+    name: str
+    age: float
+    ended: float
+    games: int
+
+    def total(self) -> float:
+        return self.age + self.ended
+
+
+def main() -> None:
+    config.graphics.display = False
+    for standing in run_tournament(rounds=config.runs):
+        print(f"{standing.total():.4f} {standing}")
+
+
+def run_tournament(
+    rounds: int = 3,
+    group_size: int = 8,
+    grouping: str = RANDOM,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> List[Standing]:
+    """
+    Plays the submissions in sub-arenas of around ``group_size`` each round,
+    instead of putting the whole field onto one board. The arenas of a round
+    are played in parallel.
+
+    :param rounds: the number of rounds, where each submission plays once
+    :param group_size: the largest number of submissions in an arena
+    :param grouping: how submissions are grouped into arenas each round. Random
+        draws new groups every round, swiss groups submissions with similar
+        standings after the first round, and round-robin rotates the groups so
+        every submission meets every other one
+    :param seed: seeds the grouping and the games, for a reproducible tournament
+    :param processes: the number of worker processes
+    :return: the standings of each submission, best first
+    """
+    if grouping not in GROUPINGS:
+        raise ValueError(f"grouping must be one of {', '.join(GROUPINGS)}")
+    rng = random.Random(seed)
+    names = registrar.preload()
+    runs: List[runner.Run] = []
+    standings: List[Standing] = []
+    for i in range(rounds):
+        if grouping == SWISS and standings:
+            groups = get_swiss_groups(rank(standings, names), group_size)
+        elif grouping == ROUND_ROBIN:
+            groups = get_round_robin_groups(names, group_size, i)
+        else:
+            groups = get_random_groups(names, group_size, rng)
+        matches = [Match(rng.randrange(2**31), tuple(group)) for group in groups]
+        runs += workers.run(play, matches, processes=processes)
+        standings = combine(runs, names)
+    return standings
+
+
+def get_random_groups(
+    names: Sequence[str], group_size: int, rng: random.Random
+) -> List[List[str]]:
+    """
+    Shuffles the names into the fewest groups of at most ``group_size``, with
+    group sizes differing by at most one.
+    """
+    shuffled = list(names)
+    rng.shuffle(shuffled)
+    return split(shuffled, group_size)
+
+
+def get_swiss_groups(ranking: Sequence[str], group_size: int) -> List[List[str]]:
+    """
+    Groups neighbours in the ranking, so each arena is evenly matched.
+    """
+    return split(ranking, group_size)
+
+
+def get_round_robin_groups(
+    names: Sequence[str], group_size: int, number: int
+) -> List[List[str]]:
+    """
+    Splits the names into blocks of half a group and pairs the blocks up using
+    the circle method, so within ``len(blocks) - 1`` rounds every submission
+    shares an arena with every other one. Later rounds repeat the cycle.
+    """
+    if len(names) <= group_size:
+        return [list(names)]
+    blocks = split(names, max(group_size // 2, 1))
+    if len(blocks) % 2:
+        blocks.append([])
+    count = len(blocks)
+    # The first block stays in place while the others rotate around it
+    shift = number % (count - 1)
+    rotated = [blocks[0]] + [
+        blocks[1 + (i + shift) % (count - 1)] for i in range(count - 1)
+    ]
+    return [rotated[i] + rotated[count - 1 - i] for i in range(count // 2)]
+
+
+def rank(standings: Sequence[Standing], names: Sequence[str]) -> List[str]:
+    """
+    Ranks the submissions by their standings, with those yet to play last.
+    """
+    totals = {standing.name: standing.total() for standing in standings}
+    return sorted(names, key=lambda name: totals.get(name, -math.inf), reverse=True)
+
+
+def get_owners(names: Sequence[str]) -> Dict[str, str]:
+    """
+    Maps the name of each snek to its submission, since each submission plays
+    several sneks when ``registrar_submission_sneks`` is above one.
+    """
+    if config.registrar_submission_sneks > 1:
+        return {
+            f"{name}{i}": name
+            for name in names
+            for i in range(config.registrar_submission_sneks)
+        }
+    return {name: name for name in names}
+
+
+def split(names: Sequence[str], group_size: int) -> List[List[str]]:
+    count = math.ceil(len(names) / group_size)
+    base, remainder = divmod(len(names), count) if count else (0, 0)
+    groups = []
+    start = 0
+    for i in range(count):
+        end = start + base + (1 if i < remainder else 0)
+        groups.append(list(names[start:end]))
+        start = end
+    return groups
+
+
+def play(match: Match) -> runner.Run:
+    return runner.run(seed=match.seed, names=match.names)
+
+
+def combine(runs: Iterable[runner.Run], names: Sequence[str]) -> List[Standing]:
+    """
+    Combines the arenas into one leaderboard. Scores are normalized within each
+    arena by ``State.report``, so they're comparable across arenas of different
+    sizes and averaged per submission, over all of its sneks.
+    """
+    owners = get_owners(names)
+    totals: Dict[str, Tuple[float, float, int]] = {}
+    games: Dict[str, int] = {}
+    for run in runs:
+        for score in run.scores:
+            name = owners[score.raw.name]
+            age, ended, count = totals.get(name, (0.0, 0.0, 0))
+            totals[name] = (age + score.age, ended + score.ended, count + 1)
+        for name in {owners[score.raw.name] for score in run.scores}:
+            games[name] = games.get(name, 0) + 1
+    standings = [
+        Standing(name=name, age=age / count, ended=ended / count, games=games[name])
+        for name, (age, ended, count) in totals.items()
+    ]
+    standings.sort(key=lambda s: s.total(), reverse=True)
+    return standings
+
+
+if __name__ == "__main__":
+    main()
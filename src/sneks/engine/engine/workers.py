@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import random
+import traceback
+from multiprocessing.connection import Connection
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run(
+    function: Callable[[T], R],
+    items: Sequence[T],
+    processes: Optional[int] = None,
+    fork: bool = False,
+) -> List[R]:
+    """
+    Applies the function to each item across forked worker processes and returns
+    the results in order. Workers inherit everything already loaded by the parent,
+    like imported submissions.
+
+    Only pipes are used to communicate, since the semaphores that ``Pool`` and
+    ``ProcessPoolExecutor`` rely on aren't available in AWS Lambda.
+
+    :param fork: whether to fork even for a single process, so the function can
+        change global state like the config without it reaching the parent
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(items))
+    if processes <= 1 and not (fork and items):
+        return [function(item) for item in items]
+    processes = max(processes, 1)
+
+    context = multiprocessing.get_context("fork")
+    workers = []
+    for i in range(processes):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=work, args=(function, items[i::processes], sender)
+        )
+        process.start()
+        sender.close()
+        workers.append((process, receiver))
+
+    results: List[R] = [None] * len(items)  # type: ignore
+    errors = []
+    for i, (process, receiver) in enumerate(workers):
+        try:
+            succeeded, payload = receiver.recv()
+        except EOFError:
+            succeeded, payload = False, "worker exited without a result"
+        process.join()
+        if succeeded:
+            results[i::processes] = payload
+        else:
+            errors.append(payload)
+    if errors:
+        raise RuntimeError("\n".join(errors))
+    return results
+
+
+def work(function: Callable[[T], R], items: Sequence[T], connection: Connection):
+    # Forked workers share the parent's random state, so give each its own
+    random.seed()
+    try:
+        connection.send((True, [function(item) for item in items]))
+    except BaseException:
+        connection.send((False, traceback.format_exc()))
+    finally:
+        connection.close()
@@ -4,6 +4,7 @@ import struct
 import sys
 
 from sneks.engine.core.cell import Cell
+from sneks.engine.engine import profiler
 from sneks.engine.engine.cells import get_relative_to
 
 try:
@@ -202,8 +203,10 @@ class Painter:
                 sys.exit()
         pygame.display.flip()
         if self.recorder:
-            self.recorder.record_frame(self.screen)
-        self.step_delay()
+            with profiler.phase("recording"):
+                self.recorder.record_frame(self.screen)
+        with profiler.phase("delay"):
+            self.step_delay()
 
     def step_delay(self):
         if not config.graphics.headless:
@@ -1,9 +1,13 @@
 import abc
-from typing import FrozenSet, Sequence
+from typing import FrozenSet, List, Optional, Sequence
 
 from sneks.engine.config.instantiation import config
 from sneks.engine.core.cell import Cell
 from sneks.engine.core.direction import Direction
+from sneks.engine.engine import density as occupancy
+from sneks.engine.engine.pathfinding import Pathfinder
+from sneks.engine.engine.snapshot import SELF, Branch
+from sneks.engine.engine.territory import TerritoryView, get_standalone_view
 
 
 class Snek(abc.ABC):
@@ -16,6 +20,15 @@ class Snek(abc.ABC):
     head: Cell = Cell(0, 0)
     #: Set of currently occupied cells on the game board
     occupied: FrozenSet[Cell] = frozenset()
+    #: Analysis of what the snek sees, set by the engine each step
+    territory: Optional[TerritoryView] = None
+    #: Occupancy counts shared by all sneks, set by the engine each step
+    density: Optional[occupancy.OccupancyView] = None
+    #: Set to ``True`` when ``get_next_direction()`` depends only on
+    #: ``occupied``, so the engine can reuse directions the snek chose before
+    #: for the same view instead of calling it again
+    memoize: bool = False
+    _pathfinder: Optional[Pathfinder] = None
 
     def get_next_direction(self) -> Direction:
         """
@@ -78,6 +91,126 @@ class Snek(abc.ABC):
 
         return current_distance - 1
 
+    def get_territory_size(self) -> int:
+        """
+        Gets the number of free cells within vision the snek can reach before
+        any other snek it sees, going around occupied cells. Cells other sneks
+        can reach just as soon aren't counted. This is computed at most once per
+        step, so it's cheaper than searching yourself.
+
+        :return: the number of cells in the snek's territory
+        """
+        return self.get_territory().get_size()
+
+    def get_obstacle_distance(self, cell: Cell = Cell(0, 0)) -> int:
+        """
+        Gets the number of moves from a cell to the closest occupied cell, moving
+        only within vision. For example, to check how much room there is above
+        the head::
+
+            self.get_obstacle_distance(self.get_head().get_up())
+
+        :param cell: the cell to measure from, defaulting to the head
+        :return: the number of moves to the closest occupied cell, which is more
+            than any path within vision takes when none can be reached, or 0
+            for a cell beyond vision
+        """
+        return self.get_territory().get_obstacle_distance(cell)
+
+    def count_occupied(self, corner: Cell, opposite: Cell) -> int:
+        """
+        Counts the occupied cells in a rectangle, given two of its opposite
+        corners, which are included. Only the part of the rectangle within
+        vision is counted. This takes the same time however large the rectangle
+        is. For example, to see how crowded it is to the left::
+
+            self.count_occupied(Cell(-1, -5), Cell(-10, 5))
+
+        :param corner: a corner of the rectangle
+        :param opposite: the opposite corner of the rectangle
+        :return: the number of occupied cells in the rectangle
+        """
+        if self.density is None:
+            return occupancy.get_standalone_view(self.occupied).count(corner, opposite)
+        return self.density.count(corner, opposite)
+
+    def get_territory(self) -> TerritoryView:
+        if self.territory is None:
+            return get_standalone_view(self.occupied)
+        return self.territory
+
+    def get_path_to(self, destination: Cell) -> List[Cell]:
+        """
+        Gets the shortest path from the head to the destination that avoids
+        occupied cells, searching only within vision. Paths are cached for the
+        rest of the step, so checking several destinations is cheap.
+
+        For example, to see how many moves it takes to get to a cell::
+
+            path = self.get_path_to(Cell(5, 9))
+            if path:
+                moves = len(path)
+
+        :param destination: the cell to find a path to
+        :return: the cells along the path, starting with the cell next to the
+            head and ending with the destination, or an empty list when there's
+            no path within vision
+        """
+        if self._pathfinder is None or self._pathfinder.occupied is not self.occupied:
+            self._pathfinder = Pathfinder(self.occupied)
+        return self._pathfinder.get_path(destination)
+
+    def get_direction_along_path(self, destination: Cell) -> Direction:
+        """
+        Gets the next direction to travel along the shortest path to the
+        destination, going around occupied cells. When there's no such path
+        within vision, this falls back to ``get_direction_to_destination()``.
+
+        :param destination: the cell to travel towards
+        :return: the direction of the first move along the path
+        """
+        path = self.get_path_to(destination)
+        if path:
+            for direction in Direction:
+                if self.get_head().get_neighbor(direction) == path[0]:
+                    return direction
+        return self.get_direction_to_destination(destination)
+
+    def fork(self) -> Branch:
+        """
+        Starts a hypothetical continuation of the game from what the snek sees,
+        to try out moves before choosing one. Branches can be forked again
+        cheaply, which makes searching several moves ahead affordable. Only the
+        snek itself moves, named ``SELF`` in the branch, and cells beyond vision
+        are taken to be free. For example, to see whether going up and then
+        left would end the snek::
+
+            branch = self.fork()
+            for direction in (Direction.UP, Direction.LEFT):
+                branch.step({SELF: direction})
+            ended = not branch.get_active()
+
+        :return: a branch starting from the current step
+        """
+        return Branch.of_view(self.occupied)
+
+    def simulate(self, directions: Sequence[Direction]) -> int:
+        """
+        Counts how many of the moves the snek would survive when making them in
+        order, going by what it sees. For example, to check that there's room
+        to go up three times::
+
+            self.simulate([Direction.UP] * 3) == 3
+
+        :param directions: the moves to make, starting from the current step
+        :return: the number of moves made before the snek would end
+        """
+        branch = self.fork()
+        for moves, direction in enumerate(directions):
+            if branch.step({SELF: direction}):
+                return moves
+        return len(directions)
+
     def get_direction_to_destination(
         self,
         destination: Cell,
@@ -107,9 +240,7 @@ class Snek(abc.ABC):
         :return: the direction to travel that will close the most distance
         """
 
-        return min(
-            directions,
-            key=lambda direction: self.get_head()
-            .get_neighbor(direction)
-            .get_distance(destination),
+        distances = destination.get_distances(
+            self.get_head().get_neighbor(direction) for direction in directions
         )
+        return directions[distances.index(min(distances))]
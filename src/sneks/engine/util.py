@@ -0,0 +1,24 @@
+from typing import List, Sequence
+
+
+def format_table(
+    header: Sequence[str], rows: Sequence[Sequence[str]], labelled: bool = False
+) -> str:
+    """
+    Lines up the header and rows of a table in fixed-width columns.
+
+    :param header: the name of each column
+    :param rows: the values of each row, already formatted
+    :param labelled: whether the first column holds labels, which are
+        left-justified while the values after them stay right-justified
+    :return: the table, one line per row after the header
+    """
+    lines: List[Sequence[str]] = [header, *rows]
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            value.ljust(width) if labelled and i == 0 else value.rjust(width)
+            for i, (value, width) in enumerate(zip(line, widths))
+        )
+        for line in lines
+    )
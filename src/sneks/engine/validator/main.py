@@ -1,9 +1,17 @@
+import copy
+
 import pytest
 
 from sneks.engine.config.instantiation import config
 
 
 def main(test_path: str | None = None) -> int:
-    if test_path is not None:
-        config.registrar_prefix = test_path
-    return pytest.main(["--pyargs", "sneks.engine.validator"])
+    # The tests change the config to play their games, so it's restored after
+    # to leave warm processes validating the next submission as they were
+    saved = copy.deepcopy(vars(config))
+    try:
+        if test_path is not None:
+            config.registrar_prefix = test_path
+        return pytest.main(["--pyargs", "sneks.engine.validator"])
+    finally:
+        vars(config).update(saved)
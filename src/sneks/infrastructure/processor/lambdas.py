@@ -16,6 +16,8 @@ Lambdas = namedtuple(
         "validator",
         "post_validator",
         "post_validator_reduce",
+        "planner",
+        "settler",
         "processor",
         "recorder",
         "post_process_save",
@@ -31,7 +33,13 @@ def get_handler(
     timeout: aws_cdk.Duration = aws_cdk.Duration.seconds(3),
     memory_size: int = 1792,
     environment: dict[str, str] | None = None,
+    requirements: list[str] | None = None,
 ) -> lambda_.Function:
+    """
+    :param requirements: the requirements files to install in the function's
+        image. The package is installed without its own dependencies, since
+        images without them are smaller and start faster.
+    """
     return lambda_.DockerImageFunction(
         scope,
         id=name,
@@ -39,6 +47,7 @@ def get_handler(
             directory=".",
             cmd=[handler],
             platform=Platform.LINUX_ARM64,
+            build_args={"REQUIREMENTS": " ".join(requirements or [])},
         ),
         architecture=lambda_.Architecture.ARM_64,
         timeout=timeout,
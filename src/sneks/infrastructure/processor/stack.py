@@ -9,7 +9,10 @@ from aws_cdk import aws_sns as sns
 from aws_cdk import aws_sqs as sqs
 from constructs import Construct
 
-from sneks.backend import main
+from sneks.backend.handlers import notifier as notifier_handlers
+from sneks.backend.handlers import processor as processor_handlers
+from sneks.backend.handlers import recorder as recorder_handlers
+from sneks.backend.handlers import validator as validator_handlers
 from sneks.infrastructure.processor.lambdas import (
     Lambdas,
     get_handler,
@@ -108,6 +111,10 @@ class Sneks(Stack):
             ],
             event_bridge_enabled=True,
             transfer_acceleration=True,
+            lifecycle_rules=[
+                # Cached run results, which go stale once a submission changes
+                s3.LifecycleRule(prefix="results/", expiration=Duration.days(14)),
+            ],
         )
 
         video_bucket = s3.Bucket(
@@ -148,60 +155,79 @@ class Sneks(Stack):
         notifier = get_handler(
             self,
             name="Notifier",
-            handler=get_handler_for_function(main.send_notification),
+            handler=get_handler_for_function(notifier_handlers.send_notification),
             environment={"sns_topic_arn": notification_topic.topic_arn},
         )
         start_processor = get_handler(
             self,
             name="StartProcessor",
-            handler=get_handler_for_function(main.start_processing),
+            handler=get_handler_for_function(processor_handlers.start_processing),
         )
         pre_processor = get_handler(
             self,
             name="PreProcessor",
-            handler=get_handler_for_function(main.pre_process),
+            handler=get_handler_for_function(processor_handlers.pre_process),
             timeout=Duration.seconds(20),
         )
         validator = get_handler(
             self,
             name="Validator",
-            handler=get_handler_for_function(main.validate),
+            handler=get_handler_for_function(validator_handlers.validate),
             timeout=Duration.seconds(120),
+            requirements=["requirements.txt", "requirements-extra.txt"],
         )
         post_validator = get_handler(
             self,
             name="PostValidator",
-            handler=get_handler_for_function(main.post_validate),
+            handler=get_handler_for_function(validator_handlers.post_validate),
             timeout=Duration.seconds(20),
         )
         post_validator_reduce = get_handler(
             self,
             name="PostValidatorReduce",
-            handler=get_handler_for_function(main.post_validate_reduce),
+            handler=get_handler_for_function(validator_handlers.post_validate_reduce),
+            timeout=Duration.seconds(20),
+        )
+        planner = get_handler(
+            self,
+            name="Planner",
+            handler=get_handler_for_function(processor_handlers.plan_process),
+            timeout=Duration.seconds(20),
+        )
+        settler = get_handler(
+            self,
+            name="Settler",
+            handler=get_handler_for_function(processor_handlers.settle_process),
             timeout=Duration.seconds(20),
         )
         processor = get_handler(
             self,
             name="Processor",
-            handler=get_handler_for_function(main.process),
+            handler=get_handler_for_function(processor_handlers.process),
             timeout=Duration.minutes(5),
+            requirements=["requirements-extra.txt"],
         )
         recorder = get_handler(
             self,
             name="Recorder",
-            handler=get_handler_for_function(main.record),
+            handler=get_handler_for_function(recorder_handlers.record),
             timeout=Duration.minutes(4),
+            requirements=[
+                "requirements.txt",
+                "requirements-extra.txt",
+                "requirements-record.txt",
+            ],
         )
         post_process_save = get_handler(
             self,
             name="PostProcessSave",
-            handler=get_handler_for_function(main.post_process_save),
+            handler=get_handler_for_function(processor_handlers.post_process_save),
             timeout=Duration.seconds(20),
         )
         post_processor = get_handler(
             self,
             name="PostProcessor",
-            handler=get_handler_for_function(main.post_process),
+            handler=get_handler_for_function(processor_handlers.post_process),
             timeout=Duration.seconds(30),
         )
 
@@ -209,9 +235,14 @@ class Sneks(Stack):
         submission_bucket.grant_read_write(pre_processor)
         submission_bucket.grant_read(validator, objects_key_pattern="processing/*")
         submission_bucket.grant_read_write(post_validator)
+        submission_bucket.grant_read(planner, objects_key_pattern="submitted/**/*.py")
         submission_bucket.grant_read(processor, objects_key_pattern="submitted/**/*.py")
         submission_bucket.grant_read(recorder, objects_key_pattern="submitted/**/*.py")
+        video_bucket.grant_put(processor, objects_key_pattern="scores/*")
+        submission_bucket.grant_read_write(processor, objects_key_pattern="results/*")
         video_bucket.grant_put(recorder, objects_key_pattern="games/*.mp4")
+        static_site_bucket.grant_put(recorder, objects_key_pattern="games/*.mp4")
+        static_site_bucket.grant_read(recorder, objects_key_pattern="games/*.mp4")
         video_bucket.grant_read(post_process_save, objects_key_pattern="games/*.mp4")
         static_site_bucket.grant_put(
             post_process_save, objects_key_pattern="games/*.mp4"
@@ -222,6 +253,15 @@ class Sneks(Stack):
         static_site_bucket.grant_read_write(
             post_processor, objects_key_pattern="games/manifest*.json"
         )
+        video_bucket.grant_read(settler, objects_key_pattern="scores/*")
+        video_bucket.grant_read(post_processor, objects_key_pattern="scores/*")
+        submission_bucket.grant_read(
+            post_processor, objects_key_pattern="submitted/**/*.py"
+        )
+        static_site_bucket.grant_read(planner, objects_key_pattern="games/ratings.json")
+        static_site_bucket.grant_read_write(
+            post_processor, objects_key_pattern="games/ratings.json"
+        )
 
         return Lambdas(
             notifier=notifier,
@@ -230,6 +270,8 @@ class Sneks(Stack):
             validator=validator,
             post_validator=post_validator,
             post_validator_reduce=post_validator_reduce,
+            planner=planner,
+            settler=settler,
             processor=processor,
             recorder=recorder,
             post_process_save=post_process_save,
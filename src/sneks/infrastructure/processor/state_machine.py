@@ -86,45 +86,94 @@ class StateMachine(Construct):
             .afterwards(include_otherwise=True)
         )
 
-        map_process_array = step_functions.Pass(
+        # Scores are written to per-execution shards instead of the payload
+        shard_prefix = step_functions.JsonPath.format(
+            "scores/{}/", step_functions.JsonPath.string_at("$$.Execution.Name")
+        )
+
+        # Plan how many invocations to fan out to based on the submissions
+        task_plan_process = tasks.LambdaInvoke(
             self,
-            "MapProcessArray",
-            result=step_functions.Result(list(range(20))),
+            "PlanProcessTask",
+            lambda_function=lambdas.planner,
+            payload=step_functions.TaskInput.from_object(
+                dict(
+                    submission_bucket=submission_bucket.bucket_name,
+                    ratings_bucket=static_site_bucket.bucket_name,
+                    adaptive=True,
+                )
+            ),
+            payload_response_only=True,
         )
 
+        # Each round's results go beside the plan, for settling to collect
         map_process = step_functions.Map(
             self,
             "MapProcess",
+            items_path="$.items",
+            max_concurrency_path="$.max_concurrency",
+            result_path="$.round",
+        )
+
+        # Items with nothing to do for a branch skip its lambda entirely
+        skipped_result = step_functions.Result.from_object(
+            dict(videos=[], scores=[], proceed=True)
         )
 
         map_process.iterator(
             step_functions.Parallel(self, "ParallelProcess")
             .branch(
-                tasks.LambdaInvoke(
-                    self,
-                    "ProcessTask",
-                    lambda_function=lambdas.processor,
-                    payload_response_only=True,
-                    payload=step_functions.TaskInput.from_object(
-                        dict(
-                            submission_bucket=submission_bucket.bucket_name,
-                        )
+                step_functions.Choice(self, "ProcessChoice")
+                .when(
+                    step_functions.Condition.number_greater_than("$.runs", 0),
+                    tasks.LambdaInvoke(
+                        self,
+                        "ProcessTask",
+                        lambda_function=lambdas.processor,
+                        payload_response_only=True,
+                        payload=step_functions.TaskInput.from_object(
+                            dict(
+                                submission_bucket=submission_bucket.bucket_name,
+                                shard_bucket=video_bucket.bucket_name,
+                                shard_prefix=shard_prefix,
+                                results_bucket=submission_bucket.bucket_name,
+                                runs=step_functions.JsonPath.number_at("$.runs"),
+                                max_runs=step_functions.JsonPath.number_at(
+                                    "$.max_runs"
+                                ),
+                                seed=step_functions.JsonPath.number_at("$.seed"),
+                                submissions=step_functions.JsonPath.list_at(
+                                    "$.submissions"
+                                ),
+                            )
+                        ),
                     ),
                 )
+                .otherwise(
+                    step_functions.Pass(self, "SkipProcess", result=skipped_result)
+                )
             )
             .branch(
-                tasks.LambdaInvoke(
-                    self,
-                    "RecordTask",
-                    lambda_function=lambdas.recorder,
-                    payload_response_only=True,
-                    payload=step_functions.TaskInput.from_object(
-                        dict(
-                            submission_bucket=submission_bucket.bucket_name,
-                            video_bucket=video_bucket.bucket_name,
-                        )
+                step_functions.Choice(self, "RecordChoice")
+                .when(
+                    step_functions.Condition.boolean_equals("$.record", True),
+                    tasks.LambdaInvoke(
+                        self,
+                        "RecordTask",
+                        lambda_function=lambdas.recorder,
+                        payload_response_only=True,
+                        payload=step_functions.TaskInput.from_object(
+                            dict(
+                                submission_bucket=submission_bucket.bucket_name,
+                                video_bucket=video_bucket.bucket_name,
+                                static_site_bucket=static_site_bucket.bucket_name,
+                            )
+                        ),
                     ),
                 )
+                .otherwise(
+                    step_functions.Pass(self, "SkipRecord", result=skipped_result)
+                )
             )
             .next(
                 tasks.LambdaInvoke(
@@ -143,6 +192,25 @@ class StateMachine(Construct):
             )
         )
 
+        # Plans another round while the merged ranking hasn't settled
+        task_settle = tasks.LambdaInvoke(
+            self,
+            "SettleTask",
+            lambda_function=lambdas.settler,
+            payload=step_functions.TaskInput.from_object(
+                dict(
+                    shard_bucket=video_bucket.bucket_name,
+                    shard_prefix=shard_prefix,
+                    seed=step_functions.JsonPath.number_at("$.seed"),
+                    target_games=step_functions.JsonPath.number_at("$.target_games"),
+                    max_games=step_functions.JsonPath.number_at("$.max_games"),
+                    result=step_functions.JsonPath.list_at("$.result"),
+                    round=step_functions.JsonPath.list_at("$.round"),
+                )
+            ),
+            payload_response_only=True,
+        )
+
         task_post_process = tasks.LambdaInvoke(
             self,
             "PostProcess",
@@ -151,7 +219,11 @@ class StateMachine(Construct):
                 dict(
                     distribution_id=distribution_id,
                     static_site_bucket=static_site_bucket.bucket_name,
-                    result=step_functions.JsonPath.object_at("$"),
+                    shard_bucket=video_bucket.bucket_name,
+                    shard_prefix=shard_prefix,
+                    ratings_bucket=static_site_bucket.bucket_name,
+                    submission_bucket=submission_bucket.bucket_name,
+                    result=step_functions.JsonPath.list_at("$.result"),
                 )
             ),
             payload_response_only=True,
@@ -197,15 +269,20 @@ class StateMachine(Construct):
 
         task_cloudfront_invalidation.add_retry(max_attempts=5)
 
-        process_chain = (
-            map_process_array.next(map_process)
-            .next(task_post_process)
-            .next(task_cloudfront_invalidation)
-            .next(
-                step_functions.Succeed(self, "Finished"),
+        choice_settled = (
+            step_functions.Choice(self, "SettledChoice")
+            .when(step_functions.Condition.is_present("$.items[0]"), map_process)
+            .otherwise(
+                task_post_process.next(task_cloudfront_invalidation).next(
+                    step_functions.Succeed(self, "Finished"),
+                )
             )
         )
 
+        process_chain = (
+            task_plan_process.next(map_process).next(task_settle).next(choice_settled)
+        )
+
         choice_manual_overrides = (
             step_functions.Choice(self, "ManualOverridesChoice")
             .when(
@@ -229,6 +306,7 @@ class StateMachine(Construct):
             .next(process_chain)
         )
 
+        # Leaves room for a few rounds of processing while the ranking settles
         self.workflow = step_functions.StateMachine(
-            self, "Workflow", definition=definition, timeout=Duration.minutes(10)
+            self, "Workflow", definition=definition, timeout=Duration.minutes(30)
         )
@@ -0,0 +1,24 @@
+import boto3
+import moto
+import pytest
+
+from sneks.backend import storage
+
+
+@pytest.fixture
+def aws(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        # The pooled client must be created inside the mock
+        storage.get_s3_client.cache_clear()
+        yield
+    storage.get_s3_client.cache_clear()
+
+
+@pytest.fixture
+def bucket(aws) -> str:
+    name = "submissions"
+    boto3.client("s3").create_bucket(Bucket=name)
+    return name
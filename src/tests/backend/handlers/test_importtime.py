@@ -0,0 +1,26 @@
+import pytest
+
+from sneks.backend.handlers import importtime
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       115 |        115 |   _io
+import time:        30 |         30 |     pygame.base
+import time:       100 |        130 |   pygame
+import time:       200 |        200 | json
+"""
+
+
+def test_parse() -> None:
+    times = importtime.parse(REPORT)
+    assert [t.module for t in times] == ["_io", "pygame.base", "pygame", "json"]
+    assert [t.depth for t in times] == [1, 2, 1, 0]
+    assert importtime.get_total(times) == 200
+    assert importtime.get_heavy(times) == ["pygame"]
+    assert importtime.check(times) == ["heavy modules imported: pygame"]
+
+
+@pytest.mark.parametrize("module", importtime.HANDLER_MODULES)
+def test_handlers_import_within_budget(module: str) -> None:
+    times = importtime.measure(module)
+    assert module in [t.module for t in times]
+    assert importtime.check(times) == []
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from sneks.backend.processor import metrics
+from sneks.engine.engine.telemetry import Telemetry
+
+
+def get_telemetry() -> Telemetry:
+    telemetry = Telemetry()
+    for step in range(1, 1001):
+        telemetry.steps.record(step * 1000)
+        telemetry.decisions.record(step * 10)
+        telemetry.active.append(4 - step // 500)
+        telemetry.ended.append(step // 500)
+    return telemetry
+
+
+def test_get_log() -> None:
+    log = metrics.get_log(get_telemetry(), seed=3, timestamp=1234)
+    directive = log["_aws"]["CloudWatchMetrics"][0]
+    assert log["_aws"]["Timestamp"] == 1234
+    for metric in directive["Metrics"]:
+        assert metric["Name"] in log
+    for dimensions in directive["Dimensions"]:
+        for dimension in dimensions:
+            assert dimension in log
+
+    assert log["Steps"] == 1000
+    assert log["ActiveSnakes"] == 2
+    assert log["EndedSnakes"] == 2
+    steps = log["StepLatency"]
+    assert sum(steps["Counts"]) == 1000
+    assert steps["Values"] == sorted(steps["Values"])
+    assert 1 <= steps["Values"][0] and steps["Values"][-1] <= 1000
+    assert 500 <= log["stepPercentiles"]["p50"] <= 550
+    assert log["stepPercentiles"]["max"] == 1000
+
+
+def test_get_values_limit() -> None:
+    telemetry = Telemetry()
+    for power in range(200):
+        telemetry.steps.record(int(1.1**power))
+    values = metrics.get_values(telemetry.steps)
+    assert len(values["Values"]) <= metrics.MAX_VALUES
+    assert sum(values["Counts"]) == 200
+
+
+def test_emit(capsys: pytest.CaptureFixture[str]) -> None:
+    metrics.emit(get_telemetry(), seed=3)
+    log = json.loads(capsys.readouterr().out)
+    assert log["seed"] == 3
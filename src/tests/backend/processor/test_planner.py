@@ -0,0 +1,41 @@
+import pytest
+
+from sneks.backend.processor import planner
+
+
+@pytest.mark.parametrize("submission_count", [0, 1, 2, 10, 50, 500])
+@pytest.mark.parametrize("target_games", [1, 20, 1000])
+def test_plan_covers_target_games(submission_count: int, target_games: int) -> None:
+    plan = planner.get_plan(
+        submission_count=submission_count,
+        target_games=target_games,
+        recordings=3,
+        seed=0,
+    )
+    items = plan["items"]
+    assert plan["max_concurrency"] == len(items) <= planner.MAX_CONCURRENCY
+    assert sum(item["max_runs"] for item in items) == target_games
+    assert sum(item["record"] for item in items) == 3
+    # seed ranges are contiguous and don't overlap
+    processing = [item for item in items if item["max_runs"]]
+    for item, following in zip(processing, processing[1:]):
+        assert following["seed"] == item["seed"] + item["max_runs"]
+
+
+def test_plan_batches_small_fields() -> None:
+    small = planner.get_plan(submission_count=2, target_games=20, recordings=0)
+    large = planner.get_plan(submission_count=200, target_games=20, recordings=0)
+    assert len(small["items"]) < len(large["items"])
+
+
+def test_adaptive_plan_keeps_budget() -> None:
+    plan = planner.get_plan(
+        submission_count=2, target_games=20, recordings=0, adaptive=True
+    )
+    items = plan["items"]
+    # every item plays at least its share, with room for more when it's close
+    assert sum(item["runs"] for item in items) == 20
+    assert sum(item["max_runs"] for item in items) > 20
+    for item, following in zip(items, items[1:]):
+        assert following["seed"] == item["seed"] + item["max_runs"]
+    assert plan["max_games"] == 20 * planner.ADAPTIVE_BUDGET
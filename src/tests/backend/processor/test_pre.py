@@ -0,0 +1,29 @@
+import boto3
+import botocore.exceptions
+import pytest
+
+from sneks.backend import processor
+from sneks.backend.storage import move
+
+
+def test_pre_leaves_partly_moved_submissions_unstaged(
+    monkeypatch: pytest.MonkeyPatch, bucket: str
+) -> None:
+    s3 = boto3.client("s3")
+    for key in ["private/a/1/submission.py", "private/b/1/submission.py"]:
+        s3.put_object(Bucket=bucket, Key=key, Body=b"")
+    s3.put_object(Bucket=bucket, Key="private/b/1/helper.py", Body=b"")
+    copy = move.copy
+
+    def failing_copy(bucket_name: str, key: str, new_key: str) -> str:
+        if key == "private/b/1/helper.py":
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "InternalError", "Message": ""}}, "CopyObject"
+            )
+        return copy(bucket_name, key, new_key)
+
+    monkeypatch.setattr(move, "copy", failing_copy)
+
+    result = processor.pre(bucket_name=bucket)
+
+    assert result["staged"] == [{"prefix": "processing/a/", "bucket": bucket}]
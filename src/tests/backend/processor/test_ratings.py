@@ -0,0 +1,114 @@
+import json
+import pathlib
+
+import boto3
+import pytest
+
+from sneks.backend.processor import planner, ratings, runner
+from sneks.backend.processor.scores import Score
+
+
+def make_run(*names: str) -> list[Score]:
+    # Earlier names score higher
+    count = len(names)
+    return [
+        Score(name, 10 * (count - i), 0, (count - i) / count, 0.0)
+        for i, name in enumerate(names)
+    ]
+
+
+def test_update_orders_ratings_by_results() -> None:
+    stored: dict[str, ratings.Rating] = {}
+    for _ in range(20):
+        ratings.update(stored, make_run("a/1", "b/1", "c/1"))
+    assert stored["a/1"].rating > stored["b/1"].rating > stored["c/1"].rating
+    # Elo is zero sum
+    assert sum(rating.rating for rating in stored.values()) == pytest.approx(
+        3 * ratings.DEFAULT_RATING
+    )
+    assert stored["a/1"].games == 20
+    assert stored["a/1"].age == pytest.approx(30)
+
+
+def test_update_supersedes_previous_submission() -> None:
+    stored: dict[str, ratings.Rating] = {}
+    ratings.update(stored, make_run("a/1", "b/1"))
+    ratings.update(stored, make_run("a/2", "b/1"))
+    assert set(stored) == {"a/2", "b/1"}
+    assert stored["a/2"].games == 1
+
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "ratings.json")
+    assert ratings.load(key=path) == {}
+    stored: dict[str, ratings.Rating] = {}
+    ratings.update(stored, make_run("a/1", "b/1"))
+    ratings.save(stored, key=path)
+    assert ratings.load(key=path) == stored
+
+
+def test_round_trip_bucket(bucket: str) -> None:
+    assert ratings.load(bucket_name=bucket) == {}
+    stored: dict[str, ratings.Rating] = {}
+    ratings.update(stored, make_run("a/1", "b/1"))
+    ratings.save(stored, bucket_name=bucket)
+    assert ratings.load(bucket_name=bucket) == stored
+
+
+def test_load_drops_normalized_means_of_older_stores(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "ratings.json"
+    path.write_text(json.dumps({"ratings": {"a/1": [1510.0, 2, 30.0, 1.0, 0.9, 0.5]}}))
+    assert ratings.load(key=str(path)) == {"a/1": ratings.Rating(1510.0, 2, 30.0, 1.0)}
+
+
+def test_retain_drops_deleted_submissions() -> None:
+    stored: dict[str, ratings.Rating] = {}
+    ratings.update(stored, make_run("a/1", "b/1", "c/1"))
+    ratings.retain(stored, names=["a/1", "c/1", "d/1"])
+    assert set(stored) == {"a/1", "c/1"}
+
+
+def test_scores_are_normalized_across_the_field() -> None:
+    stored = {
+        "a/1": ratings.Rating(1600.0, 5, 40.0, 2.0),
+        "b/1": ratings.Rating(1500.0, 5, 20.0, 4.0),
+        "c/1": ratings.Rating(1400.0, 5, 10.0, 0.0),
+        "new/1": ratings.new_rating(),
+    }
+    scores = {score.name: score for score in ratings.get_scores(stored)}
+    assert set(scores) == {"a/1", "b/1", "c/1"}
+    assert scores["a/1"] == Score("a/1", 40.0, 2.0, 1.0, 0.5)
+    assert scores["c/1"] == Score("c/1", 10.0, 0.0, 0.0, 0.0)
+
+
+def test_manifest_is_ordered_by_rating(bucket: str) -> None:
+    scores = [Score("a/1", 40.0, 0.0, 1.0, 0.0), Score("b/1", 10.0, 0.0, 0.0, 0.0)]
+    runner.save_manifest(
+        video_names=[],
+        scores=scores,
+        distribution_id="",
+        static_site_bucket_name=bucket,
+        ratings={"a/1": 1400.0, "b/1": 1600.0},
+    )
+    body = boto3.client("s3").get_object(Bucket=bucket, Key="games/manifest.json")
+    manifest = json.loads(body["Body"].read())
+    assert [entry["name"] for entry in manifest["scores"]] == ["b/1", "a/1"]
+    assert manifest["scores"][0]["rating"] == 1600.0
+
+
+def test_groups_only_involve_new_submissions() -> None:
+    stored: dict[str, ratings.Rating] = {}
+    established = [f"user{i}/1" for i in range(20)]
+    ratings.update(stored, make_run(*established))
+    assert ratings.get_groups(established, stored) == []
+
+    new = ["new0/1", "new1/1", "new2/1", "new3/1", "new4/1"]
+    groups = ratings.get_groups(established + new, stored, group_size=4)
+    assert sorted(name for group in groups for name in group if name in new) == new
+    for group in groups:
+        assert len(group) == 4
+        assert any(name in established for name in group)
+
+    plan = planner.get_group_plan(groups, games_per_group=5, recordings=1, seed=0)
+    assert [item["submissions"] for item in plan["items"]] == groups
+    assert sum(item["runs"] for item in plan["items"]) == 5 * len(groups)
@@ -0,0 +1,79 @@
+import pathlib
+
+import boto3
+import pytest
+
+from sneks.backend import processor
+from sneks.backend.processor import results
+from sneks.backend.processor.scores import RunScores, Score
+from sneks.engine.config.instantiation import config
+
+
+def play(seeds: list[int]) -> list[RunScores]:
+    return [
+        RunScores(seed=seed, scores=[Score("a/1", seed, 1, 1.0, 0.5)]) for seed in seeds
+    ]
+
+
+@pytest.fixture
+def prefix(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    monkeypatch.setattr(results, "results_root", str(tmp_path / "results"))
+    submission = tmp_path / "submitted" / "a" / "1" / "submission.py"
+    submission.parent.mkdir(parents=True)
+    submission.write_text("# snek\n")
+    return submission.parents[2]
+
+
+def test_fingerprint_changes_with_inputs(
+    prefix: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fingerprint = results.get_fingerprint(str(prefix))
+    assert results.get_fingerprint(str(prefix)) == fingerprint
+
+    monkeypatch.setattr(config, "turn_limit", config.turn_limit + 1)
+    assert results.get_fingerprint(str(prefix)) != fingerprint
+    monkeypatch.undo()
+
+    # an engine change ships without the package version changing
+    monkeypatch.setattr(results, "get_engine_digest", lambda: "changed")
+    assert results.get_fingerprint(str(prefix)) != fingerprint
+    monkeypatch.undo()
+
+    (prefix / "a" / "1" / "submission.py").write_text("# changed\n")
+    assert results.get_fingerprint(str(prefix)) != fingerprint
+
+
+@pytest.mark.parametrize("use_bucket", [False, True])
+def test_cached_only_plays_missing_seeds(
+    prefix: pathlib.Path, use_bucket: bool, request: pytest.FixtureRequest
+) -> None:
+    bucket_name = request.getfixturevalue("bucket") if use_bucket else None
+    played: list[int] = []
+
+    def recording_play(seeds: list[int]) -> list[RunScores]:
+        played.extend(seeds)
+        return play(seeds)
+
+    cached = results.cached(
+        recording_play, results.get_fingerprint(str(prefix)), bucket_name
+    )
+    assert cached([1, 2]) == play([1, 2])
+    assert cached([0, 1, 2, 3]) == play([0, 1, 2, 3])
+    assert played == [1, 2, 0, 3]
+
+
+def test_seed_is_derived_from_submissions_and_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seed = results.get_seed(["a/1", "b/1"])
+    assert results.get_seed(["b/1", "a/1"]) == seed
+    assert results.get_seed(["a/1", "b/2"]) != seed
+    monkeypatch.setattr(config, "turn_limit", config.turn_limit + 1)
+    assert results.get_seed(["a/1", "b/1"]) != seed
+
+
+def test_planning_the_same_field_repeats_its_seeds(bucket: str) -> None:
+    s3 = boto3.client("s3")
+    for name in "ab":
+        s3.put_object(Bucket=bucket, Key=f"submitted/{name}/1/submission.py", Body=b"")
+    assert processor.plan(bucket_name=bucket) == processor.plan(bucket_name=bucket)
@@ -0,0 +1,62 @@
+import random
+
+from sneks.backend import processor
+from sneks.backend.processor import shards
+from sneks.backend.processor.scores import RunScores, Score
+
+PREFIX = "scores/execution/"
+
+
+def write_runs(bucket: str, seeds: range, spread: float, repeat: int = 0) -> None:
+    """
+    :param repeat: how far back the seeds are whose scores to play again
+    """
+    runs = []
+    for seed in seeds:
+        rng = random.Random(seed - repeat)
+        runs.append(
+            RunScores(
+                seed=seed,
+                scores=[
+                    Score(name, 0, 0, strength + rng.gauss(0, spread), 0)
+                    for name, strength in (("a", 0.9), ("b", 0.5), ("c", 0.1))
+                ],
+            )
+        )
+    shards.write(bucket_name=bucket, prefix=PREFIX, runs=runs)
+
+
+def settle(bucket: str, seed: int, max_games: int = 60) -> dict:
+    return processor.settle(
+        shard_bucket_name=bucket,
+        shard_prefix=PREFIX,
+        seed=seed,
+        target_games=20,
+        max_games=max_games,
+    )
+
+
+def test_settle_stops_once_the_merged_ranking_separates(bucket: str) -> None:
+    # each shard alone is too few games to separate the close race
+    for first in range(0, 20, 2):
+        write_runs(bucket, range(first, first + 2), spread=0.3)
+    assert settle(bucket, seed=0)["items"] == []
+
+
+def test_settle_plans_more_games_for_close_races(bucket: str) -> None:
+    write_runs(bucket, range(20), spread=4.0)
+    plan = settle(bucket, seed=0)
+    items = [item for item in plan["items"] if item["runs"]]
+    assert sum(item["runs"] for item in items) == 20
+    assert not any(item["record"] for item in plan["items"])
+    # the next round follows on from the seeds already played
+    assert plan["seed"] == items[0]["seed"] == 20
+
+    # a second round that leaves the ranking as it was settles it, like a tie
+    write_runs(bucket, range(20, 40), spread=4.0, repeat=20)
+    assert settle(bucket, seed=20)["items"] == []
+
+
+def test_settle_stops_at_the_budget(bucket: str) -> None:
+    write_runs(bucket, range(20), spread=4.0)
+    assert settle(bucket, seed=0, max_games=20)["items"] == []
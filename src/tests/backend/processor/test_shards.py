@@ -0,0 +1,33 @@
+import pytest
+
+from sneks.backend.processor import runner, shards
+from sneks.backend.processor.scores import RunScores, Score
+
+
+def test_shards_reduce_like_aggregate_scores(
+    monkeypatch: pytest.MonkeyPatch, bucket: str
+) -> None:
+    monkeypatch.setattr(shards, "MAX_WORKERS", 2)
+    runs = [
+        [Score("a", i, 2 * i, i / 10, 1 - i / 10), Score("b", 10 - i, i, 0.5, 0.25)]
+        for i in range(7)
+    ]
+    for seed, run in enumerate(runs):
+        shards.write(
+            bucket_name=bucket,
+            prefix="scores/execution/",
+            runs=[RunScores(seed=seed, scores=run)],
+        )
+    shards.write(
+        bucket_name=bucket,
+        prefix="scores/other/",
+        runs=[RunScores(seed=0, scores=runs[0])],
+    )
+
+    read = list(shards.read_runs(bucket, "scores/execution/"))
+    assert sorted(run.seed for run in read) == list(range(len(runs)))
+    reduced = runner.aggregate_scores(shards.read_scores(bucket, "scores/execution/"))
+    expected = runner.aggregate_scores(score for run in runs for score in run)
+    for actual, score in zip(sorted(reduced), sorted(expected)):
+        assert actual.name == score.name
+        assert actual[1:] == pytest.approx(score[1:])
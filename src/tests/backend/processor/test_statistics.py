@@ -0,0 +1,71 @@
+import random
+import statistics as reference
+
+import pytest
+
+from sneks.backend.processor import runner
+from sneks.backend.processor.scores import RunScores, Score
+from sneks.backend.processor.statistics import ScoreStatistics, Welford
+
+
+def test_welford_matches_reference() -> None:
+    values = [random.random() for _ in range(100)]
+    welford = Welford()
+    for value in values:
+        welford.add(value)
+    assert welford.mean == pytest.approx(reference.mean(values))
+    assert welford.variance == pytest.approx(reference.variance(values))
+
+
+def test_statistics_means_match_aggregate_scores() -> None:
+    scores = [
+        Score(name, random.random(), random.random(), random.random(), random.random())
+        for _ in range(20)
+        for name in "abc"
+    ]
+    aggregation = ScoreStatistics()
+    aggregation.add_all(scores)
+    expected = {score.name: score for score in runner.aggregate_scores(scores)}
+    for score in aggregation.scores():
+        assert score[1:] == pytest.approx(expected[score.name][1:])
+
+
+def play(seeds: list[int], spread: float) -> list[RunScores]:
+    results = []
+    for seed in seeds:
+        rng = random.Random(seed)
+        results.append(
+            RunScores(
+                seed=seed,
+                scores=[
+                    Score(name, 0, 0, strength + rng.gauss(0, spread), 0)
+                    for name, strength in (("a", 0.9), ("b", 0.5), ("c", 0.1))
+                ],
+            )
+        )
+    return results
+
+
+def test_schedule_stops_once_ranking_settles() -> None:
+    runs, aggregation = runner.run_until_settled(
+        seeds=list(range(1000)),
+        min_runs=4,
+        play=lambda seeds: play(seeds, spread=0.1),
+    )
+    assert len(runs) < 1000
+    assert aggregation.ranking() == ["a", "b", "c"]
+
+
+def test_schedule_uses_budget_for_close_races() -> None:
+    clear, _ = runner.run_until_settled(
+        seeds=list(range(200)),
+        min_runs=4,
+        play=lambda seeds: play(seeds, spread=0.05),
+    )
+    close, _ = runner.run_until_settled(
+        seeds=list(range(200)),
+        min_runs=4,
+        play=lambda seeds: play(seeds, spread=4.0),
+    )
+    assert len(clear) == 4
+    assert len(clear) < len(close) <= 200
@@ -0,0 +1,109 @@
+import pathlib
+
+import boto3
+import pytest
+
+from sneks.backend import storage
+from sneks.backend.storage import cache
+
+
+@pytest.fixture
+def downloads(monkeypatch: pytest.MonkeyPatch, bucket: str) -> list[str]:
+    client = storage.get_s3_client()
+    download_file = client.download_file
+    keys: list[str] = []
+
+    def counting_download_file(bucket_name, key, filename, *args, **kwargs):
+        keys.append(key)
+        return download_file(bucket_name, key, filename, *args, **kwargs)
+
+    monkeypatch.setattr(client, "download_file", counting_download_file)
+    return keys
+
+
+def test_fetch_only_downloads_changed_objects(
+    tmp_path: pathlib.Path, bucket: str, downloads: list[str]
+) -> None:
+    s3 = boto3.client("s3")
+    s3.put_object(Bucket=bucket, Key="submitted/a/1/submission.py", Body=b"a = 1")
+    s3.put_object(Bucket=bucket, Key="submitted/b/1/submission.py", Body=b"b = 1")
+    destination = tmp_path / "work"
+    cache_prefix = str(tmp_path / "cache")
+
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=cache_prefix)
+    assert sorted(downloads) == [
+        "submitted/a/1/submission.py",
+        "submitted/b/1/submission.py",
+    ]
+    assert (destination / "submitted/a/1/submission.py").read_bytes() == b"a = 1"
+
+    s3.put_object(Bucket=bucket, Key="submitted/b/1/submission.py", Body=b"b = 2")
+    downloads.clear()
+
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=cache_prefix)
+    assert downloads == ["submitted/b/1/submission.py"]
+    assert (destination / "submitted/b/1/submission.py").read_bytes() == b"b = 2"
+    # the stale version of b stays cached while there's space for it
+    assert len(list(pathlib.Path(cache_prefix).iterdir())) == 3
+
+
+def test_prune_keeps_entries_a_limited_fetch_didnt_use(
+    tmp_path: pathlib.Path, bucket: str
+) -> None:
+    s3 = boto3.client("s3")
+    for name in "abc":
+        s3.put_object(
+            Bucket=bucket,
+            Key=f"submitted/{name}/1/submission.py",
+            Body=name.encode() * 10,
+        )
+    destination = tmp_path / "work"
+    cache_prefix = pathlib.Path(tmp_path / "cache")
+
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=str(cache_prefix))
+    s3.put_object(Bucket=bucket, Key="submitted/a/1/submission.py", Body=b"d" * 10)
+
+    # only a is fetched, which leaves the cached b and c alone
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/a/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=str(cache_prefix))
+    assert len(list(cache_prefix.iterdir())) == 4
+
+    # when over the limit, the least recently used entries go first
+    kept = cache.get_cache_name(objects[0])
+    cache.prune(keep={kept}, cache_prefix=str(cache_prefix), max_bytes=20)
+    assert len(list(cache_prefix.iterdir())) == 2
+    assert (cache_prefix / kept).exists()
+
+
+def test_fetch_leaves_cached_files_unchanged(
+    tmp_path: pathlib.Path, bucket: str
+) -> None:
+    s3 = boto3.client("s3")
+    for name in "abc":
+        s3.put_object(
+            Bucket=bucket,
+            Key=f"submitted/{name}/1/submission.py",
+            Body=name.encode() * 10,
+        )
+    destination = tmp_path / "work"
+    cache_prefix = pathlib.Path(tmp_path / "cache")
+    submission = destination / "submitted/b/1/submission.py"
+
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=str(cache_prefix))
+    modified = submission.stat().st_mtime_ns
+
+    # the registrar keys loaded submissions on their files, which are links
+    # to the cached ones, so a hit mustn't touch them
+    objects = storage.list_objects(bucket_name=bucket, prefix="submitted/b/")
+    cache.fetch(bucket, objects, str(destination), cache_prefix=str(cache_prefix))
+    assert submission.stat().st_mtime_ns == modified
+
+    # but b was still the most recently used
+    cache.prune(keep=set(), cache_prefix=str(cache_prefix), max_bytes=10)
+    assert [p.name for p in cache_prefix.iterdir()] == [
+        cache.get_cache_name(objects[0])
+    ]
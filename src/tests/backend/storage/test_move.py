@@ -0,0 +1,41 @@
+import boto3
+import pytest
+
+from sneks.backend import storage
+from sneks.backend.storage import move
+
+
+def test_move_copies_and_deletes_in_batches(
+    monkeypatch: pytest.MonkeyPatch, bucket: str
+) -> None:
+    monkeypatch.setattr(move, "DELETE_BATCH_SIZE", 2)
+    s3 = boto3.client("s3")
+    keys = [f"private/user/{i}.py" for i in range(5)]
+    for key in keys:
+        s3.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    result = move.move(
+        bucket_name=bucket,
+        keys=keys,
+        rename=lambda key: key.replace("private", "processing", 1),
+    )
+
+    assert result.failed == {}
+    assert result.moved == {key: key.replace("private", "processing") for key in keys}
+    assert storage.list_objects(bucket_name=bucket, prefix="private/") == []
+    moved = storage.list_objects(bucket_name=bucket, prefix="processing/")
+    assert sorted(obj["Key"] for obj in moved) == sorted(result.moved.values())
+
+
+def test_move_reports_partial_failures(bucket: str) -> None:
+    s3 = boto3.client("s3")
+    s3.put_object(Bucket=bucket, Key="private/user/a.py", Body=b"a")
+
+    result = move.move(
+        bucket_name=bucket,
+        keys=["private/user/a.py", "private/user/missing.py"],
+        rename=lambda key: key.replace("private", "processing", 1),
+    )
+
+    assert result.moved == {"private/user/a.py": "processing/user/a.py"}
+    assert list(result.failed) == ["private/user/missing.py"]
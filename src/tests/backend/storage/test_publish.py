@@ -0,0 +1,30 @@
+import pathlib
+
+import boto3
+import pytest
+
+from sneks.backend.storage import publish
+
+
+def test_upload_and_copy_refuse_to_overwrite(
+    tmp_path: pathlib.Path, bucket: str
+) -> None:
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket="site")
+    files = {}
+    for i in range(3):
+        video = tmp_path / f"game_{i}.mp4"
+        video.write_bytes(bytes(i))
+        files[f"games/game_{i}.mp4"] = str(video)
+
+    publish.upload(bucket_name=bucket, files=files)
+    assert publish.exists(bucket, "games/game_2.mp4")
+    with pytest.raises(Exception, match="overwrite"):
+        publish.upload(bucket_name=bucket, files=files)
+    publish.upload(bucket_name=bucket, files=files, overwrite=True)
+
+    publish.copy(source_bucket_name=bucket, bucket_name="site", keys=list(files))
+    for key in files:
+        assert publish.exists("site", key)
+    with pytest.raises(Exception, match="overwrite"):
+        publish.copy(source_bucket_name=bucket, bucket_name="site", keys=list(files))
@@ -0,0 +1,90 @@
+import json
+import pathlib
+
+import pytest
+
+from sneks.backend import storage, workflow
+from sneks.engine.config.instantiation import config
+
+SUBMISSION = """
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+class CustomSnek(Snek):
+    def get_next_direction(self) -> Direction:
+        return Direction.UP
+"""
+
+
+def test_invoke_passes_payloads_through_json() -> None:
+    invocations: list[workflow.Invocation] = []
+    result = workflow.invoke(
+        "Task", lambda event, context: (event["a"], 1), {"a": [1]}, invocations
+    )
+    assert result == [[1], 1]
+    assert invocations[0].name == "Task"
+    assert invocations[0].input_bytes == len('{"a": [1]}')
+    assert invocations[0].output_bytes == len("[[1], 1]")
+
+
+def test_invoke_reports_payloads_over_the_limit(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    invocations: list[workflow.Invocation] = []
+    # Under the limit in characters, but not in bytes
+    event = "é" * (workflow.MAX_PAYLOAD_BYTES // 2)
+    workflow.invoke("Task", lambda event, context: None, event, invocations)
+    assert "Task was passed" in capsys.readouterr().out
+
+    workflow.invoke("Task", lambda event, context: event, "", invocations)
+    workflow.invoke("Task", lambda event, context: "é" * 10, "", invocations)
+    assert capsys.readouterr().out == ""
+
+
+def test_summarize() -> None:
+    stages = workflow.summarize(
+        [
+            workflow.Invocation("Map", 3.0, 10, 20),
+            workflow.Invocation("Task", 1.0, 1, 2),
+            workflow.Invocation("Task", 2.0, 3, 4),
+        ]
+    )
+    assert stages == [
+        workflow.Stage("Map", 3.0, 1, 10, 20),
+        workflow.Stage("Task", 3.0, 2, 4, 6),
+    ]
+
+
+def test_run(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "turn_limit", 20)
+    path = tmp_path / "submissions" / "user" / "submission.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(SUBMISSION)
+
+    with workflow.server():
+        buckets = workflow.create_buckets()
+        workflow.upload_submissions(buckets.submission, path.parent.parent)
+        stages = workflow.run(buckets, target_games=2, processes=2)
+        manifest = json.loads(
+            storage.get_s3_client()
+            .get_object(Bucket=buckets.static_site, Key="games/manifest.json")["Body"]
+            .read()
+        )
+
+    assert [stage.name for stage in stages] == [
+        "PreProcessTask",
+        "ValidateMap",
+        "ValidateTask",
+        "PostValidate",
+        "PostValidateReduce",
+        "PlanProcessTask",
+        "MapProcess",
+        "ProcessTask",
+        "PostProcessSaveTask",
+        "SettleTask",
+        "PostProcess",
+    ]
+    assert all(stage.input_bytes > 0 for stage in stages)
+    # Submissions are named <user>/<timestamp> once they're validated
+    assert [score["name"].split("/")[0] for score in manifest["scores"]] == ["user"]
@@ -0,0 +1,51 @@
+import dataclasses
+import pathlib
+
+import pytest
+
+from sneks.engine.benchmark import main
+from sneks.engine.benchmark.main import Case
+from sneks.engine.config.instantiation import config
+
+
+def test_benchmark(tmp_path: pathlib.Path) -> None:
+    measurements = main.run([Case(3, 20, 30, 5)], turn_limit=20, seed=0)
+    assert len(measurements) == 1
+    measurement = measurements[0]
+    assert measurement.steps > 0
+    assert measurement.steps_per_second > 0
+    assert measurement.peak_memory > 0
+    assert {"reset", "step", "report"}.issubset(measurement.phases)
+
+    assert main.compare(measurements, measurements) == []
+    faster = dataclasses.replace(
+        measurement, steps_per_second=measurement.steps_per_second * 2
+    )
+    assert len(main.compare(measurements, [faster])) == 1
+
+    path = str(tmp_path / "benchmark.json")
+    main.save(measurements, path)
+    assert main.load(path) == measurements
+
+
+def test_save_baseline(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    measurements = main.run([Case(3, 20, 30, 5)], turn_limit=20, seed=0)
+    monkeypatch.setattr(main, "run", lambda *args, **kwargs: measurements)
+    monkeypatch.setattr(main, "get_cases", lambda quick: [])
+    monkeypatch.setattr(config.graphics, "display", config.graphics.display)
+    output = str(tmp_path / "benchmark.json")
+    baseline = str(tmp_path / "baseline.json")
+    options = ["--output", output, "--baseline", baseline]
+
+    assert main.main(options) == 0
+    assert not pathlib.Path(baseline).exists()
+    assert main.main(options + ["--save-baseline"]) == 0
+    assert main.load(baseline) == measurements
+    assert main.main(options) == 0
+
+
+def test_painter_leaves_config_alone() -> None:
+    headless = config.graphics.headless
+    main.get_painter.cache_clear()
+    main.get_painter()
+    assert config.graphics.headless == headless
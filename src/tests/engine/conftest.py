@@ -0,0 +1,35 @@
+import pathlib
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+
+SUBMISSION = """
+import random
+
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+class CustomSnek(Snek):
+    def get_next_direction(self) -> Direction:
+        directions = [
+            direction
+            for direction in Direction
+            if self.get_head().get_neighbor(direction) not in self.get_occupied()
+        ]
+        return random.choice(directions or list(Direction))
+"""
+
+
+@pytest.fixture
+def submissions(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    names = [f"snek{i}" for i in range(4)]
+    for name in names:
+        path = tmp_path / name / "submission.py"
+        path.parent.mkdir()
+        path.write_text(SUBMISSION)
+    monkeypatch.setattr(config, "registrar_prefix", str(tmp_path))
+    monkeypatch.setattr(config, "turn_limit", 50)
+    monkeypatch.setattr(config.graphics, "display", False)
+    return names
@@ -1,5 +1,5 @@
 from sneks.engine.config.instantiation import config
-from sneks.engine.core.cell import Cell
+from sneks.engine.core.cell import Cell, get_cell_limit
 from sneks.engine.core.direction import Direction
 from sneks.engine.engine import cells
 
@@ -17,3 +17,40 @@ def test_cell() -> None:
     assert Cell(0, -1) == Cell(0, config.game.rows - 1)
 
     assert Cell(-1, 0) in (Cell(config.game.columns - 1, 0),)
+
+
+def test_distance_wraps() -> None:
+    columns, rows = config.game.columns, config.game.rows
+    origin = Cell(0, 0)
+    assert origin.get_distance(Cell(3, 4)) == 5
+    assert origin.get_distance(Cell(columns - 3, rows - 4)) == 5
+    assert origin.get_distance(Cell(-3, 4)) == 5
+    # Whole boards away is the same cell
+    assert origin.get_distance(Cell(2 * columns - 3, -rows + 4)) == 5
+    assert origin.get_distance(Cell(columns // 2, 0)) == columns // 2
+
+    others = [Cell(x, y) for x in range(-columns, columns, 7) for y in (-5, 0, 9)]
+    assert origin.get_distances(others) == [origin.get_distance(c) for c in others]
+
+
+def test_clear_caches() -> None:
+    Cell(0, 0).get_up()
+    info = Cell.get_cache_info()
+    assert info["cells"].currsize > 0
+    assert info["neighbors"].maxsize is not None
+
+    Cell.clear_caches()
+    assert all(i.currsize == 0 for i in Cell.get_cache_info().values())
+    assert Cell(0, 0).get_up() == Cell(0, 1)
+
+
+def test_limit_caches() -> None:
+    Cell.clear_caches()
+    Cell(0, 0).get_up()
+    assert not Cell.limit_caches()
+    assert Cell.get_cache_info()["cells"].currsize > 0
+
+    for x in range(get_cell_limit() + 1):
+        Cell(x, 0)
+    assert Cell.limit_caches()
+    assert Cell.get_cache_info()["cells"].currsize == 0
@@ -0,0 +1,55 @@
+import pathlib
+import random
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import checkpoint
+
+
+def test_resumed_campaign_matches_uninterrupted(
+    submissions: list[str], tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "runs", 3)
+    monkeypatch.setattr(config, "turn_limit", 20)
+
+    random.seed(11)
+    expected = checkpoint.run(path=str(tmp_path / "uninterrupted.pkl"))
+    assert expected is not None
+
+    path = str(tmp_path / "checkpoint.pkl")
+    random.seed(11)
+    result = checkpoint.run(path=path, time_limit=0)
+    stops = 0
+    while result is None:
+        stops += 1
+        # Scramble the random state, as a new process would have
+        random.seed()
+        result = checkpoint.resume(path=path, time_limit=0)
+
+    assert stops > 3
+    assert [s.raw for s in result] == [s.raw for s in expected]
+
+
+def test_resume_after_completed_run(
+    submissions: list[str], tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "runs", 2)
+    path = str(tmp_path / "checkpoint.pkl")
+
+    random.seed(5)
+    expected = checkpoint.run(path=path)
+    assert expected is not None
+
+    # Rewind to the checkpoint saved after the first run
+    monkeypatch.setattr(config, "runs", 1)
+    random.seed(5)
+    checkpoint.run(path=path)
+    saved = checkpoint.load(path)
+    assert saved is not None and saved.state is None
+    saved.config.runs = 2
+    checkpoint.save(path, saved)
+
+    result = checkpoint.resume(path=path)
+    assert result is not None
+    assert [s.raw for s in result] == [s.raw for s in expected]
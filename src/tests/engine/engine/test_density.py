@@ -0,0 +1,43 @@
+import itertools
+import random
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+from sneks.engine.engine.state import State
+from sneks.engine.interface.snek import Snek
+
+
+def test_counts_match_vision(submissions: list[str]) -> None:
+    random.seed(1)
+    state = State()
+    state.reset()
+    for _ in range(40):
+        state.step()
+
+    vision = config.game.vision_range
+    rng = random.Random(0)
+    for snake in state.active_snakes:
+        snek = snake.snek
+        for _ in range(50):
+            corner = Cell(rng.randint(-30, 30), rng.randint(-30, 30))
+            opposite = Cell(rng.randint(-30, 30), rng.randint(-30, 30))
+            xs = range(
+                max(min(corner.x, opposite.x), -vision),
+                min(max(corner.x, opposite.x), vision - 1) + 1,
+            )
+            ys = range(
+                max(min(corner.y, opposite.y), -vision),
+                min(max(corner.y, opposite.y), vision - 1) + 1,
+            )
+            expected = sum(
+                Cell(x, y) in snek.get_occupied() for x, y in itertools.product(xs, ys)
+            )
+            assert snek.count_occupied(corner, opposite) == expected
+
+
+def test_standalone_snek_wraps() -> None:
+    snek = Snek()
+    snek.occupied = frozenset({Cell(-1, 0), Cell(-1, 1), Cell(2, -3)})
+    assert snek.count_occupied(Cell(-1, 0), Cell(-1, 1)) == 2
+    assert snek.count_occupied(Cell(-5, -5), Cell(5, 5)) == 3
+    assert snek.count_occupied(Cell(0, 0), Cell(5, 5)) == 0
@@ -0,0 +1,69 @@
+import pathlib
+import random
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import memo, runner
+
+SUBMISSION = """
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+class CustomSnek(Snek):
+    memoize = {memoize}
+    calls = 0
+
+    def get_next_direction(self) -> Direction:
+        type(self).calls += 1
+        for direction in Direction:
+            if self.get_head().get_neighbor(direction) not in self.get_occupied():
+                return direction
+        return Direction.UP
+"""
+
+
+def play(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, memoize: bool):
+    prefix = tmp_path / str(memoize)
+    path = prefix / "snek" / "submission.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(SUBMISSION.format(memoize=memoize))
+    monkeypatch.setattr(config, "registrar_prefix", str(prefix))
+    random.seed(0)
+    return runner.run(seed=0)
+
+
+def test_memoized_game_is_unchanged(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "turn_limit", 100)
+    monkeypatch.setattr(config, "registrar_submission_sneks", 10)
+    memo.clear()
+
+    plain = play(tmp_path, monkeypatch, memoize=False)
+    memoized = play(tmp_path, monkeypatch, memoize=True)
+    assert [s.raw for s in memoized.scores] == [s.raw for s in plain.scores]
+
+    (stats,) = memo.get_stats().values()
+    assert stats["hits"] > 0
+    # Every move asks for a direction, including the last move of ended sneks
+    moves = sum(s.raw.age + (s.raw.age < plain.steps) for s in plain.scores)
+    assert stats["hits"] + stats["misses"] == moves
+    memo.clear()
+
+
+def test_cache_is_bounded() -> None:
+    class Stub:
+        occupied: frozenset = frozenset()
+
+        def get_next_direction(self):
+            return len(self.occupied)
+
+    cache = memo.DecisionCache(max_size=2)
+    snek = Stub()
+    for size in (0, 1, 2, 0, 2):
+        snek.occupied = frozenset(range(size))
+        assert cache.get_next_direction(snek) == size  # type: ignore
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert len(cache.entries) == 2
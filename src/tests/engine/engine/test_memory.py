@@ -0,0 +1,61 @@
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import NEIGHBOR_CACHE_SIZE, Cell, get_cell_limit
+from sneks.engine.engine import memory, runner
+from sneks.engine.engine.state import State
+
+
+@pytest.fixture
+def tracker(request: pytest.FixtureRequest):
+    tracker = memory.enable(**getattr(request, "param", {}))
+    yield tracker
+    memory.disable()
+
+
+def test_samples_each_run(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch, tracker: memory.Tracker
+) -> None:
+    monkeypatch.setattr(config, "runs", 3)
+    runner.main()
+
+    assert [s.run for s in tracker.samples] == [0, 1, 2]
+    for sample in tracker.samples:
+        assert 0 < sample.traced <= sample.peak
+        assert 0 < sample.cells <= sample.cell_limit
+        assert 0 < sample.neighbors <= NEIGHBOR_CACHE_SIZE
+        assert sample.body_bytes > 0
+
+
+@pytest.mark.parametrize("tracker", [dict(threshold=-1)], indirect=True)
+def test_alerts_on_growth(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch, tracker: memory.Tracker
+) -> None:
+    monkeypatch.setattr(config, "runs", 4)
+    runner.main()
+
+    # Growth isn't reported while warming up
+    assert len(tracker.alerts) == 4 - memory.WARMUP_RUNS
+    assert "memory grew" in tracker.alerts[0]
+
+
+def test_cells_stay_within_limit_between_games(
+    submissions: list[str], tracker: memory.Tracker
+) -> None:
+    state = State()
+    state.reset()
+    # Like a submission creating cells far off the board
+    for x in range(get_cell_limit() + 1):
+        Cell(x, 0)
+    state.reset()
+    state.reset()
+
+    assert len(tracker.alerts) == 1
+    assert "over the limit" in tracker.alerts[0]
+    assert tracker.samples[-1].cells <= tracker.samples[-1].cell_limit
+
+
+def test_disabled(submissions: list[str]) -> None:
+    memory.disable()
+    runner.run(seed=1)
+    assert memory.get() is None
@@ -0,0 +1,52 @@
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+def test_path_goes_around_wall() -> None:
+    snek = Snek()
+    # A wall above the head, from x=-2 to x=2
+    snek.occupied = frozenset(Cell(x, 1) for x in range(-2, 3))
+    path = snek.get_path_to(Cell(0, 3))
+    assert len(path) == 9
+    assert path[-1] == Cell(0, 3)
+    assert not snek.occupied.intersection(path)
+    for previous, cell in zip([Cell(0, 0)] + path, path):
+        assert cell.get_distance(previous) == 1
+    # The straight line direction would walk into the wall
+    assert snek.get_direction_to_destination(Cell(0, 3)) is Direction.UP
+    assert snek.get_direction_along_path(Cell(0, 3)) in (
+        Direction.LEFT,
+        Direction.RIGHT,
+    )
+
+
+def test_unreachable_and_cached() -> None:
+    snek = Snek()
+    snek.occupied = frozenset(
+        {Cell(0, 1), Cell(0, -1), Cell(1, 0), Cell(-1, 0), Cell(5, 5)}
+    )
+    assert snek.get_path_to(Cell(3, 3)) == []
+    assert snek.get_path_to(Cell(5, 5)) == []
+    assert snek.get_path_to(Cell(0, 0)) == []
+    assert snek.get_direction_along_path(Cell(0, 3)) is Direction.UP
+    assert snek.get_path_to(Cell(3, 3)) is snek.get_path_to(Cell(3, 3))
+
+    snek.occupied = frozenset()
+    assert len(snek.get_path_to(Cell(3, 3))) == 6
+
+
+def test_path_stays_within_vision() -> None:
+    snek = Snek()
+    vision = config.game.vision_range
+    # A wall across the whole window, which only the unseen row at +vision
+    # would get around
+    snek.occupied = frozenset(Cell(x, 2) for x in range(-vision, vision)) | {
+        Cell(vision, 0)
+    }
+    assert snek.get_path_to(Cell(0, 4)) == []
+    assert snek.get_path_to(Cell(vision, 0)) == []
+    path = snek.get_path_to(Cell(vision - 1, 0))
+    assert len(path) == vision - 1
+    assert all(cell.x < vision and cell.y < vision for cell in path)
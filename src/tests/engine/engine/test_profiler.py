@@ -0,0 +1,53 @@
+import json
+import pathlib
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import profiler, runner
+
+
+def test_disabled() -> None:
+    profiler.disable()
+    with profiler.phase("step"):
+        pass
+    assert profiler.get() is None
+
+
+def test_nested() -> None:
+    profile = profiler.enable()
+    try:
+        with profiler.phase("step"):
+            with profiler.phase("set_board"):
+                pass
+            with profiler.phase("set_board"):
+                pass
+    finally:
+        profiler.disable()
+    assert set(profile.phases) == {"step", "step/set_board"}
+    assert profile.phases["step/set_board"].calls == 2
+    step = profile.phases["step"]
+    nested = profile.phases["step/set_board"].total
+    assert abs(step.own - (step.total - nested)) < 1e-9
+
+
+def test_runner(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    path = tmp_path / "profile.json"
+    monkeypatch.setenv(profiler.ENVIRONMENT_VARIABLE, str(path))
+    monkeypatch.setattr(config, "runs", 2)
+    profile = profiler.enable()
+    try:
+        runner.main()
+    finally:
+        profiler.disable()
+
+    phases = json.loads(path.read_text())
+    assert phases == {k: vars(v) for k, v in profile.phases.items()}
+    assert phases["reset"]["calls"] == 3
+    assert phases["report"]["calls"] == 2
+    for phase in ["step", "step/heads", "step/collisions", "step/set_board"]:
+        assert phase in phases
+    decisions = [name for name in phases if name.startswith("step/heads/decide ")]
+    assert len(decisions) == len(submissions)
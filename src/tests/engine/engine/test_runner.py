@@ -0,0 +1,19 @@
+from sneks.engine.engine import runner
+
+
+def test_runs_are_reproducible_from_seed(submissions: list[str]) -> None:
+    first = runner.run(seed=7)
+    second = runner.run(seed=7)
+    assert first.steps == second.steps
+    assert [s.raw for s in first.scores] == [s.raw for s in second.scores]
+
+
+def test_run_games_matches_single_runs(submissions: list[str]) -> None:
+    seeds = [1, 2, 3, 4, 5]
+    games = runner.run_games(seeds, processes=2)
+    assert [game.seed for game in games] == seeds
+    for game in games:
+        assert sorted(s.raw.name for s in game.scores) == submissions
+        assert [s.raw for s in game.scores] == [
+            s.raw for s in runner.run(seed=game.seed).scores
+        ]
@@ -0,0 +1,89 @@
+import random
+
+from sneks.engine.core.cell import Cell
+from sneks.engine.core.direction import Direction
+from sneks.engine.engine import cells
+from sneks.engine.engine.snapshot import SELF
+from sneks.engine.engine.state import State
+from sneks.engine.interface.snek import Snek
+
+
+def test_branch_follows_game(submissions: list[str]) -> None:
+    random.seed(3)
+    state = State()
+    state.reset()
+    for _ in range(5):
+        state.step()
+
+    snapshot = state.snapshot()
+    occupied = set(state.occupied)
+    branch = snapshot.fork()
+    untouched = snapshot.fork()
+
+    while state.should_continue(30):
+        previous = {s.name: s.get_head() for s in state.active_snakes}
+        state.step()
+        movers = {s.name: s for s in state.active_snakes + state.ended_snakes}
+        directions = {
+            name: next(
+                d
+                for d in Direction
+                if cells.get_absolute_neighbor(head, d) == movers[name].get_head()
+            )
+            for name, head in previous.items()
+        }
+        branch.step(directions)
+        assert branch.get_active() == [s.name for s in state.active_snakes]
+        assert branch.heads == {s.name: s.get_head() for s in state.active_snakes}
+        assert branch.ages == {name: mover.age for name, mover in movers.items()}
+
+    # The game carrying on doesn't change the snapshot or its other branches
+    assert {c for c in state.occupied if snapshot.is_occupied(c)} == occupied
+    assert untouched.steps == 5
+    assert {c for c in state.occupied if untouched.is_occupied(c)} == occupied
+    for mover in snapshot.movers:
+        assert len(mover.get_body()) == 6
+
+
+def test_forked_branches_are_independent(submissions: list[str]) -> None:
+    random.seed(4)
+    state = State()
+    state.reset()
+    branch = state.snapshot().fork()
+    branch.step({name: Direction.UP for name in branch.get_active()})
+
+    parent_occupied = dict(branch.occupied_at)
+    left = branch.fork()
+    right = branch.fork()
+    for _ in range(2):
+        left.step({name: Direction.LEFT for name in left.get_active()})
+        right.step({name: Direction.RIGHT for name in right.get_active()})
+
+    # Children only add to their own layer, which their parent can't see
+    assert branch.occupied_at == parent_occupied
+    assert branch.steps == 1 and left.steps == right.steps == 3
+    for cell in left.occupied_at:
+        assert left.is_occupied(cell)
+        assert not branch.is_occupied(cell)
+
+
+def test_snek_forks_from_its_view() -> None:
+    snek = Snek()
+    # A wall two cells above the head
+    snek.occupied = frozenset(Cell(x, 2) for x in range(-2, 3))
+    assert snek.simulate([Direction.UP]) == 1
+    assert snek.simulate([Direction.UP] * 3) == 1
+    assert snek.simulate([Direction.LEFT] * 3 + [Direction.UP] * 3) == 6
+    # Its own trail is in the way too
+    assert snek.simulate([Direction.UP, Direction.DOWN]) == 1
+
+    branch = snek.fork()
+    branch.step({SELF: Direction.UP})
+    left, right = branch.fork(), branch.fork()
+    left.step({SELF: Direction.LEFT})
+    right.step({SELF: Direction.UP})
+    # Relative cells don't wrap around the board
+    assert left.get_active() == [SELF] and left.heads[SELF] == Cell(-1, 1)
+    assert right.get_active() == []
+    # Siblings leave the branch they were forked from alone
+    assert branch.heads[SELF] == Cell(0, 1)
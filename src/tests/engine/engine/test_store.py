@@ -0,0 +1,49 @@
+import pathlib
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import runner
+
+pytest.importorskip("numpy")
+
+from sneks.engine.engine.store import ScoreStore  # noqa: E402
+
+
+def test_store_matches_in_memory_aggregation(
+    submissions: list[str], tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "runs", 20)
+    path = str(tmp_path / "store")
+    store = ScoreStore(path)
+    assert runner.main(sink=store) is None
+    assert store.runs == 20
+    assert len(store) == 20 * len(submissions)
+
+    # Reopening continues from the stored runs
+    store = ScoreStore(path)
+    assert store.runs == 20
+    scores = runner.run(seed=3).scores
+    store.append(scores)
+
+    aggregates = {a.name: a for a in store.aggregate()}
+    assert sorted(aggregates) == submissions
+    rows = store.column("name")
+    for name, aggregate in aggregates.items():
+        assert aggregate.runs == 21
+        assert aggregate.runs == (rows == store.indices[name]).sum()
+    ages = store.column("age")
+    index = store.indices[submissions[0]]
+    assert aggregates[submissions[0]].age == pytest.approx(ages[rows == index].mean())
+
+
+def test_runner_streams_to_a_configured_store(
+    submissions: list[str], tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "runs", 4)
+    monkeypatch.setenv(runner.STORE_VARIABLE, str(tmp_path / "store"))
+    assert runner.main() is None
+
+    store = ScoreStore(str(tmp_path / "store"))
+    assert store.runs == 4
+    assert sorted(a.name for a in store.aggregate()) == submissions
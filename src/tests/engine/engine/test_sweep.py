@@ -0,0 +1,52 @@
+import os
+import pathlib
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import sweep
+
+
+def test_grid() -> None:
+    variants = sweep.get_grid(rows=[10, 20], vision_range=[5, 10, 15])
+    assert len(variants) == 6
+    assert {"rows": 20, "vision_range": 15} in variants
+    with pytest.raises(ValueError):
+        sweep.get_grid(speed=[1])
+
+
+def test_sample_is_reproducible() -> None:
+    values = dict(rows=[10, 20, 30], columns=[10, 20, 30])
+    assert sweep.get_sample(5, seed=1, **values) == sweep.get_sample(
+        5, seed=1, **values
+    )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_sweep_leaves_config_alone(
+    submissions: list[str], tmp_path: pathlib.Path, processes: int
+) -> None:
+    game = config.game
+    variants = sweep.get_grid(rows=[20, 30], columns=[30], turn_limit=[10])
+    results = sweep.run_sweep(variants, seeds=[1, 2], processes=processes)
+
+    assert config.game is game
+    assert config.turn_limit == 50
+    assert len(results) == len(variants) * 2 * len(submissions)
+    assert {(r.rows, r.columns) for r in results} == {(20, 30), (30, 30)}
+    assert all(r.steps <= 10 for r in results)
+
+    path = tmp_path / "sweep.csv"
+    sweep.write(results, str(path))
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("variant,rows,columns")
+    assert len(lines) == len(results) + 1
+
+
+def test_sweep_plays_in_forked_workers(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sweep, "play", lambda item: [os.getpid()])
+    pids = sweep.run_sweep([{"rows": 20}], seeds=[1, 2], processes=1)
+    assert len(pids) == 2
+    assert os.getpid() not in pids
@@ -0,0 +1,39 @@
+from sneks.engine.engine import runner
+from sneks.engine.engine.telemetry import Histogram
+
+
+def test_histogram_percentiles() -> None:
+    histogram = Histogram()
+    for value in range(1, 10001):
+        histogram.record(value)
+    assert histogram.count == 10000
+    assert histogram.maximum == 10000
+    for percentile in (50, 90, 99):
+        exact = 100 * percentile
+        assert exact <= histogram.get_percentile(percentile) <= exact * 1.1
+    assert histogram.get_percentile(100) == 10000
+    assert Histogram().get_percentile(50) == 0
+
+
+def test_histogram_merge() -> None:
+    first, second, both = Histogram(), Histogram(), Histogram()
+    for value in (5, 50, 500):
+        first.record(value)
+        both.record(value)
+    for value in (7, 70000):
+        second.record(value)
+        both.record(value)
+    first.merge(second)
+    assert first == both
+
+
+def test_run_telemetry(submissions: list[str]) -> None:
+    run = runner.run(seed=3)
+    telemetry = run.telemetry
+    assert telemetry is not None
+    assert telemetry.steps.count == run.steps
+    assert len(telemetry.active) == len(telemetry.ended) == run.steps
+    assert all(
+        a + e == len(submissions) for a, e in zip(telemetry.active, telemetry.ended)
+    )
+    assert telemetry.decisions.count == sum([len(submissions)] + telemetry.active[:-1])
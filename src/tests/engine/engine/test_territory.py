@@ -0,0 +1,97 @@
+import random
+from collections import deque
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.core.cell import Cell
+from sneks.engine.engine import cells
+from sneks.engine.engine.pathfinding import Window
+from sneks.engine.engine.state import State
+from sneks.engine.interface.snek import Snek
+
+
+def search(start: Cell, window: Window) -> dict[Cell, int]:
+    # The search each snek would otherwise do on its own, within its vision
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        for neighbor in (
+            cell.get_up(),
+            cell.get_down(),
+            cell.get_left(),
+            cell.get_right(),
+        ):
+            if (
+                neighbor not in distances
+                and window.in_range(neighbor.x, neighbor.y)
+                and not window.grid[window.get_index(neighbor.x, neighbor.y)]
+            ):
+                distances[neighbor] = distances[cell] + 1
+                queue.append(neighbor)
+    return distances
+
+
+def test_territory_matches_individual_searches(submissions: list[str]) -> None:
+    random.seed(2)
+    state = State()
+    state.reset()
+    for _ in range(30):
+        state.step()
+    assert len(state.active_snakes) > 1
+
+    for snake in state.active_snakes:
+        window = Window(snake.snek.occupied)
+        rivals = [
+            Cell(*window.normalize(cells.get_relative_to(s.get_head(), snake.head)))
+            for s in state.active_snakes
+            if s is not snake
+        ]
+        own = search(Cell(0, 0), window)
+        searches = [
+            search(rival, window)
+            for rival in rivals
+            if window.in_range(rival.x, rival.y)
+        ]
+        expected = sum(
+            1
+            for cell, distance in own.items()
+            if distance > 0
+            and all(distance < other.get(cell, len(window.grid)) for other in searches)
+        )
+        assert snake.snek.get_territory_size() == expected
+
+        distance = snake.snek.get_obstacle_distance()
+        if snake.snek.occupied:
+            obstacle = min(
+                Cell(*window.normalize(cell)).get_distance(Cell(0, 0))
+                for cell in snake.snek.occupied
+            )
+            # Moves can't be fewer than the straight line distance
+            assert obstacle <= distance
+
+
+def test_territory_stays_within_vision(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config.game, "vision_range", 3)
+    random.seed(2)
+    state = State()
+    state.reset()
+    for _ in range(10):
+        state.step()
+
+    for snake in state.active_snakes:
+        # Fewer cells than the 6 by 6 window, less the head
+        assert snake.snek.get_territory_size() <= 35
+        assert snake.snek.get_obstacle_distance(Cell(40, 25)) == 0
+
+
+def test_standalone_snek() -> None:
+    snek = Snek()
+    snek.occupied = frozenset({Cell(0, 3), Cell(-2, 0)})
+    assert snek.get_obstacle_distance() == 2
+    assert snek.get_obstacle_distance(Cell(0, 2)) == 1
+    vision = config.game.vision_range
+    assert snek.get_territory_size() == (2 * vision) ** 2 - 3
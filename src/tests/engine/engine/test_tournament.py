@@ -0,0 +1,59 @@
+import itertools
+import random
+
+import pytest
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.engine import tournament
+
+
+@pytest.mark.parametrize("count", [1, 7, 8, 9, 50])
+def test_groups_are_balanced(count: int) -> None:
+    names = [f"snek{i}" for i in range(count)]
+    groups = tournament.get_random_groups(names, 8, random.Random(0))
+    assert sorted(name for group in groups for name in group) == sorted(names)
+    sizes = [len(group) for group in groups]
+    assert max(sizes) <= 8
+    assert max(sizes) - min(sizes) <= 1
+
+
+@pytest.mark.parametrize("count", [9, 16, 20])
+def test_round_robin_groups_meet_everyone(count: int) -> None:
+    names = sorted(f"snek{i}" for i in range(count))
+    met: set[frozenset[str]] = set()
+    # Blocks of two, padded to an even number, take one round less to cycle
+    blocks = -(-count // 2)
+    for number in range(blocks + blocks % 2 - 1):
+        groups = tournament.get_round_robin_groups(names, 4, number)
+        assert sorted(name for group in groups for name in group) == names
+        assert max(len(group) for group in groups) <= 4
+        for group in groups:
+            met.update(frozenset(pair) for pair in itertools.combinations(group, 2))
+    assert met == {frozenset(pair) for pair in itertools.combinations(names, 2)}
+
+
+@pytest.mark.parametrize("grouping", tournament.GROUPINGS)
+def test_tournament_plays_everyone_each_round(
+    submissions: list[str], grouping: str
+) -> None:
+    standings = tournament.run_tournament(
+        rounds=3, group_size=2, grouping=grouping, seed=0, processes=2
+    )
+    assert sorted(s.name for s in standings) == submissions
+    assert all(s.games == 3 for s in standings)
+    totals = [s.total() for s in standings]
+    assert totals == sorted(totals, reverse=True)
+    assert standings == tournament.run_tournament(
+        rounds=3, group_size=2, grouping=grouping, seed=0, processes=2
+    )
+
+
+def test_standings_are_kept_per_submission(
+    submissions: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "registrar_submission_sneks", 2)
+    standings = tournament.run_tournament(
+        rounds=2, group_size=2, grouping=tournament.SWISS, seed=0, processes=2
+    )
+    assert sorted(s.name for s in standings) == submissions
+    assert all(s.games == 2 for s in standings)
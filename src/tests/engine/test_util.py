@@ -0,0 +1,12 @@
+from sneks.engine.util import format_table
+
+
+def test_format_table() -> None:
+    header = ["name", "count"]
+    rows = [["a", "10"], ["longer", "2"]]
+    assert format_table(header, rows) == "\n".join(
+        ["  name  count", "     a     10", "longer      2"]
+    )
+    assert format_table(header, rows, labelled=True) == "\n".join(
+        ["name    count", "a          10", "longer      2"]
+    )
@@ -0,0 +1,27 @@
+import pathlib
+
+from sneks.engine.config.instantiation import config
+from sneks.engine.validator import main
+
+SUBMISSION = """
+from sneks.engine.core.direction import Direction
+from sneks.engine.interface.snek import Snek
+
+
+class CustomSnek(Snek):
+    def get_next_direction(self) -> Direction:
+        return Direction.UP
+"""
+
+
+def test_validates_twice_in_one_process(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "user" / "submission.py"
+    path.parent.mkdir()
+    path.write_text(SUBMISSION)
+    registrar_submission_sneks = config.registrar_submission_sneks
+
+    # Like a warm lambda, where the tests of the first validation used to
+    # leave the config changed for the second
+    assert main.main(test_path=str(tmp_path)) == 0
+    assert config.registrar_submission_sneks == registrar_submission_sneks
+    assert main.main(test_path=str(tmp_path)) == 0
@@ -28,6 +28,7 @@ def build_docs():
             sneks_path,
             # exclude the following
             f"{sneks_path}/backend",
+            f"{sneks_path}/engine/benchmark",
             f"{sneks_path}/engine/config",
             f"{sneks_path}/engine/engine",
             f"{sneks_path}/engine/gui",
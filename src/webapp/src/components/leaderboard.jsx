@@ -50,6 +50,12 @@ export default function Leaderboard({ scores, colors, timestamp }) {
     });
   }
   definitions.push(
+    {
+      id: "rating",
+      header: "Rating",
+      cell: (e) => (e.rating === undefined ? "" : Math.round(e.rating)),
+      sortingField: "rating",
+    },
     {
       id: "age",
       header: "Age",